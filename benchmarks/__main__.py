@@ -0,0 +1,233 @@
+"""
+Run the benchmark suite and store the results as JSON.
+
+The benchmarks in this package follow the conventions used by `asv
+<https://asv.readthedocs.io>`_, so they can also be run with ``asv run``. This
+runner only needs the standard library, so it also works offline::
+
+    $ python -m benchmarks --output results.json
+    $ python -m benchmarks --bench InterfaceCreation --compare results.json
+
+The following subset of asv's conventions is supported:
+
+- Benchmarks are methods of classes defined in ``bench_*`` modules whose names
+  start with ``time_``.
+- ``params`` and ``param_names`` parameterize a benchmark. If there's more than
+  one parameter name, ``params`` is a list of lists, and every combination is
+  run.
+- ``setup`` and ``teardown`` are called before and after each parameter
+  combination is timed. When ``number = 1``, they're called around every
+  sample instead, so that each sample can start from a clean slate.
+- ``number`` is the number of calls per sample. The default, ``0``, picks a
+  number of calls that takes at least ``MIN_SAMPLE_TIME`` seconds.
+- ``repeat`` is the number of samples to take.
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import time
+import timeit
+
+FORMAT_VERSION = 1
+DEFAULT_REPEAT = 5
+MIN_SAMPLE_TIME = 0.05
+
+timer = getattr(time, "perf_counter", timeit.default_timer)
+
+
+def discover(pattern=None):
+    """
+    Find benchmarks in this package.
+
+    Yields
+    ------
+    name, cls, method_name : str, type, str
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for _, modname, _ in sorted(pkgutil.iter_modules([package_dir])):
+        if not modname.startswith("bench_"):
+            continue
+
+        module = importlib.import_module("{}.{}".format(__package__, modname))
+        for clsname, cls in sorted(vars(module).items()):
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+
+            for method_name in sorted(dir(cls)):
+                if not method_name.startswith("time_"):
+                    continue
+
+                name = "{}.{}.{}".format(modname, clsname, method_name)
+                if pattern is None or re.search(pattern, name):
+                    yield name, cls, method_name
+
+
+def parameter_combinations(cls):
+    params = getattr(cls, "params", None)
+    if params is None:
+        return [()]
+    if len(getattr(cls, "param_names", ())) > 1:
+        return list(itertools.product(*params))
+    return [(p,) for p in params]
+
+
+def _noop(*args):
+    pass
+
+
+def _time_calls(f, args, number):
+    start = timer()
+    for _ in range(number):
+        f(*args)
+    return timer() - start
+
+
+def calibrate(f, args):
+    """Find a number of calls to ``f(*args)`` that takes a measurable time."""
+    number = 1
+    while _time_calls(f, args, number) < MIN_SAMPLE_TIME:
+        number *= 2
+    return number
+
+
+def run_benchmark(cls, method_name, args):
+    """
+    Time a single benchmark for a single combination of parameters.
+
+    Returns
+    -------
+    result : dict
+        JSON-serializable description of the timings, in seconds per call.
+    """
+    instance = cls()
+    f = getattr(instance, method_name)
+    setup = getattr(instance, "setup", _noop)
+    teardown = getattr(instance, "teardown", _noop)
+    repeat = getattr(cls, "repeat", DEFAULT_REPEAT)
+    number = getattr(cls, "number", 0)
+
+    samples = []
+    if number == 1:
+        for _ in range(repeat):
+            setup(*args)
+            samples.append(_time_calls(f, args, 1))
+            teardown(*args)
+    else:
+        setup(*args)
+        number = number or calibrate(f, args)
+        for _ in range(repeat):
+            samples.append(_time_calls(f, args, number) / number)
+        teardown(*args)
+
+    samples.sort()
+    return {
+        "params": [_jsonable(arg) for arg in args],
+        "number": number,
+        "samples": samples,
+        "min": samples[0],
+        "median": samples[len(samples) // 2],
+    }
+
+
+def _jsonable(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def _git_commit():
+    try:
+        output = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.STDOUT,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode("ascii").strip()
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return "{:.3f}{}".format(seconds / scale, unit)
+    return "{:.1f}ns".format(seconds / 1e-9)
+
+
+def _key(name, result):
+    return name, tuple(result["params"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "-b",
+        "--bench",
+        default=None,
+        help="Only run benchmarks whose names match this regular expression.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Path at which to write results as JSON.",
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        default=None,
+        help="Path to previous results to compare against.",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            for name, results in json.load(f)["benchmarks"].items():
+                for result in results:
+                    baseline[_key(name, result)] = result
+
+    benchmarks = {}
+    for name, cls, method_name in discover(args.bench):
+        results = benchmarks[name] = []
+        for params in parameter_combinations(cls):
+            result = run_benchmark(cls, method_name, params)
+            results.append(result)
+
+            line = "{}({}): min={} median={}".format(
+                name,
+                ", ".join(map(repr, params)),
+                format_time(result["min"]),
+                format_time(result["median"]),
+            )
+            previous = baseline.get(_key(name, result))
+            if previous is not None:
+                line += " ({:.2f}x baseline)".format(
+                    result["median"] / previous["median"]
+                )
+            print(line)
+            sys.stdout.flush()
+
+    if args.output is not None:
+        document = {
+            "format_version": FORMAT_VERSION,
+            "timestamp": time.time(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "benchmarks": benchmarks,
+        }
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
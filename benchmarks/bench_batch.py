@@ -0,0 +1,21 @@
+"""
+Benchmarks for :func:`interface.verify_many`.
+"""
+from interface import Interface, verify_many
+from interface.interface import InterfaceMeta
+
+from .common import make_methods, refresh
+
+
+class VerifyMany(object):
+    def setup(self):
+        methods = make_methods(10)
+        self.iface = InterfaceMeta("I", (Interface,), dict(methods))
+        self.pairs = [
+            (self.iface, type("C{}".format(i), (object,), refresh(methods)))
+            for i in range(500)
+        ]
+
+    def time_verify_many(self):
+        self.iface._verification_cache.clear()
+        verify_many(self.pairs)
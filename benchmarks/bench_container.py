@@ -0,0 +1,53 @@
+"""
+Benchmarks for resolving interfaces with :class:`interface.container.Container`.
+
+``time_construct`` calls the same constructors by hand, which is the floor for
+``time_resolve``::
+
+    $ python -m benchmarks --bench Resolve
+"""
+from interface import implements
+from interface.container import Container
+from interface.interface import InterfaceMeta, Interface
+
+
+class Resolve(object):
+    params = [["transient", "singleton"], [0, 1, 5]]
+    param_names = ["lifetime", "ndependencies"]
+
+    def setup(self, lifetime, ndependencies):
+        container = Container()
+        dependencies = {}
+        for i in range(ndependencies):
+            iface = InterfaceMeta("D{}".format(i), (Interface,), {})
+            base = implements(iface)
+            impl = type(base)("D{}Impl".format(i), (base,), {})
+            container.register(iface, impl)
+            dependencies["d{}".format(i)] = iface
+
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+        self.iface = InterfaceMeta("I", (Interface,), {})
+        base = implements(self.iface)
+        impl = type(base)("Impl", (base,), {"__init__": __init__})
+        container.register(
+            self.iface,
+            impl,
+            singleton=lifetime == "singleton",
+            dependencies=dependencies,
+        )
+        container.freeze()
+        self.container = container
+
+        self.impl = impl
+        self.dependency_impls = {
+            name: type(container.resolve(iface))
+            for name, iface in dependencies.items()
+        }
+
+    def time_resolve(self, lifetime, ndependencies):
+        self.container.resolve(self.iface)
+
+    def time_construct(self, lifetime, ndependencies):
+        self.impl(**{name: impl() for name, impl in self.dependency_impls.items()})
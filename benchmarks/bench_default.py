@@ -0,0 +1,102 @@
+"""
+Benchmarks for the bytecode analysis run on default implementations.
+
+``time_reference_scan`` finds attribute accesses with ``dis.get_instructions``,
+which is what ``accessed_attributes_of_local`` did before it walked
+``co_code`` directly. Compare the two with::
+
+    $ python -m benchmarks --bench AccessedAttributes
+"""
+import dis
+
+from interface.default import (
+    _scan_accessed_attributes,
+    accessed_attributes_of_local,
+    warn_if_defaults_use_non_interface_members,
+)
+from interface.functional import sliding_window
+from interface.interface import default, Interface, InterfaceMeta
+
+from .common import fresh, make_function
+
+
+def reference_scan(f, local_name):
+    """Find attributes of ``local_name`` used by ``f`` with ``dis``."""
+    used = set()
+    for first, second in sliding_window(dis.get_instructions(f), 2):
+        if first.opname == "LOAD_FAST" and first.argval == local_name:
+            if second.opname in ("LOAD_ATTR", "LOAD_METHOD", "STORE_ATTR"):
+                used.add(second.argval)
+    return used
+
+
+def make_default_body(nattributes):
+    """
+    Make the source for a method body that uses ``nattributes`` attributes of
+    ``self``.
+    """
+    return "\n    ".join(
+        "self.attr{0}(self.other{0})".format(i) for i in range(nattributes)
+    )
+
+
+class AccessedAttributes(object):
+    # Each attribute use is about four instructions.
+    params = [10, 100, 1000, 5000]
+    param_names = ["nattributes"]
+
+    def setup(self, nattributes):
+        self.f = make_function(0, body=make_default_body(nattributes))
+
+    def time_accessed_attributes_of_local(self, nattributes):
+        accessed_attributes_of_local(self.f, "self")
+
+    def time_scan_accessed_attributes(self, nattributes):
+        _scan_accessed_attributes(self.f.__code__, frozenset(["self"]))
+
+    def time_reference_scan(self, nattributes):
+        reference_scan(self.f, "self")
+
+
+class WarnIfDefaultsUseNonInterfaceMembers(object):
+    params = [1, 10, 100]
+    param_names = ["ndefaults"]
+    number = 1
+    repeat = 20
+
+    def setup(self, ndefaults):
+        template = make_function(0, body=make_default_body(10))
+        self.defaults = {
+            "default{}".format(i): default(fresh(template)) for i in range(ndefaults)
+        }
+        self.members = {"attr{}".format(i) for i in range(10)} | set(self.defaults)
+        self.members |= {"other{}".format(i) for i in range(10)}
+
+    def time_warn_if_defaults_use_non_interface_members(self, ndefaults):
+        warn_if_defaults_use_non_interface_members("I", self.defaults, self.members)
+
+
+class SubinterfaceDefaults(object):
+    """
+    Define a chain of subinterfaces of an interface with many defaults.
+    """
+
+    params = [10, 100]
+    param_names = ["ndefaults"]
+    number = 1
+    repeat = 20
+
+    def setup(self, ndefaults):
+        template = make_function(0, body=make_default_body(10))
+        methods = {"attr{}".format(i): fresh(template) for i in range(10)}
+        methods.update(("other{}".format(i), fresh(template)) for i in range(10))
+        methods.update(
+            ("default{}".format(i), default(fresh(template)))
+            for i in range(ndefaults)
+        )
+        self.base = InterfaceMeta("Base", (Interface,), methods)
+
+    def time_subinterface_chain(self, ndefaults):
+        iface = self.base
+        for _ in range(10):
+            iface = InterfaceMeta("Sub", (iface,), {})
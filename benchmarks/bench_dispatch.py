@@ -0,0 +1,56 @@
+"""
+Benchmarks for :func:`interface.dispatch`.
+
+``time_resolve`` measures handler resolution without the per-class cache, and
+``time_singledispatch`` measures :func:`functools.singledispatch` on the
+equivalent class hierarchy::
+
+    $ python -m benchmarks --bench Dispatch
+"""
+from functools import singledispatch
+
+from interface import dispatch, implements
+from interface.interface import InterfaceMeta, Interface
+
+
+class Dispatch(object):
+    params = [1, 10, 50]
+    param_names = ["ninterfaces"]
+
+    def setup(self, ninterfaces):
+        interfaces = [
+            InterfaceMeta("I{}".format(i), (Interface,), {})
+            for i in range(ninterfaces)
+        ]
+        base = implements(*interfaces)
+        cls = type(base)("C", (base,), {})
+        self.instance = cls()
+
+        @dispatch
+        def f(obj):
+            pass
+
+        # Register a handler for one of the interfaces, so that resolution has
+        # to look through all of them.
+        f.register(interfaces[-1], lambda obj: None)
+        self.f = f
+
+        bases = [type("B{}".format(i), (object,), {}) for i in range(ninterfaces)]
+        plain = type("C", tuple(bases), {})
+        self.plain = plain()
+
+        @singledispatch
+        def g(obj):
+            pass
+
+        g.register(bases[-1], lambda obj: None)
+        self.g = g
+
+    def time_dispatch(self, ninterfaces):
+        self.f(self.instance)
+
+    def time_resolve(self, ninterfaces):
+        self.f._resolve(type(self.instance))
+
+    def time_singledispatch(self, ninterfaces):
+        self.g(self.plain)
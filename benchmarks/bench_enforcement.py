@@ -0,0 +1,48 @@
+"""
+Benchmarks for calls to implementations with runtime type enforcement.
+
+Compare the cost of calling an enforced or sampled method against calling the
+original::
+
+    $ python -m benchmarks --bench Enforcement
+"""
+from interface import implements, Interface
+from interface.interface import InterfaceMeta
+from interface.enforcement import make_enforcer
+from interface.typed_signature import TypedSignature
+
+
+def method(self, a, b, c=None):
+    return a
+
+
+method.__annotations__ = {"a": int, "b": str, "c": float}
+
+
+class Enforcement(object):
+    params = ["disabled", "enforced", "sampled"]
+    param_names = ["mode"]
+
+    def setup(self, mode):
+        iface = InterfaceMeta(
+            "I",
+            (Interface,),
+            {
+                "method": method,
+                "_INTERFACE_ENFORCE_TYPES": mode == "enforced",
+                "_INTERFACE_SAMPLE_CONTRACTS": 100 if mode == "sampled" else 0,
+            },
+        )
+        base = implements(iface)
+        self.instance = type(base)("C", (base,), {"method": method})()
+
+    def time_call(self, mode):
+        self.instance.method(1, "b")
+
+
+class MakeEnforcer(object):
+    def setup(self):
+        self.signature = TypedSignature(method).signature
+
+    def time_make_enforcer(self):
+        make_enforcer(method, self.signature, "C.method")
@@ -0,0 +1,238 @@
+"""
+Benchmarks for the import-time cost of defining and implementing interfaces.
+
+Benchmarks with ``number = 1`` copy every function they use in ``setup``, so
+that each sample measures a cold start rather than cache hits.
+"""
+from weakref import WeakKeyDictionary
+
+from interface import (
+    implements,
+    Interface,
+    InvalidImplementation,
+    predicates,
+    provides,
+)
+from interface.interface import InterfaceMeta
+from interface.utils import unique
+
+from .common import make_methods, refresh
+
+
+class InterfaceCreation(object):
+    params = [1, 10, 100, 1000]
+    param_names = ["nmembers"]
+    number = 1
+    repeat = 20
+
+    def setup(self, nmembers):
+        self.methods = make_methods(nmembers)
+
+    def time_interface_creation(self, nmembers):
+        InterfaceMeta("I", (Interface,), self.methods)
+
+
+class Implements(object):
+    params = [1, 10, 50]
+    param_names = ["ninterfaces"]
+    number = 1
+    repeat = 20
+
+    def setup(self, ninterfaces):
+        self.methods = {}
+        interfaces = []
+        for i in range(ninterfaces):
+            methods = make_methods(5, prefix="i{}_method".format(i))
+            interfaces.append(
+                InterfaceMeta("I{}".format(i), (Interface,), dict(methods))
+            )
+            self.methods.update(refresh(methods))
+        self.base = implements(*interfaces)
+
+    def time_implement_interfaces(self, ninterfaces):
+        type(self.base)("C", (self.base,), self.methods)
+
+
+class ImplementsMemo(object):
+    params = [1, 10, 50]
+    param_names = ["ninterfaces"]
+
+    def setup(self, ninterfaces):
+        self.interfaces = [
+            InterfaceMeta("I{}".format(i), (Interface,), {})
+            for i in range(ninterfaces)
+        ]
+        base = implements(*self.interfaces)
+
+        # The memo ``implements`` used to use.
+        self.reference_memo = WeakKeyDictionary()
+        self.reference_memo[base._interfaces] = base
+
+    def time_implements_memo_hit(self, ninterfaces):
+        implements(*self.interfaces)
+
+    def time_implements_memo_hit_explicit_verify(self, ninterfaces):
+        implements(*self.interfaces, verify="eager")
+
+    def time_reference_memo_hit(self, ninterfaces):
+        self.reference_memo[frozenset(self.interfaces)]
+
+
+class ClassFactory(object):
+    """
+    A class factory that calls ``implements`` for every class it creates.
+    """
+
+    params = [1, 10]
+    param_names = ["ninterfaces"]
+
+    def setup(self, ninterfaces):
+        self.interfaces = [
+            InterfaceMeta("I{}".format(i), (Interface,), {})
+            for i in range(ninterfaces)
+        ]
+
+    def time_class_factory(self, ninterfaces):
+        interfaces = self.interfaces
+        for _ in range(100):
+            base = implements(*interfaces, verify="eager")
+            type(base)("C", (base,), {})
+
+
+class SubclassChain(object):
+    params = [100]
+    param_names = ["depth"]
+    number = 1
+    repeat = 20
+
+    def setup(self, depth):
+        methods = make_methods(10)
+        iface = InterfaceMeta("I", (Interface,), dict(methods))
+        base = implements(iface)
+        self.base = type(base)("C", (base,), refresh(methods))
+
+    def time_subclass_chain(self, depth):
+        cls = self.base
+        meta = type(cls)
+        for _ in range(depth):
+            cls = meta("C", (cls,), {})
+
+
+class FromClass(object):
+    """
+    Build interfaces from a subclass of a class with many attributes, half of
+    which are methods.
+    """
+
+    params = [[10, 100, 1000, 5000], ["all", "predicate"]]
+    param_names = ["nattributes", "variant"]
+    number = 1
+    repeat = 20
+
+    def setup(self, nattributes, variant):
+        nmethods = max(nattributes // 2, 1)
+        clsdict = make_methods(nmethods)
+        if variant != "all":
+            # The default selection fails on non-callable attributes.
+            clsdict.update(
+                ("column{}".format(i), i) for i in range(nattributes - nmethods)
+            )
+        base = type("Base", (object,), clsdict)
+        self.cls = type("Large", (base,), make_methods(10, prefix="own"))
+
+    def time_from_class(self, nattributes, variant):
+        if variant == "all":
+            Interface.from_class(self.cls)
+        else:
+            Interface.from_class(self.cls, predicate=predicates.public_callables)
+
+
+class Interfaces(object):
+    params = [1, 10, 50]
+    param_names = ["depth"]
+
+    def setup(self, depth):
+        self.interfaces = [
+            InterfaceMeta("I{}".format(i), (Interface,), {}) for i in range(5)
+        ]
+        base = implements(*self.interfaces)
+        cls = type(base)("C", (base,), {})
+        for _ in range(depth - 1):
+            cls = type(cls)("C", (cls,), {})
+        self.cls = cls
+        self.instance = cls()
+
+    def time_interfaces(self, depth):
+        tuple(self.cls.interfaces())
+
+    def time_reference_interfaces(self, depth):
+        # What ``interfaces()`` did before its result was cached.
+        tuple(unique(self.cls._interfaces_with_duplicates()))
+
+    def time_provides(self, depth):
+        provides(self.instance, self.interfaces[-1])
+
+    def time_reference_provides(self, depth):
+        self.interfaces[-1] in tuple(unique(self.cls._interfaces_with_duplicates()))
+
+
+class Verify(object):
+    params = [[10, 100, 1000], ["conforming", "nonconforming"]]
+    param_names = ["nmembers", "kind"]
+
+    def setup(self, nmembers, kind):
+        methods = make_methods(nmembers)
+        self.iface = InterfaceMeta("I", (Interface,), dict(methods))
+
+        methods = refresh(methods)
+        if kind == "nonconforming":
+            # Break every member, so that diagnostics have plenty to report.
+            methods = refresh(make_methods(nmembers, nargs=3))
+        self.cls = type("C", (object,), methods)
+
+    def time_verify(self, nmembers, kind):
+        self.iface._verification_cache.clear()
+        try:
+            self.iface.verify(self.cls)
+        except InvalidImplementation:
+            pass
+
+    def time_conforms(self, nmembers, kind):
+        self.iface._conformance_cache.clear()
+        self.iface.conforms(self.cls)
+
+    def time_diff_signatures(self, nmembers, kind):
+        # The full diagnostic pass, which used to run on every verification.
+        self.iface._diff_signatures(self.cls)
+
+
+class Adapt(object):
+    params = ["generated", "handwritten"]
+    param_names = ["adapter"]
+
+    def setup(self, adapter):
+        methods = make_methods(10, nargs=1)
+        iface = InterfaceMeta("I", (Interface,), dict(methods))
+        obj = type("Target", (object,), refresh(methods))()
+
+        if adapter == "generated":
+            self.adapt = iface.adapt
+        else:
+
+            class Handwritten(object):
+                def __init__(self, adaptee):
+                    self._adaptee = adaptee
+
+                def method0(self, a0):
+                    return self._adaptee.method0(a0)
+
+            self.adapt = Handwritten
+
+        self.obj = obj
+        self.adapted = self.adapt(obj)
+
+    def time_adapt(self, adapter):
+        self.adapt(self.obj)
+
+    def time_call(self, adapter):
+        self.adapted.method0(1)
@@ -0,0 +1,77 @@
+"""
+Benchmarks for :func:`interface.typecheck.compatible`.
+
+``time_reference_compatible`` walks ``inspect.Parameter`` objects directly,
+which is what ``compatible`` did before signatures were precompiled into
+acceptance plans. Compare the two with::
+
+    $ python -m benchmarks --bench Compatible
+
+``VariantAnnotations`` measures the cost of annotations that differ between
+an implementation and its interface, with and without the subtype oracle's
+cache::
+
+    $ python -m benchmarks --bench VariantAnnotations
+"""
+import typing
+
+from interface.subtypes import subtype_oracle
+from interface.tests._py3_typecheck_tests import reference_compatible
+from interface.typecheck import compatible
+from interface.typed_signature import TypedSignature
+
+from .common import make_function
+
+
+class Compatible(object):
+    params = [1, 10, 50]
+    param_names = ["nargs"]
+
+    def setup(self, nargs):
+        self.impl = TypedSignature(make_function(nargs, extra=2))
+        self.iface = TypedSignature(make_function(nargs))
+
+    def time_compatible(self, nargs):
+        compatible(self.impl, self.iface)
+
+    def time_reference_compatible(self, nargs):
+        reference_compatible(self.impl, self.iface)
+
+
+class VariantAnnotations(object):
+    params = ["equal", "cached", "uncached"]
+    param_names = ["mode"]
+
+    def setup(self, mode):
+        iface = make_function(10)
+        impl = make_function(10)
+        iface_annotations = [
+            bool,
+            typing.Optional[int],
+            typing.List[int],
+            typing.Callable[[object], bool],
+            typing.Mapping[str, bool],
+        ] * 2
+        if mode == "equal":
+            impl_annotations = iface_annotations
+        else:
+            impl_annotations = [
+                int,
+                typing.Union[int, str, None],
+                typing.Sequence[int],
+                typing.Callable[[int], int],
+                typing.Mapping[str, object],
+            ] * 2
+        iface.__annotations__ = dict(zip(iface.__code__.co_varnames, iface_annotations))
+        impl.__annotations__ = dict(zip(impl.__code__.co_varnames, impl_annotations))
+        self.iface = TypedSignature(iface)
+        self.impl = TypedSignature(impl)
+        self.enabled = subtype_oracle.enabled
+        subtype_oracle.enabled = mode != "uncached"
+        assert compatible(self.impl, self.iface)
+
+    def teardown(self, mode):
+        subtype_oracle.enabled = self.enabled
+
+    def time_compatible(self, mode):
+        compatible(self.impl, self.iface)
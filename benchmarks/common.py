@@ -0,0 +1,41 @@
+"""
+Helpers for generating the functions and classes used in benchmarks.
+"""
+from types import FunctionType
+
+
+def make_function(nargs, extra=0, name="f", body="pass"):
+    """
+    Make a function taking ``self``, ``nargs`` required arguments, and
+    ``extra`` optional arguments.
+    """
+    args = ["self"]
+    args.extend("a{}".format(i) for i in range(nargs))
+    args.extend("b{}=None".format(i) for i in range(extra))
+    namespace = {}
+    exec("def {}({}):\n    {}".format(name, ", ".join(args), body), namespace)
+    return namespace[name]
+
+
+def fresh(f):
+    """
+    Copy a function.
+
+    The copy shares ``f``'s code, but is a new object, so it won't hit any
+    caches keyed on ``f``.
+    """
+    return FunctionType(f.__code__, f.__globals__, f.__name__, f.__defaults__)
+
+
+def make_methods(nmethods, nargs=2, prefix="method"):
+    """
+    Make a dict of ``nmethods`` functions taking ``self`` and ``nargs`` other
+    arguments.
+    """
+    template = make_function(nargs)
+    return {"{}{}".format(prefix, i): fresh(template) for i in range(nmethods)}
+
+
+def refresh(methods):
+    """Copy every function in a dict made by ``make_methods``."""
+    return {name: fresh(f) for name, f in methods.items()}
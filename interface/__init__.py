@@ -1,9 +1,21 @@
+from .batch import verify_many
 from .default import default
-from .interface import implements, Interface, InvalidImplementation
+from .dispatch import dispatch
+from .interface import (
+    implements,
+    Interface,
+    InvalidImplementation,
+    provides,
+    verify_pending,
+)
 
 __all__ = [
     "default",
+    "dispatch",
     "InvalidImplementation",
     "Interface",
     "implements",
+    "provides",
+    "verify_many",
+    "verify_pending",
 ]
@@ -0,0 +1,69 @@
+"""
+Verification of many implementations at once.
+"""
+from collections import namedtuple
+
+
+class VerificationResult(
+    namedtuple("VerificationResult", ["interface", "implementation", "defaults", "error"])
+):
+    """
+    The result of verifying that ``implementation`` implements ``interface``.
+
+    Attributes
+    ----------
+    interface : InterfaceMeta
+        The interface that was checked.
+    implementation : type
+        The type that was checked.
+    defaults : dict[str -> callable] or None
+        Default implementations that ``implementation`` would receive, or None
+        if verification failed.
+    error : Exception or None
+        The error that verification raised, or None if it succeeded.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _verify_one(pair):
+    iface, type_ = pair
+    try:
+        defaults = iface.verify(type_)
+    except (TypeError, ValueError) as e:
+        # InvalidImplementation is a TypeError. Plain TypeErrors and
+        # ValueErrors come from members we couldn't get a signature for.
+        return VerificationResult(iface, type_, None, e)
+    return VerificationResult(iface, type_, defaults, None)
+
+
+def verify_many(pairs):
+    """
+    Verify many (interface, implementation) pairs.
+
+    Unlike :meth:`~interface.interface.InterfaceMeta.verify`, failures are
+    reported in the result rather than raised, and default implementations
+    aren't injected into the checked types.
+
+    Parameters
+    ----------
+    pairs : iterable[(InterfaceMeta, type)]
+        Pairs of interfaces and the types that should implement them.
+
+    Returns
+    -------
+    results : list[VerificationResult]
+        One result per pair, in the same order as ``pairs``.
+
+    Notes
+    -----
+    Pairs are verified serially, in the calling thread. Verification holds
+    the GIL throughout, so threads don't speed it up, and most of its cost is
+    inspecting the implementations, which would have to happen in this process
+    before anything could be sent to a process pool.
+    """
+    return list(map(_verify_one, pairs))
@@ -0,0 +1,342 @@
+"""
+A dependency-injection container for interfaces.
+
+Implementations (or factories) are registered for interfaces, and the
+container builds them on request, passing each one implementations of the
+interfaces it depends on:
+
+.. code-block:: python
+
+    container = Container()
+    container.register(Database, PostgresDatabase, singleton=True)
+    container.register(UserStore, SQLUserStore)  # SQLUserStore needs a Database.
+    container.freeze()
+
+    store = container.resolve(UserStore)
+
+Dependencies are read from annotations on constructor parameters (any
+parameter annotated with an interface is injected by keyword), or can be
+passed explicitly to :meth:`Container.register`.
+
+All the work of wiring the container together happens in
+:meth:`Container.freeze`: signatures are inspected, interfaces are matched to
+providers, and dependency cycles are detected. Resolving an interface
+afterwards is a dict lookup plus a constructor call.
+"""
+from threading import Lock
+
+from .compat import Parameter, signature
+from .interface import Interface, InterfaceMeta
+
+
+class ResolutionError(LookupError):
+    """
+    Raised when an interface can't be resolved by a container.
+    """
+
+
+class CyclicDependency(ResolutionError):
+    """
+    Raised when providers registered with a container depend on each other.
+    """
+
+
+def _check_interface(iface):
+    if not isinstance(iface, InterfaceMeta) or iface is Interface:
+        raise TypeError("Expected a subclass of Interface, but got {!r}.".format(iface))
+
+
+def _name(obj):
+    return getattr(obj, "__name__", repr(obj))
+
+
+class _Provider(object):
+    """
+    A registration with a container.
+
+    Attributes
+    ----------
+    iface : InterfaceMeta
+        The interface the provider was registered for.
+    factory : callable or None
+        Callable that builds implementations, or None for instances.
+    instance : object
+        The registered instance, if ``factory`` is None.
+    singleton : bool
+        Whether ``factory`` should only be called once.
+    dependencies : dict[str -> InterfaceMeta] or None
+        Explicit dependencies, or None to read them from annotations.
+    """
+
+    __slots__ = ("iface", "factory", "instance", "singleton", "dependencies")
+
+    def __init__(self, iface, factory, instance, singleton, dependencies):
+        self.iface = iface
+        self.factory = factory
+        self.instance = instance
+        self.singleton = singleton
+        self.dependencies = dependencies
+
+    def wiring(self):
+        """
+        Get the interfaces that our factory needs, keyed by parameter name.
+        """
+        if self.factory is None:
+            return {}
+        if self.dependencies is not None:
+            return dict(self.dependencies)
+
+        try:
+            params = signature(self.factory).parameters.values()
+        except (TypeError, ValueError):
+            # Not something we can inspect, so assume it takes no arguments.
+            return {}
+
+        wiring = {}
+        for param in params:
+            if isinstance(param.annotation, InterfaceMeta):
+                if param.kind == Parameter.POSITIONAL_ONLY:
+                    raise ResolutionError(
+                        "Can't inject {iface} into positional-only parameter "
+                        "{param!r} of {factory}.".format(
+                            iface=_name(param.annotation),
+                            param=param.name,
+                            factory=_name(self.factory),
+                        )
+                    )
+                wiring[param.name] = param.annotation
+        return wiring
+
+
+class Container(object):
+    """
+    A dependency-injection container for interfaces.
+
+    Notes
+    -----
+    Containers are frozen by :meth:`freeze`, or by the first call to
+    :meth:`resolve`. Frozen containers don't accept new registrations.
+    """
+
+    def __init__(self):
+        self._providers = {}
+        self._resolvers = None
+        self._lock = Lock()
+
+    @property
+    def frozen(self):
+        """Whether the container has been frozen."""
+        return self._resolvers is not None
+
+    def register(self, iface, provider, singleton=False, dependencies=None):
+        """
+        Register ``provider`` as the source of implementations of ``iface``.
+
+        Parameters
+        ----------
+        iface : InterfaceMeta
+            The interface to register.
+        provider : type or callable
+            A class that implements ``iface``, or a factory function that
+            returns implementations of ``iface``.
+        singleton : bool, optional
+            If True, ``provider`` is only called once, and its result is
+            returned every time ``iface`` is resolved. Default is False, which
+            calls ``provider`` on every resolution.
+        dependencies : dict[str -> InterfaceMeta], optional
+            Interfaces to resolve and pass to ``provider`` as keyword
+            arguments. Default is to inject every parameter of ``provider``
+            that's annotated with an interface.
+        """
+        _check_interface(iface)
+        if isinstance(provider, type) and not issubclass(provider, iface):
+            raise TypeError(
+                "{provider} doesn't implement {iface}.".format(
+                    provider=_name(provider), iface=_name(iface)
+                )
+            )
+        if not callable(provider):
+            raise TypeError("Expected a callable, but got {!r}.".format(provider))
+        for dependency in (dependencies or {}).values():
+            _check_interface(dependency)
+
+        self._add(
+            _Provider(
+                iface,
+                provider,
+                None,
+                singleton,
+                None if dependencies is None else dict(dependencies),
+            )
+        )
+
+    def register_instance(self, iface, instance):
+        """
+        Register an existing implementation of ``iface``.
+
+        ``instance`` is returned every time ``iface`` is resolved.
+        """
+        _check_interface(iface)
+        if not isinstance(instance, iface):
+            raise TypeError(
+                "{instance!r} doesn't implement {iface}.".format(
+                    instance=instance, iface=_name(iface)
+                )
+            )
+        self._add(_Provider(iface, None, instance, True, None))
+
+    def _add(self, provider):
+        with self._lock:
+            if self.frozen:
+                raise RuntimeError("Can't register providers with a frozen container.")
+            self._providers[provider.iface] = provider
+
+    def freeze(self):
+        """
+        Wire together all registered providers.
+
+        After freezing, each interface maps directly to a function that builds
+        its implementation.
+
+        Parent interfaces of registered interfaces can also be resolved, as
+        long as exactly one registered interface is a subclass of the parent.
+
+        Raises
+        ------
+        ResolutionError
+            If a provider depends on an interface that can't be resolved.
+        CyclicDependency
+            If providers depend on each other.
+        """
+        with self._lock:
+            if self.frozen:
+                return
+
+            providers = dict(self._providers)
+            # Map parent interfaces to the registered interfaces that provide
+            # them, so that resolving them doesn't require walking MROs.
+            inherited = {}
+            for iface in self._providers:
+                for parent in iface.__mro__[1:]:
+                    if (
+                        isinstance(parent, InterfaceMeta)
+                        and parent is not Interface
+                        and parent not in self._providers
+                    ):
+                        inherited.setdefault(parent, []).append(iface)
+            for parent, ifaces in inherited.items():
+                if len(ifaces) == 1:
+                    providers[parent] = self._providers[ifaces[0]]
+
+            wirings = {
+                provider: provider.wiring() for provider in set(providers.values())
+            }
+            built = {}
+            for iface in sorted(providers, key=_name):
+                self._build(providers[iface], providers, wirings, built, [])
+
+            self._resolvers = {
+                iface: built[provider] for iface, provider in providers.items()
+            }
+
+    def _build(self, provider, providers, wirings, built, path):
+        """
+        Make the resolver for ``provider``, after making the resolvers for its
+        dependencies.
+        """
+        try:
+            return built[provider]
+        except KeyError:
+            pass
+
+        if provider in path:
+            cycle = path[path.index(provider) :] + [provider]
+            raise CyclicDependency(
+                "Cyclic dependency: {}".format(
+                    " -> ".join(_name(p.iface) for p in cycle)
+                )
+            )
+
+        path.append(provider)
+        dependencies = []
+        for name, iface in sorted(wirings[provider].items()):
+            try:
+                dependency = providers[iface]
+            except KeyError:
+                raise ResolutionError(
+                    "{factory} requires {iface} for parameter {param!r}, but no "
+                    "provider is registered for it.".format(
+                        factory=_name(provider.factory),
+                        iface=_name(iface),
+                        param=name,
+                    )
+                )
+            dependencies.append(
+                (name, self._build(dependency, providers, wirings, built, path))
+            )
+        path.pop()
+
+        if provider.factory is None:
+            resolver = _make_constant(provider.instance)
+        else:
+            resolver = _make_resolver(provider.factory, tuple(dependencies))
+            if provider.singleton:
+                resolver = _make_singleton(resolver)
+
+        built[provider] = resolver
+        return resolver
+
+    def resolve(self, iface):
+        """
+        Get an implementation of ``iface``.
+
+        Freezes the container if it isn't frozen already.
+
+        Raises
+        ------
+        ResolutionError
+            If no provider is registered for ``iface``.
+        """
+        resolvers = self._resolvers
+        if resolvers is None:
+            self.freeze()
+            resolvers = self._resolvers
+
+        try:
+            resolver = resolvers[iface]
+        except (KeyError, TypeError):
+            raise ResolutionError(
+                "No provider is registered for {}.".format(_name(iface))
+            )
+        return resolver()
+
+
+def _make_constant(value):
+    def resolve():
+        return value
+
+    return resolve
+
+
+def _make_resolver(factory, dependencies):
+    if not dependencies:
+        return factory
+
+    def resolve():
+        return factory(**{name: dependency() for name, dependency in dependencies})
+
+    return resolve
+
+
+def _make_singleton(create):
+    lock = Lock()
+    instance = []
+
+    def resolve():
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(create())
+        return instance[0]
+
+    return resolve
@@ -1,9 +1,12 @@
 import dis
+import sys
+import types
 import warnings
+from weakref import WeakKeyDictionary
 
 from .compat import PY3
 from .formatting import bulleted_list
-from .functional import keysorted, sliding_window
+from .functional import keysorted
 
 
 class default(object):
@@ -70,31 +73,196 @@ if PY3:  # pragma: nocover-py2
             if non_interface_usages:
                 yield default_name, sorted(non_interface_usages)
 
+    # Map from code object -> {aliases -> frozenset of attribute names}.
+    _accessed_attributes_cache = WeakKeyDictionary()
+
     def accessed_attributes_of_local(f, local_name):
         """
         Get a list of attributes of ``local_name`` accessed by ``f``.
 
+        Accesses through aliases of ``local_name`` (e.g. ``other = self;
+        other.attr``) are found, including accesses in nested functions,
+        lambdas, and comprehensions that close over ``local_name`` or one of
+        its aliases.
+
         The analysis performed by this function is conservative, meaning that
-        it's not guaranteed to find **all** attributes used.
+        it's not guaranteed to find **all** attributes used. It makes a single
+        pass over each code object, so an alias is only recognized in
+        instructions that follow the assignment that created it.
+
+        Results are cached per code object.
         """
-        try:
-            instrs = dis.get_instructions(f)
-        except TypeError:
+        # Unwrap methods, classmethods, and staticmethods.
+        code = getattr(getattr(f, "__func__", f), "__code__", f)
+        if not isinstance(code, types.CodeType):
             # Got a default wrapping an object that's not a python function. Be
             # conservative and assume this is safe.
             return set()
 
+        return set(_accessed_attributes(code, frozenset([local_name])))
+
+    def _accessed_attributes(code, aliases):
+        """
+        Cached version of ``_scan_accessed_attributes``.
+        """
+        try:
+            by_aliases = _accessed_attributes_cache[code]
+        except KeyError:
+            by_aliases = _accessed_attributes_cache[code] = {}
+        except TypeError:  # pragma: nocover
+            # Not weakrefable. Code objects are on CPython 3.
+            return _scan_accessed_attributes(code, aliases)
+
+        try:
+            return by_aliases[aliases]
+        except KeyError:
+            used = by_aliases[aliases] = _scan_accessed_attributes(code, aliases)
+            return used
+
+    def _scan_accessed_attributes(code, aliases):
+        """
+        Find the attributes used of any of the variables named in ``aliases``.
+
+        This walks ``code.co_code`` directly, rather than using
+        ``dis.get_instructions``, to avoid building an ``Instruction`` per
+        opcode. We track whether the value on top of the stack is an
+        alias, and:
+
+        - ``LOAD_ATTR``, ``LOAD_METHOD``, and ``STORE_ATTR`` on an alias
+          record an attribute use.
+        - ``STORE_FAST`` and ``STORE_DEREF`` of an alias make the stored
+          variable an alias. Storing anything else into a variable makes it
+          stop being one.
+
+        Nested code objects in ``co_consts`` are then scanned for uses of any
+        aliases that they close over.
+        """
+        fast_names, deref_names = _variable_names(code)
+        aliases = set(aliases)
         used = set()
-        # Find sequences of the form: LOAD_FAST(local_name), LOAD_ATTR(<name>).
-        # This will find all usages of the form ``local_name.<name>``.
-        #
-        # It will **NOT** find usages in which ``local_name`` is aliased to
-        # another name.
-        for first, second in sliding_window(instrs, 2):
-            if first.opname == "LOAD_FAST" and first.argval == local_name:
-                if second.opname in ("LOAD_ATTR", "LOAD_METHOD", "STORE_ATTR"):
-                    used.add(second.argval)
-        return used
+        co_code = code.co_code
+        names = code.co_names
+
+        if _WORDCODE:
+            instructions = zip(co_code[::2], co_code[1::2])
+        else:
+            instructions = _unpack_bytecode(co_code)  # pragma: nocover
+
+        top_is_alias = False
+        extended = 0
+        for op, arg in instructions:
+            if op == _CACHE:
+                # Inline cache entries aren't instructions. Only Python 3.11+
+                # has them.
+                continue  # pragma: nocover
+
+            arg |= extended
+            if op == _EXTENDED_ARG:
+                extended = arg << _EXTENDED_ARG_SHIFT
+                continue
+            extended = 0
+
+            if op in _LOAD_FAST_OPS:
+                top_is_alias = fast_names[arg] in aliases
+            elif op in _LOAD_DEREF_OPS:
+                top_is_alias = deref_names[arg] in aliases
+            elif op in _LOAD_FAST_PAIR_OPS:
+                # Loads two locals, packing their indices into the high and low
+                # four bits of the argument. The second ends up on top. This
+                # and the other superinstructions below are Python 3.13+.
+                top_is_alias = fast_names[arg & 15] in aliases  # pragma: nocover
+            elif op in _ATTRIBUTE_OPS:
+                if top_is_alias:
+                    if op == _LOAD_ATTR:
+                        used.add(names[arg >> _LOAD_ATTR_SHIFT])
+                    else:
+                        used.add(names[arg])
+                top_is_alias = False
+            elif op in _STORE_FAST_OPS:
+                _assign(aliases, fast_names[arg], top_is_alias)
+                top_is_alias = False
+            elif op in _STORE_DEREF_OPS:
+                _assign(aliases, deref_names[arg], top_is_alias)
+                top_is_alias = False
+            elif op == _STORE_FAST_LOAD_FAST:  # pragma: nocover
+                _assign(aliases, fast_names[arg >> 4], top_is_alias)
+                top_is_alias = fast_names[arg & 15] in aliases
+            elif op == _STORE_FAST_STORE_FAST:  # pragma: nocover
+                _assign(aliases, fast_names[arg >> 4], top_is_alias)
+                aliases.discard(fast_names[arg & 15])
+                top_is_alias = False
+            else:
+                top_is_alias = False
+
+        if aliases:
+            for const in code.co_consts:
+                if isinstance(const, types.CodeType):
+                    captured = aliases.intersection(const.co_freevars)
+                    if captured:
+                        used.update(_accessed_attributes(const, frozenset(captured)))
+
+        return frozenset(used)
+
+    def _unpack_bytecode(co_code):
+        # Before Python 3.6, instructions without arguments are one byte, and
+        # instructions with arguments are three.
+        i = 0
+        end = len(co_code)
+        while i < end:
+            op = co_code[i]
+            if op >= dis.HAVE_ARGUMENT:
+                yield op, co_code[i + 1] | (co_code[i + 2] << 8)
+                i += 3
+            else:
+                yield op, 0
+                i += 1
+
+    def _assign(aliases, name, is_alias):
+        if is_alias:
+            aliases.add(name)
+        else:
+            aliases.discard(name)
+
+    def _variable_names(code):
+        """
+        Get the names referred to by the arguments of instructions that access
+        fast locals and closure cells, respectively.
+        """
+        varname_from_oparg = getattr(code, "_varname_from_oparg", None)
+        if varname_from_oparg is None:
+            return code.co_varnames, code.co_cellvars + code.co_freevars
+
+        # Since Python 3.11, both kinds of instruction index into a single
+        # array of variables.
+        names = []
+        try:
+            while True:
+                names.append(varname_from_oparg(len(names)))
+        except IndexError:
+            pass
+        return names, names
+
+    def _opcodes(*names):
+        return frozenset(dis.opmap[name] for name in names if name in dis.opmap)
+
+    _WORDCODE = sys.version_info >= (3, 6)
+    _EXTENDED_ARG = dis.EXTENDED_ARG
+    _EXTENDED_ARG_SHIFT = 8 if _WORDCODE else 16
+    _CACHE = dis.opmap.get("CACHE", -1)
+    _LOAD_ATTR = dis.opmap["LOAD_ATTR"]
+    # Since Python 3.12, the low bit of LOAD_ATTR's argument says whether
+    # it's loading a method.
+    _LOAD_ATTR_SHIFT = 1 if sys.version_info >= (3, 12) else 0
+    _STORE_FAST_LOAD_FAST = dis.opmap.get("STORE_FAST_LOAD_FAST", -1)
+    _STORE_FAST_STORE_FAST = dis.opmap.get("STORE_FAST_STORE_FAST", -1)
+    _ATTRIBUTE_OPS = _opcodes("LOAD_ATTR", "LOAD_METHOD", "STORE_ATTR")
+    _LOAD_FAST_OPS = _opcodes("LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_FAST_BORROW")
+    _LOAD_FAST_PAIR_OPS = _opcodes(
+        "LOAD_FAST_LOAD_FAST", "LOAD_FAST_BORROW_LOAD_FAST_BORROW"
+    )
+    _LOAD_DEREF_OPS = _opcodes("LOAD_DEREF", "LOAD_CLASSDEREF")
+    _STORE_FAST_OPS = _opcodes("STORE_FAST")
+    _STORE_DEREF_OPS = _opcodes("STORE_DEREF")
 
 
 else:  # pragma: nocover-py3
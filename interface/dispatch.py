@@ -0,0 +1,204 @@
+"""
+Single dispatch on the interfaces implemented by an argument.
+"""
+from functools import update_wrapper
+from weakref import ref
+
+from .interface import Interface, InterfaceMeta, ImplementsMeta
+from .registry import registry
+
+
+class AmbiguousDispatch(TypeError):
+    """
+    Raised when an argument implements several unrelated interfaces that all
+    have handlers.
+    """
+
+
+class InterfaceDispatcher(object):
+    """
+    A function that dispatches on the interfaces implemented by the class of
+    its first argument.
+
+    Use :func:`dispatch` to create dispatchers.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call for arguments whose classes don't implement any
+        interface with a registered handler.
+    """
+
+    def __init__(self, func):
+        self.default = func
+        self._handlers = {}
+        # Map from id(cls) -> handler, and id(cls) -> weakref(cls). Entries
+        # are removed when their class dies, so ids are never stale.
+        self._cache = {}
+        self._refs = {}
+        self._version = registry.version
+        update_wrapper(self, func)
+
+    def register(self, iface, func=None):
+        """
+        Register ``func`` as the handler for implementations of ``iface``.
+
+        Can be used as a decorator.
+
+        Parameters
+        ----------
+        iface : InterfaceMeta
+            A subclass of :class:`~interface.Interface`.
+        func : callable, optional
+            The handler. If not provided, a decorator is returned.
+        """
+        if func is None:
+            return lambda func: self.register(iface, func)
+
+        if not isinstance(iface, InterfaceMeta) or iface is Interface:
+            raise TypeError(
+                "dispatch handlers must be registered for subclasses of "
+                "Interface, but got {!r}.".format(iface)
+            )
+
+        self._handlers[iface] = func
+        self.clear_cache()
+        return func
+
+    @property
+    def handlers(self):
+        """Map from interfaces to their registered handlers."""
+        return dict(self._handlers)
+
+    def dispatch(self, cls):
+        """
+        Get the function that will be called for instances of ``cls``.
+
+        Raises
+        ------
+        AmbiguousDispatch
+            If ``cls`` implements several interfaces with handlers, none of
+            which is more specific than all of the others.
+        """
+        if self._version != registry.version:
+            self.clear_cache()
+
+        key = id(cls)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        handler = self._resolve(cls)
+        cache = self._cache
+        refs = self._refs
+
+        def remove(_):
+            cache.pop(key, None)
+            refs.pop(key, None)
+
+        refs[key] = ref(cls, remove)
+        cache[key] = handler
+        return handler
+
+    def _resolve(self, cls):
+        """
+        Find the handler for ``cls``, without consulting the cache.
+        """
+        if not isinstance(cls, ImplementsMeta):
+            return self.default
+
+        # ``_provided_interfaces`` flattens the interfaces declared by ``cls``
+        # and its parents, along with their parent interfaces.
+        handlers = self._handlers
+        candidates = [i for i in cls._provided_interfaces if i in handlers]
+
+        # Drop handlers for interfaces that have a subclass with a handler.
+        best = [
+            iface
+            for iface in candidates
+            if not any(
+                other is not iface and iface in other.__mro__ for other in candidates
+            )
+        ]
+        if not best:
+            return self.default
+        if len(best) > 1:
+            raise AmbiguousDispatch(
+                "Ambiguous dispatch for {cls}: it implements {ifaces}, which all "
+                "have handlers.".format(
+                    cls=cls.__name__,
+                    ifaces=", ".join(sorted(i.__name__ for i in best)),
+                )
+            )
+        return handlers[best[0]]
+
+    def clear_cache(self):
+        """
+        Forget which handler was chosen for each class.
+
+        This is called automatically when handlers or implementations are
+        registered.
+        """
+        self._cache.clear()
+        self._refs.clear()
+        self._version = registry.version
+
+    def __call__(self, *args, **kwargs):
+        try:
+            cls = args[0].__class__
+        except IndexError:
+            raise TypeError(
+                "{} requires at least one positional argument".format(self.__name__)
+            )
+
+        if self._version == registry.version:
+            try:
+                handler = self._cache[id(cls)]
+            except KeyError:
+                handler = self.dispatch(cls)
+        else:
+            handler = self.dispatch(cls)
+        return handler(*args, **kwargs)
+
+
+def dispatch(func):
+    """
+    Make a function that dispatches on the interfaces implemented by its first
+    argument.
+
+    This is similar to :func:`functools.singledispatch`, except that handlers
+    are registered for interfaces instead of classes. A handler registered for
+    an interface is used for implementations of that interface and of its
+    subclasses. If several interfaces implemented by an argument's class have
+    handlers, the most specific one is used.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call for arguments whose classes don't implement any
+        interface with a registered handler.
+
+    Returns
+    -------
+    dispatcher : InterfaceDispatcher
+
+    Examples
+    --------
+    .. code-block:: python
+
+        @dispatch
+        def describe(obj):
+            return "something"
+
+        @describe.register(Shape)
+        def describe_shape(shape):
+            return "a shape with area {}".format(shape.area())
+
+    Notes
+    -----
+    The handler chosen for each class is cached, so repeated calls with
+    instances of the same class only cost a dict lookup. The cache is cleared
+    whenever a handler or a new implementation is registered.
+    """
+    return InterfaceDispatcher(func)
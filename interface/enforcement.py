@@ -0,0 +1,487 @@
+"""
+Runtime enforcement of the annotations in interface signatures.
+
+Enforcement is opt-in. It's enabled for an interface (and its subinterfaces)
+by setting ``_INTERFACE_ENFORCE_TYPES = True`` in its body, or for every
+interface by setting the ``INTERFACE_ENFORCE_TYPES`` environment variable to
+``1``. When an implementation of an enforcing interface is verified, each of
+its methods whose interface signature has checkable annotations is replaced
+with a wrapper that checks arguments and return values before and after
+calling the original.
+
+Wrappers are generated from source for each signature, so a call costs one
+``isinstance`` check per annotated argument on top of the original call.
+Annotations are checkable if they're classes, tuples of classes, or None.
+Other annotations (e.g. strings and ``typing`` constructs) are ignored.
+
+Sampling
+--------
+Checking every call can be too expensive for hot paths. Interfaces that set
+``_INTERFACE_SAMPLE_CONTRACTS = N`` (or every interface, when the
+``INTERFACE_SAMPLE_CONTRACTS`` environment variable is set to ``N``) instead
+get wrappers that check one call in every ``N``. Violations found by sampled
+checks are counted rather than raised, and can be read with
+:func:`contract_stats`.
+
+When a method is called often enough that sampling one call in ``N`` would
+check more than ``MAX_SAMPLES_PER_SECOND`` calls per second, its sampling
+interval grows to keep within that budget, and shrinks back to ``N`` as the
+load drops. Calls that aren't sampled only decrement a counter.
+
+When enforcement and sampling are both disabled, implementations are left
+untouched.
+"""
+from math import ceil
+import os
+from weakref import WeakSet
+
+from .compat import Parameter, PY3, signature
+from .profiling import qualified_name, timer
+from .typed_signature import _inner_extract_func
+
+ENVIRONMENT_VARIABLE = "INTERFACE_ENFORCE_TYPES"
+SAMPLING_ENVIRONMENT_VARIABLE = "INTERFACE_SAMPLE_CONTRACTS"
+
+# Upper bound on the number of calls to each sampled method that are checked
+# per second.
+MAX_SAMPLES_PER_SECOND = 1000
+
+# Attribute set on wrappers, holding the interfaces they enforce.
+ENFORCED_ATTRIBUTE = "__interface_enforced__"
+
+
+class ContractViolation(TypeError):
+    """
+    Raised when a call to an implementation method doesn't match the
+    annotations in its interface's signature.
+    """
+
+
+def enforcement_enabled(iface):
+    """Check whether calls to implementations of ``iface`` should be checked."""
+    return iface._INTERFACE_ENFORCE_TYPES or os.environ.get(
+        ENVIRONMENT_VARIABLE, ""
+    ).lower() in ("1", "true", "yes")
+
+
+def sampling_interval(iface):
+    """
+    Get the interval at which calls to implementations of ``iface`` should be
+    sampled, or 0 if they shouldn't be.
+    """
+    interval = iface._INTERFACE_SAMPLE_CONTRACTS
+    if not interval:
+        try:
+            interval = int(os.environ.get(SAMPLING_ENVIRONMENT_VARIABLE) or 0)
+        except ValueError:
+            interval = 0
+    return max(interval, 0)
+
+
+class SampleState(object):
+    """
+    Sampling state and violation counters for a single method.
+
+    Attributes
+    ----------
+    name : str
+        Qualified name of the sampled method.
+    interval : int
+        The configured sampling interval.
+    current_interval : int
+        The interval currently in use, after adapting to load.
+    countdown : int
+        Number of calls until the next sampled call.
+    calls : int
+        Number of calls made before the most recent sample.
+    samples : int
+        Number of calls that were checked.
+    violations : dict[str -> int]
+        Number of violations found for each argument. Violations of the
+        return annotation are counted under ``"return"``.
+    """
+
+    __slots__ = (
+        "name",
+        "interval",
+        "current_interval",
+        "countdown",
+        "calls",
+        "samples",
+        "violations",
+        "last_sample",
+        "__weakref__",
+    )
+
+    def __init__(self, name, interval):
+        self.name = name
+        self.interval = interval
+        # Check the first call, so that broken implementations are noticed
+        # quickly.
+        self.current_interval = self.countdown = 1
+        self.calls = self.samples = 0
+        self.violations = {}
+        self.last_sample = timer()
+
+    def sample(self):
+        """Record a sampled call, and work out when to sample next."""
+        now = timer()
+        elapsed = now - self.last_sample
+        self.last_sample = now
+        self.calls += self.current_interval
+        self.samples += 1
+
+        interval = self.interval
+        if elapsed > 0:
+            budget = elapsed * MAX_SAMPLES_PER_SECOND
+            interval = max(interval, int(ceil(self.current_interval / budget)))
+        self.current_interval = self.countdown = interval
+
+    def violation(self, name):
+        """Count a violation of the annotation for argument ``name``."""
+        self.violations[name] = self.violations.get(name, 0) + 1
+
+    def stats(self):
+        return {
+            "interval": self.current_interval,
+            "calls": self.calls + self.current_interval - self.countdown,
+            "samples": self.samples,
+            "violations": dict(self.violations),
+        }
+
+    def reset(self):
+        # Don't count calls made since the last sample.
+        self.calls = self.countdown - self.current_interval
+        self.samples = 0
+        self.violations.clear()
+
+
+# All live sample states.
+_sample_states = WeakSet()
+
+
+def contract_stats():
+    """
+    Get sampling statistics for every sampled method.
+
+    Returns
+    -------
+    stats : dict[str -> dict]
+        Map from method name to a dict with keys:
+
+        - ``"interval"``: the sampling interval currently in use.
+        - ``"calls"``: the number of calls to the method.
+        - ``"samples"``: the number of calls that were checked.
+        - ``"violations"``: a dict mapping argument names (or ``"return"``)
+          to the number of sampled calls that violated their annotations.
+    """
+    return {state.name: state.stats() for state in list(_sample_states)}
+
+
+def reset_contract_stats():
+    """Reset the counters of every sampled method."""
+    for state in list(_sample_states):
+        state.reset()
+
+
+def _checkable(annotation):
+    """
+    Get a class or tuple of classes to check values against with
+    ``isinstance``, or None if ``annotation`` can't be checked.
+    """
+    if annotation is Parameter.empty:
+        return None
+    if annotation is None:
+        return type(None)
+    if isinstance(annotation, type):
+        return annotation
+    if (
+        isinstance(annotation, tuple)
+        and annotation
+        and all(isinstance(a, type) for a in annotation)
+    ):
+        return annotation
+    return None
+
+
+def _describe(expected):
+    if isinstance(expected, tuple):
+        return " or ".join(t.__name__ for t in expected)
+    return expected.__name__
+
+
+def _argument_error(qualname, name, value, expected):
+    return ContractViolation(
+        "{}() argument {!r} must be {}, not {}".format(
+            qualname, name, _describe(expected), type(value).__name__
+        )
+    )
+
+
+def _return_error(qualname, value, expected):
+    return ContractViolation(
+        "{}() must return {}, not {}".format(
+            qualname, _describe(expected), type(value).__name__
+        )
+    )
+
+
+_WRAPPER_TEMPLATE = """\
+def {name}({params}):
+{checks}    __result = __func({call})
+{return_check}    return __result
+"""
+
+_SAMPLING_WRAPPER_TEMPLATE = """\
+def {name}({params}):
+    __state.countdown -= 1
+    if __state.countdown:
+        return __func({call})
+    __state.sample()
+{checks}    __result = __func({call})
+{return_check}    return __result
+"""
+
+
+def render_parameters(parameters, namespace):
+    """
+    Render ``parameters`` as source for the parameter list of a generated
+    function, and for a call that passes each of them on.
+
+    Parameters
+    ----------
+    parameters : list[inspect.Parameter]
+        The parameters to render.
+    namespace : dict
+        Namespace the generated function will be defined in. The default of
+        the ``i``-th parameter is stored in it as ``__default_{i}``.
+
+    Returns
+    -------
+    params, call : list[str], list[str]
+        The rendered parameters, and the rendered arguments of the call.
+    """
+    params = []
+    call = []
+    seen_keyword_only_marker = False
+    for i, p in enumerate(parameters):
+        name = p.name
+        kind = p.kind
+
+        if kind == Parameter.KEYWORD_ONLY and not seen_keyword_only_marker:
+            params.append("*")
+            seen_keyword_only_marker = True
+
+        rendered = name
+        if p.default is not Parameter.empty:
+            namespace["__default_{}".format(i)] = p.default
+            rendered += "=__default_{}".format(i)
+
+        if kind == Parameter.VAR_POSITIONAL:
+            seen_keyword_only_marker = True
+            params.append("*" + name)
+            call.append("*" + name)
+        elif kind == Parameter.VAR_KEYWORD:
+            params.append("**" + name)
+            call.append("**" + name)
+        elif kind == Parameter.KEYWORD_ONLY:
+            params.append(rendered)
+            call.append("{0}={0}".format(name))
+        else:
+            params.append(rendered)
+            call.append(name)
+            is_last_positional_only = kind == Parameter.POSITIONAL_ONLY and (
+                i + 1 == len(parameters)
+                or parameters[i + 1].kind != Parameter.POSITIONAL_ONLY
+            )
+            if is_last_positional_only:
+                params.append("/")
+    return params, call
+
+
+def make_enforcer(func, iface_signature, qualname, state=None):
+    """
+    Generate a wrapper around ``func`` that checks the annotations in
+    ``iface_signature``.
+
+    Parameters
+    ----------
+    func : function
+        The implementation to wrap.
+    iface_signature : inspect.Signature
+        The interface's signature for ``func``.
+    qualname : str
+        Name to use for ``func`` in error messages.
+    state : SampleState, optional
+        If given, only calls sampled by ``state`` are checked, and violations
+        are counted in ``state`` instead of raised.
+
+    Returns
+    -------
+    wrapper : function or None
+        The wrapper, or None if ``iface_signature`` doesn't have any checkable
+        annotations.
+    """
+    iface_params = iface_signature.parameters
+    impl_params = list(signature(func).parameters.values())
+
+    namespace = {
+        "__func": func,
+        "__argument_error": _argument_error,
+        "__return_error": _return_error,
+        "__qualname": qualname,
+        "__state": state,
+    }
+    params, call = render_parameters(impl_params, namespace)
+    checks = []
+    for i, p in enumerate(impl_params):
+        name = p.name
+        kind = p.kind
+
+        iface_param = iface_params.get(name)
+        if iface_param is None:
+            continue
+        expected = _checkable(iface_param.annotation)
+        if expected is None:
+            continue
+
+        type_name = "__type_{}".format(i)
+        namespace[type_name] = expected
+        if kind == Parameter.VAR_POSITIONAL:
+            value, loop = "__value", "    for __value in {}:\n    ".format(name)
+        elif kind == Parameter.VAR_KEYWORD:
+            value = "__value"
+            loop = "    for __value in {}.values():\n    ".format(name)
+        else:
+            value, loop = name, ""
+
+        condition = "not isinstance({}, {})".format(value, type_name)
+        if p.default is not Parameter.empty and kind not in (
+            Parameter.VAR_POSITIONAL,
+            Parameter.VAR_KEYWORD,
+        ):
+            # Defaults don't have to match the annotation.
+            condition = "{} is not __default_{} and {}".format(value, i, condition)
+
+        if state is None:
+            on_violation = "raise __argument_error(__qualname, {!r}, {}, {})".format(
+                name, value, type_name
+            )
+        else:
+            on_violation = "__state.violation({!r})".format(name)
+        checks.append(
+            "{loop}    if {condition}:\n{indent}        {on_violation}\n".format(
+                loop=loop,
+                condition=condition,
+                indent="    " if loop else "",
+                on_violation=on_violation,
+            )
+        )
+
+    return_check = ""
+    expected_return = _checkable(iface_signature.return_annotation)
+    if expected_return is not None:
+        namespace["__return_type"] = expected_return
+        if state is None:
+            on_violation = "raise __return_error(__qualname, __result, __return_type)"
+        else:
+            on_violation = "__state.violation('return')"
+        return_check = (
+            "    if not isinstance(__result, __return_type):\n"
+            "        {}\n".format(on_violation)
+        )
+
+    if not checks and not return_check:
+        return None
+
+    template = _WRAPPER_TEMPLATE if state is None else _SAMPLING_WRAPPER_TEMPLATE
+    source = template.format(
+        name=func.__name__,
+        params=", ".join(params),
+        checks="".join(checks),
+        call=", ".join(call),
+        return_check=return_check,
+    )
+    exec(compile(source, "<enforcer for {}>".format(qualname), "exec"), namespace)
+    wrapper = namespace[func.__name__]
+
+    for attr in ("__module__", "__name__", "__qualname__", "__doc__"):
+        setattr(wrapper, attr, getattr(func, attr))
+    wrapper.__dict__.update(getattr(func, "__dict__", {}))
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _rewrap(member, wrapper):
+    """Wrap ``wrapper`` in the same kind of descriptor as ``member``."""
+    if isinstance(member, staticmethod):
+        return staticmethod(wrapper)
+    elif isinstance(member, classmethod):
+        return classmethod(wrapper)
+    elif isinstance(member, property):
+        return property(wrapper, member.fset, member.fdel, member.__doc__)
+    return wrapper
+
+
+def enforce_types(impl, iface, sample_interval=None):
+    """
+    Replace the methods of ``impl`` with wrappers that check the annotations
+    in ``iface``'s signatures.
+
+    Methods that are already checked for ``iface``, and methods whose
+    interface signatures don't have any checkable annotations, are left
+    alone.
+
+    Parameters
+    ----------
+    impl : type
+        The implementation to modify.
+    iface : InterfaceMeta
+        The interface whose annotations should be checked.
+    sample_interval : int, optional
+        If given, only check one call in every ``sample_interval``, and count
+        violations instead of raising them.
+    """
+    if not PY3:  # pragma: nocover-py3
+        return
+
+    for name, iface_sig in iface._signatures.items():
+        for t in impl.__mro__:
+            if name in vars(t):
+                member = vars(t)[name]
+                break
+        else:  # pragma: nocover
+            continue
+
+        func = _inner_extract_func(member)
+        enforced = getattr(func, ENFORCED_ATTRIBUTE, ())
+        if iface in enforced or not hasattr(func, "__code__"):
+            continue
+
+        qualname = "{}.{}".format(impl.__name__, name)
+        state = None
+        if sample_interval:
+            state = SampleState(
+                "{}.{}".format(qualified_name(impl), name), sample_interval
+            )
+        wrapper = make_enforcer(func, iface_sig.signature, qualname, state)
+        if wrapper is None:
+            continue
+
+        if state is not None:
+            _sample_states.add(state)
+        setattr(wrapper, ENFORCED_ATTRIBUTE, enforced + (iface,))
+        setattr(impl, name, _rewrap(member, wrapper))
+
+
+def install_checks(impl, iface):
+    """
+    Install whichever kind of runtime checks are enabled for ``iface`` on
+    ``impl``.
+    """
+    if enforcement_enabled(iface):
+        enforce_types(impl, iface)
+    else:
+        interval = sampling_interval(iface)
+        if interval:
+            enforce_types(impl, iface, sample_interval=interval)
@@ -1,15 +1,30 @@
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from operator import attrgetter, itemgetter
+import os
 from textwrap import dedent
-from weakref import WeakKeyDictionary
+import types
+from weakref import ref, WeakKeyDictionary
 
-from .compat import raise_from, with_metaclass
+from .compat import Parameter, raise_from, signature, with_metaclass
 from .default import default, warn_if_defaults_use_non_interface_members
+from .enforcement import install_checks, render_parameters
 from .formatting import bulleted_list
 from .functional import complement, keyfilter, merge, valfilter
+from .profiling import (
+    CHECK_DEFAULTS,
+    DEFINE_INTERFACE,
+    emit,
+    listeners,
+    timer,
+    VERIFICATION_CACHE_HIT,
+    VERIFY,
+)
+from .registry import registry
+from .serialization import signature_tables
 from .typecheck import compatible
 from .typed_signature import TypedSignature
-from .utils import is_a, unique
+from .verdicts import verdict_cache
+from .utils import is_a, LRUCache, unique
 
 first = itemgetter(0)
 getname = attrgetter("__name__")
@@ -36,6 +51,9 @@ CLASS_ATTRIBUTE_WHITELIST = frozenset(
         "__qualname__",
         "__weakref__",
         "_INTERFACE_IGNORE_MEMBERS",
+        "_INTERFACE_ENFORCE_TYPES",
+        "_INTERFACE_SAMPLE_CONTRACTS",
+        "_INTERFACE_STRUCTURAL_CHECKS",
     ]
 )
 
@@ -43,6 +61,24 @@ is_interface_field_name = complement(CLASS_ATTRIBUTE_WHITELIST.__contains__)
 
 TRIVIAL_CLASS_ATTRIBUTES = frozenset(dir(type("_", (object,), {})))
 
+# Members that generated adapters define or rely on themselves, so they can't
+# be forwarded to the adapted object.
+ADAPTER_RESERVED_NAMES = frozenset(
+    [
+        "__class__",
+        "__del__",
+        "__delattr__",
+        "__dict__",
+        "__getattr__",
+        "__getattribute__",
+        "__init__",
+        "__new__",
+        "__setattr__",
+        "__slots__",
+        "_adaptee",
+    ]
+)
+
 
 def static_get_type_attr(t, name):
     """
@@ -56,6 +92,156 @@ def static_get_type_attr(t, name):
     raise AttributeError(name)
 
 
+_MISSING = object()
+
+
+def _iter_static_type_attrs(t, names):
+    """
+    Lazily get several type attributes statically, circumventing the descriptor
+    protocol.
+
+    Names that can't be found are reported as ``_MISSING``.
+    """
+    mro = t.__mro__
+    for name in names:
+        for type_ in mro:
+            namespace = vars(type_)
+            if name in namespace:
+                yield namespace[name]
+                break
+        else:
+            yield _MISSING
+
+
+class _VerificationCache(object):
+    """
+    Successful verifications of implementations against an interface.
+
+    Entries are keyed on the identities of the objects an implementation
+    provides for each interface member, so subclasses that don't redefine any
+    members reuse their parent's entry.
+
+    Entries never hold those objects strongly: methods that use zero-argument
+    ``super()`` refer to their class, so doing so would keep every verified
+    class alive. Instead, each entry holds weak references to its objects, and
+    is removed as soon as any of them die, before their ids can be reused.
+    Staticmethods, classmethods and properties can't be weakly referenced, so
+    they're keyed on their type and the functions they wrap, which are
+    referenced instead. Verifications of other objects that can't be weakly
+    referenced aren't recorded.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Get the defaults recorded for ``key``, or None."""
+        try:
+            return self._entries[key][1]
+        except KeyError:
+            return None
+
+    def add(self, key, members, defaults):
+        """
+        Record that the objects in ``members`` passed verification.
+
+        Parameters
+        ----------
+        key : tuple
+            Key returned by :meth:`members_of`.
+        members : list[object]
+            Members returned by :meth:`members_of`.
+        defaults : dict[str -> callable]
+            Defaults that implementations with these members receive.
+        """
+        entries = self._entries
+
+        def remove(_):
+            # Don't remove an entry that replaced ours.
+            if entries.get(key) is entry:
+                del entries[key]
+
+        refs = []
+        for member in members:
+            if member is _MISSING:
+                continue
+            try:
+                refs.append(ref(member, remove))
+                continue
+            except TypeError:
+                wrapped = _wrapped_functions(member)
+            if wrapped is None:
+                return
+            for func in wrapped:
+                if func is None:
+                    continue
+                try:
+                    refs.append(ref(func, remove))
+                except TypeError:
+                    return
+
+        entry = (refs, defaults)
+        entries[key] = entry
+
+    def clear(self):
+        """Forget all verifications."""
+        self._entries.clear()
+
+    @staticmethod
+    def members_of(t, names):
+        """
+        Find the objects ``t`` provides for each of ``names``.
+
+        Returns
+        -------
+        key : tuple
+            The identities of the objects found.
+        members : list[object]
+            The objects found. Missing members are reported as ``_MISSING``.
+        """
+        mro = t.__mro__
+        key = []
+        members = []
+        for name in names:
+            for type_ in mro:
+                namespace = vars(type_)
+                if name in namespace:
+                    member = namespace[name]
+                    break
+            else:
+                member = _MISSING
+            members.append(member)
+
+            # Keep in sync with _wrapped_functions.
+            kind = type(member)
+            if kind is property:
+                key.append((kind, id(member.fget), id(member.fset), id(member.fdel)))
+            elif kind is staticmethod or kind is classmethod:
+                key.append((kind, id(member.__func__)))
+            else:
+                key.append(id(member))
+        return tuple(key), members
+
+
+def _wrapped_functions(member):
+    """
+    Get the functions wrapped by a staticmethod, classmethod or property, or
+    None for other objects.
+
+    Subclasses of these types support weak references, so they don't need to
+    be unwrapped.
+    """
+    type_ = type(member)
+    if type_ is property:
+        return (member.fget, member.fset, member.fdel)
+    if type_ is staticmethod or type_ is classmethod:
+        return (member.__func__,)
+    return None
+
+
 def _conflicting_defaults(typename, conflicts):
     """Format an error message for conflicting default implementations.
 
@@ -103,16 +289,23 @@ class InterfaceMeta(type):
     """
 
     def __new__(mcls, name, bases, clsdict):
+        start = timer() if listeners else None
+
         signatures = _merge_parent_signatures(bases)
         defaults = _merge_parent_defaults(bases)
         ignored = clsdict.get("_INTERFACE_IGNORE_MEMBERS", set())
+        table = signature_tables.open(clsdict)
+        new_defaults = {}
 
         for field, v in keyfilter(is_interface_field_name, clsdict).items():
             if field in ignored:
                 continue
 
             try:
-                signature = TypedSignature(v)
+                if table is None:
+                    signature = TypedSignature(v)
+                else:
+                    signature = table.signature(field, v)
             except TypeError as e:
                 errmsg = (
                     "Couldn't parse signature for field "
@@ -145,14 +338,246 @@ class InterfaceMeta(type):
 
             if isinstance(v, default):
                 defaults[field] = v
+                new_defaults[field] = v
+
+        if table is not None:
+            table.save()
 
+        defaults_start = timer() if start is not None else None
+        # Inherited defaults were already checked against a subset of our
+        # members, so they can't have any new problems.
         warn_if_defaults_use_non_interface_members(
-            name, defaults, set(signatures.keys())
+            name, new_defaults, set(signatures.keys())
         )
+        defaults_end = timer() if start is not None else None
 
         clsdict["_signatures"] = signatures
         clsdict["_defaults"] = defaults
-        return super(InterfaceMeta, mcls).__new__(mcls, name, bases, clsdict)
+        clsdict["_verification_cache"] = _VerificationCache()
+        clsdict["_conformance_cache"] = WeakKeyDictionary()
+        clsdict["_adapter_cache"] = WeakKeyDictionary()
+        newtype = super(InterfaceMeta, mcls).__new__(mcls, name, bases, clsdict)
+
+        registry.add_interface(newtype)
+
+        if start is not None:
+            emit(CHECK_DEFAULTS, newtype, defaults_end - defaults_start)
+            emit(DEFINE_INTERFACE, newtype, timer() - start)
+        return newtype
+
+    def __init__(mcls, name, bases, clsdict):
+        super(InterfaceMeta, mcls).__init__(name, bases, clsdict)
+
+    def __instancecheck__(self, instance):
+        cls = type(instance)
+        if self.__subclasscheck__(cls):
+            return True
+        other = getattr(instance, "__class__", cls)
+        return other is not cls and self.__subclasscheck__(other)
+
+    def __subclasscheck__(self, subclass):
+        """
+        Check whether ``subclass`` is a subclass or an implementation of
+        ``self``.
+
+        Classes implement ``self`` if they subclass ``implements(self)``, or
+        ``implements()`` of one of our subclasses. If ``self`` sets
+        ``_INTERFACE_STRUCTURAL_CHECKS = True``, any class that provides
+        compatible definitions for all of our members also implements us.
+        """
+        if type.__subclasscheck__(self, subclass):
+            return True
+
+        if self in getattr(subclass, "_provided_interface_set", empty_set):
+            return True
+
+        if not self._INTERFACE_STRUCTURAL_CHECKS:
+            return False
+
+        return self.conforms(subclass)
+
+    def conforms(self, type_):
+        """
+        Check whether ``type_`` provides compatible definitions for all of our
+        members.
+
+        Unlike :meth:`verify`, this doesn't require ``type_`` to declare that
+        it implements ``self``, and it stops at the first member that doesn't
+        conform instead of building an error message. Members with default
+        implementations may be omitted.
+
+        Parameters
+        ----------
+        type_ : type
+            The type to check.
+
+        Returns
+        -------
+        conforms : bool
+
+        Notes
+        -----
+        Results are cached per type. Conformance only depends on ``type_``'s
+        members, so registering implementations doesn't invalidate the cache,
+        but changes made to ``type_`` after it's been checked may go
+        unnoticed.
+        """
+        cache = self._conformance_cache
+        try:
+            return cache[type_]
+        except KeyError:
+            pass
+
+        result = cache[type_] = self._first_nonconforming_member(type_) is None
+        return result
+
+    def adapt(self, obj):
+        """
+        Wrap ``obj`` in an object that implements ``self``.
+
+        The wrapper forwards each of our members to ``obj``, and fills in
+        default implementations for members that ``obj`` doesn't provide.
+        Objects whose classes already implement ``self`` are returned
+        unchanged.
+
+        Parameters
+        ----------
+        obj : object
+            The object to adapt. ``type(obj)`` must provide compatible
+            definitions for all of our members that don't have defaults.
+
+        Returns
+        -------
+        adapted : object
+            An object that provides ``self``.
+
+        Raises
+        ------
+        InvalidImplementation
+            If ``type(obj)`` doesn't conform to our interface.
+        TypeError
+            If we have members that adapters can't forward, like ``__init__``
+            or ``__getattr__``.
+
+        Notes
+        -----
+        Adapter classes are generated and verified once per type of adapted
+        object, and cached for as long as that type is alive. They're
+        registered like any other implementation. Adapters have
+        ``__slots__``, and forward methods through generated functions with the
+        same signatures as the adapted type's, so calling an adapted method
+        costs about as much as calling a handwritten wrapper. Other members,
+        like properties, are looked up on the wrapped object on every access.
+
+        Like :meth:`conforms`, changes made to ``type(obj)`` after it's been
+        adapted may go unnoticed.
+        """
+        type_ = type(obj)
+        try:
+            adapter = self._adapter_cache[type_]
+        except KeyError:
+            # Types that already provide us are cached as None.
+            if self in getattr(type_, "_provided_interface_set", empty_set):
+                adapter = None
+            else:
+                adapter = self._make_adapter(type_)
+            self._adapter_cache[type_] = adapter
+
+        if adapter is None:
+            return obj
+        return adapter(obj)
+
+    def _make_adapter(self, type_):
+        """
+        Generate a class that adapts instances of ``type_`` to ``self``.
+        """
+        reserved = ADAPTER_RESERVED_NAMES.intersection(self._signatures)
+        if reserved:
+            raise TypeError(
+                "Can't adapt objects to {I}, because adapters can't forward "
+                "{names}.".format(I=getname(self), names=", ".join(sorted(reserved)))
+            )
+
+        defaults = self.verify(type_)
+
+        clsdict = {
+            "__slots__": ("_adaptee",),
+            "__module__": self.__module__,
+            "__doc__": "Adapter from {C} to {I}.".format(
+                C=getname(type_), I=getname(self)
+            ),
+            "__init__": _adapter_init,
+            "__repr__": _adapter_repr,
+        }
+        members = _iter_static_type_attrs(type_, self._signatures)
+        for name, member in zip(self._signatures, members):
+            # Don't hold a reference to ``type_`` (e.g. by copying its
+            # members), so that our cache entry can die with it.
+            forwarder = None
+            if isinstance(member, types.FunctionType):
+                forwarder = _make_forwarder(name, member)
+            if forwarder is None:
+                forwarder = property(attrgetter("_adaptee." + name))
+            clsdict[name] = forwarder
+        for name, impl in defaults.items():
+            clsdict[name] = impl
+
+        # Passing ``interfaces`` skips verification, which we already did on
+        # ``type_``, and registration, which we do ourselves.
+        adapter = ImplementsMeta(
+            "{I}Adapter_{C}".format(I=getname(self), C=getname(type_)),
+            (object,),
+            clsdict,
+            interfaces=frozenset([self]),
+        )
+        registry.add_implementation(adapter, adapter._provided_interfaces)
+        return adapter
+
+    def _first_nonconforming_member(self, type_, defaults_to_use=None):
+        """
+        Find the first of our members for which ``type_`` doesn't provide a
+        compatible definition.
+
+        This is the cheap half of verification: it only decides whether
+        ``type_`` conforms. ``_diff_signatures`` works out everything that's
+        wrong with a type that doesn't.
+
+        Parameters
+        ----------
+        type_ : type
+            The type to check.
+        defaults_to_use : dict, optional
+            If provided, default implementations of members missing from
+            ``type_`` are added to this dict.
+
+        Returns
+        -------
+        name : str or None
+            The name of the member, or None if ``type_`` conforms to ``self``.
+        """
+        defaults = self._defaults
+        members = _iter_static_type_attrs(type_, self._signatures)
+        for (name, iface_sig), f in zip(self._signatures.items(), members):
+            if f is _MISSING:
+                if name not in defaults:
+                    return name
+                if defaults_to_use is not None:
+                    defaults_to_use[name] = defaults[name].implementation
+                continue
+
+            try:
+                impl_sig = TypedSignature(f)
+            except (TypeError, ValueError):
+                # Not something we can get a signature for.
+                return name
+
+            if not issubclass(impl_sig.type, iface_sig.type):
+                return name
+
+            if not compatible(impl_sig, iface_sig):
+                return name
+
+        return None
 
     def _diff_signatures(self, type_):
         """
@@ -209,22 +634,65 @@ class InterfaceMeta(type):
 
         Returns
         -------
-        None
+        defaults : dict[str -> callable]
+            Default implementations that should be provided to ``type_``.
+
+        Notes
+        -----
+        Successful verifications are cached on the interface, keyed on the
+        objects that ``type_`` provides for each of our members. Subclasses of
+        an implementation that don't redefine any interface members therefore
+        reuse their parent's result instead of re-checking every signature.
+        Entries are dropped when the objects they refer to are collected.
         """
-        raw_missing, mistyped, mismatched = self._diff_signatures(type_)
+        start = timer() if listeners else None
+
+        cache = self._verification_cache
+        key, members = cache.members_of(type_, self._signatures)
+        defaults_to_use = cache.get(key)
+        if defaults_to_use is None:
+            defaults_to_use = self._verify_persistent(type_, members)
+            cache.add(key, members, defaults_to_use.copy())
+        else:
+            defaults_to_use = defaults_to_use.copy()
+            if start is not None:
+                emit(VERIFICATION_CACHE_HIT, None, 1)
 
-        # See if we have defaults for missing methods.
-        missing = []
-        defaults_to_use = {}
-        for name in raw_missing:
-            try:
-                defaults_to_use[name] = self._defaults[name].implementation
-            except KeyError:
-                missing.append(name)
+        if start is not None:
+            emit(VERIFY, (self, type_), timer() - start)
+        return defaults_to_use
+
+    def _verify_persistent(self, type_, members):
+        """
+        Verify ``type_``, consulting the persistent verdict cache if it's
+        enabled.
+        """
+        if not verdict_cache.active:
+            return self._verify_uncached(type_)
 
-        if not any((missing, mistyped, mismatched)):
+        members = tuple(None if m is _MISSING else m for m in members)
+        defaults_to_use = verdict_cache.lookup(self, type_, members)
+        if defaults_to_use is not None:
+            return defaults_to_use
+
+        try:
+            defaults_to_use = self._verify_uncached(type_)
+        except InvalidImplementation:
+            verdict_cache.evict(self, type_)
+            raise
+        verdict_cache.store(self, type_, members, defaults_to_use)
+        return defaults_to_use
+
+    def _verify_uncached(self, type_):
+        defaults_to_use = {}
+        if self._first_nonconforming_member(type_, defaults_to_use) is None:
             return defaults_to_use
 
+        # Verification failed. Find all the problems so we can report them.
+        raw_missing, mistyped, mismatched = self._diff_signatures(type_)
+
+        # Missing methods are fine if we have defaults for them.
+        missing = [name for name in raw_missing if name not in self._defaults]
         raise self._invalid_implementation(type_, missing, mistyped, mismatched)
 
     def _invalid_implementation(self, t, missing, mistyped, mismatched):
@@ -313,6 +781,49 @@ class InterfaceMeta(type):
 empty_set = frozenset([])
 
 
+def _adapter_init(self, adaptee):
+    self._adaptee = adaptee
+
+
+def _adapter_repr(self):
+    return "<{} of {!r}>".format(getname(type(self)), self._adaptee)
+
+
+_FORWARDER_TEMPLATE = """\
+def {name}({params}):
+    return {self}._adaptee.{name}({call})
+"""
+
+# Parameter kinds that a method can receive ``self`` as.
+_SELF_KINDS = frozenset([Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD])
+
+
+def _make_forwarder(name, func):
+    """
+    Generate a method that calls ``name`` on an adapter's wrapped object, with
+    the same signature as ``func``.
+
+    Returns None if ``func`` doesn't take ``self`` as its first positional
+    parameter.
+    """
+    params = list(signature(func).parameters.values())
+    if not params or params[0].kind not in _SELF_KINDS:
+        return None
+
+    namespace = {}
+    rendered, call = render_parameters(params, namespace)
+    exec(
+        _FORWARDER_TEMPLATE.format(
+            name=name,
+            params=", ".join(rendered),
+            self=params[0].name,
+            call=", ".join(call[1:]),
+        ),
+        namespace,
+    )
+    return namespace[name]
+
+
 class Interface(with_metaclass(InterfaceMeta)):
     """
     Base class for interface definitions.
@@ -372,11 +883,24 @@ class Interface(with_metaclass(InterfaceMeta)):
     # children of `Interface`.
     _INTERFACE_IGNORE_MEMBERS = {"__new__", "from_class"}
 
+    # Set this to True in an interface to make ``issubclass`` and
+    # ``isinstance`` accept classes that implement the interface without
+    # declaring it.
+    _INTERFACE_STRUCTURAL_CHECKS = False
+
+    # Set this to True in an interface to check calls to its implementations
+    # against the annotations in its signatures. See interface.enforcement.
+    _INTERFACE_ENFORCE_TYPES = False
+
+    # Set this to N in an interface to check one in every N calls to its
+    # implementations, and count violations instead of raising them.
+    _INTERFACE_SAMPLE_CONTRACTS = 0
+
     def __new__(cls, *args, **kwargs):
         raise TypeError("Can't instantiate interface %s" % getname(cls))
 
     @classmethod
-    def from_class(cls, existing_class, subset=None, name=None):
+    def from_class(cls, existing_class, subset=None, name=None, predicate=None):
         """Create an interface from an existing class.
 
         Parameters
@@ -389,6 +913,12 @@ class Interface(with_metaclass(InterfaceMeta)):
         name : str, optional
             Name of the generated interface.
             Default is ``existing_class.__name__ + 'Interface'``.
+        predicate : callable, optional
+            Function called as ``predicate(name, value, inherited)`` for each
+            candidate member, which should return True if the member should be
+            included. ``inherited`` is True for members that
+            ``existing_class`` inherits from its parents. See
+            :mod:`interface.predicates` for common predicates.
 
         Returns
         -------
@@ -398,16 +928,67 @@ class Interface(with_metaclass(InterfaceMeta)):
         if name is None:
             name = existing_class.__name__ + "Interface"
 
-        if subset is None:
-            subset = set(dir(existing_class)) - TRIVIAL_CLASS_ATTRIBUTES
+        members = _class_members(existing_class, subset)
+        if predicate is not None:
+            members = [
+                (member, value, owner)
+                for member, value, owner in members
+                if predicate(member, value, owner is not existing_class)
+            ]
 
         return InterfaceMeta(
             name,
             (Interface,),
-            {name: static_get_type_attr(existing_class, name) for name in subset},
+            {member: value for member, value, _ in members},
         )
 
 
+def _class_members(t, names=None):
+    """
+    Find members of ``t`` statically, along with the classes that define them.
+
+    Parameters
+    ----------
+    t : type
+        The class to search.
+    names : iterable[str], optional
+        Names of the members to find. Default is every attribute that isn't
+        defined on an empty class.
+
+    Returns
+    -------
+    members : list[(str, object, type)]
+        The name, value and defining class of each member.
+
+    Raises
+    ------
+    AttributeError
+        If one of ``names`` isn't defined.
+    """
+    mro = t.__mro__
+    if names is None:
+        # One pass over the MRO, rather than a lookup per name in dir(t).
+        seen = set(TRIVIAL_CLASS_ATTRIBUTES)
+        members = []
+        for owner in mro:
+            for member, value in vars(owner).items():
+                if member not in seen:
+                    seen.add(member)
+                    members.append((member, value, owner))
+        return members
+
+    members = []
+    for member in names:
+        for owner in mro:
+            namespace = vars(owner)
+            if member in namespace:
+                members.append((member, namespace[member], owner))
+                break
+        else:
+            raise AttributeError(member)
+    return members
+
+
 # Signature requirements are inherited, so make sure the base interface doesn't
 # require any methods of children.
 assert Interface._signatures == {}
@@ -424,21 +1005,45 @@ class ImplementsMeta(type):
 
         newtype = super(ImplementsMeta, mcls).__new__(mcls, name, bases, clsdict)
 
+        # Flatten our interfaces once, so that ``interfaces()`` and
+        # ``provides()`` don't need to walk the MRO.
+        newtype._interfaces = interfaces
+        newtype._interface_tuple = tuple(unique(newtype._interfaces_with_duplicates()))
+        newtype._provided_interfaces = _compute_provided_interfaces(newtype)
+        newtype._provided_interface_set = frozenset(newtype._provided_interfaces)
+
         if interfaces:
             # Don't do checks on the types returned by ``implements``.
             return newtype
 
+        mcls._verify_implementation(newtype)
+        registry.add_implementation(newtype, newtype._provided_interfaces)
+        return newtype
+
+    @staticmethod
+    def _verify_implementation(newtype):
+        """
+        Check that ``newtype`` implements all of its interfaces, and inject any
+        default implementations it needs.
+
+        Raises
+        ------
+        InvalidImplementation
+            If ``newtype`` doesn't implement one of its interfaces.
+        """
         errors = []
         default_impls = {}
         default_providers = defaultdict(list)
         for iface in sorted(newtype.interfaces(), key=getname):
             try:
                 defaults_from_iface = iface.verify(newtype)
-                for name, impl in defaults_from_iface.items():
-                    default_impls[name] = impl
-                    default_providers[name].append(iface)
             except InvalidImplementation as e:
                 errors.append(e)
+                continue
+
+            for name, impl in defaults_from_iface.items():
+                default_impls[name] = impl
+                default_providers[name].append(iface)
 
         # The list of providers for `name`, if there's more than one.
         duplicate_defaults = valfilter(
@@ -450,20 +1055,21 @@ class ImplementsMeta(type):
             for name, impl in default_impls.items():
                 setattr(newtype, name, impl)
 
-        if not errors:
-            return newtype
-        elif len(errors) == 1:
-            raise errors[0]
-        else:
-            raise InvalidImplementation("\n".join(map(str, errors)))
+        if errors:
+            raise _combine_errors(errors)
+
+        for iface in newtype.interfaces():
+            install_checks(newtype, iface)
 
     def __init__(mcls, name, bases, clsdict, interfaces=empty_set):
-        mcls._interfaces = interfaces
         super(ImplementsMeta, mcls).__init__(name, bases, clsdict)
 
     def interfaces(self):
-        for elem in unique(self._interfaces_with_duplicates()):
-            yield elem
+        """
+        Get an iterator over the interfaces declared by ``self`` and its
+        parents.
+        """
+        return iter(self._interface_tuple)
 
     def _interfaces_with_duplicates(self):
         for elem in self._interfaces:
@@ -474,6 +1080,131 @@ class ImplementsMeta(type):
                 yield elem
 
 
+def _compute_provided_interfaces(impl):
+    """
+    Get all the interfaces provided by ``impl``, including parents of the
+    interfaces it declares.
+    """
+    return tuple(
+        unique(
+            iface
+            for declared in impl._interface_tuple
+            for iface in declared.__mro__
+            if isinstance(iface, InterfaceMeta) and iface is not Interface
+        )
+    )
+
+
+def provides(obj, iface):
+    """
+    Check whether ``obj`` is an instance of a class that implements ``iface``.
+
+    Parameters
+    ----------
+    obj : object
+        The object to check.
+    iface : type
+        A subclass of :class:`~interface.Interface`.
+
+    Returns
+    -------
+    provides : bool
+        True if ``type(obj)`` implements ``iface`` or one of its subclasses.
+
+    Notes
+    -----
+    Implementations whose verification has been deferred are treated as
+    implementing their interfaces.
+    """
+    return iface in getattr(type(obj), "_provided_interface_set", empty_set)
+
+
+def _combine_errors(errors):
+    if len(errors) == 1:
+        return errors[0]
+    return InvalidImplementation("\n".join(map(str, errors)))
+
+
+# Map from id(cls) -> weakref(cls) for classes whose verification is deferred.
+_pending = OrderedDict()
+
+
+class LazyImplementsMeta(ImplementsMeta):
+    """
+    Metaclass for implementations whose verification is deferred.
+
+    Classes are verified on their first instantiation, or by
+    :func:`verify_pending`, whichever comes first.
+    """
+
+    @staticmethod
+    def _verify_implementation(newtype):
+        key = id(newtype)
+        _pending[key] = ref(newtype, lambda _: _pending.pop(key, None))
+
+    def __call__(cls, *args, **kwargs):
+        if id(cls) in _pending:
+            _verify_pending_class(cls)
+        return super(LazyImplementsMeta, cls).__call__(*args, **kwargs)
+
+
+def _verify_pending_class(cls):
+    # Verify pending parents first so that they receive their defaults before
+    # we look for ours.
+    for t in reversed(cls.__mro__):
+        if id(t) in _pending:
+            ImplementsMeta._verify_implementation(t)
+            del _pending[id(t)]
+
+
+def verify_pending():
+    """
+    Verify all implementations whose verification has been deferred.
+
+    Implementations are deferred when they subclass the result of
+    ``implements(..., verify="lazy")``.
+
+    Raises
+    ------
+    InvalidImplementation
+        If any deferred class fails to implement its interfaces. Classes that
+        fail verification are checked again on instantiation.
+    """
+    errors = []
+    # Classes are registered when they're created, so parents are always
+    # verified before their children.
+    for key, cls_ref in list(_pending.items()):
+        cls = cls_ref()
+        if cls is None:
+            continue
+        try:
+            ImplementsMeta._verify_implementation(cls)
+        except InvalidImplementation as e:
+            errors.append(e)
+        else:
+            del _pending[key]
+
+    if errors:
+        raise _combine_errors(errors)
+
+
+EAGER = "eager"
+LAZY = "lazy"
+_VERIFY_MODES = {EAGER: ImplementsMeta, LAZY: LazyImplementsMeta}
+
+
+def _verify_mode_from_environment():
+    """
+    Get the default verification mode for :func:`implements`, from the
+    ``INTERFACE_VERIFY`` environment variable.
+    """
+    return os.environ.get("INTERFACE_VERIFY", EAGER)
+
+
+# Read once, since ``implements`` is often called in tight loops.
+_default_verify = _verify_mode_from_environment()
+
+
 def format_iface_method_docs(I):
     iface_name = getname(I)
     return "\n".join(
@@ -488,10 +1219,91 @@ def format_iface_method_docs(I):
     )
 
 
-def _make_implements():
-    _memo = WeakKeyDictionary()
+class ImplementsMemo(object):
+    """
+    Memo of the bases generated by :func:`implements`.
+
+    Bases are keyed on their verification mode and the tuple of interfaces
+    passed to ``implements``, which costs nothing to build and is cheap to
+    hash. The first time a new ordering (or repetition) of some interfaces is
+    seen, its base is found under a canonical key that uses a frozenset
+    instead.
+
+    Each key maps to a weak reference whose callback removes it, so bases that
+    are no longer used don't pile up. Keys hold their interfaces strongly, but
+    bases do too, so that doesn't extend anyone's lifetime. The most recently
+    created bases are also held strongly, so that bases that are generated
+    repeatedly without being subclassed aren't rebuilt on every call.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of recently-created bases to hold strongly.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found a live base.
+    misses : int
+        Number of bases that have been generated.
+    """
+
+    def __init__(self, maxsize=128):
+        self.hits = 0
+        self.misses = 0
+        self._bases = {}
+        self._recent = LRUCache(maxsize)
+
+    @property
+    def maxsize(self):
+        return self._recent.maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        self._recent.maxsize = value
+
+    def __len__(self):
+        """The number of keys that refer to live bases."""
+        return len(self._bases)
+
+    def get(self, key):
+        """Get the base for ``key``, or None if there isn't a live one."""
+        try:
+            base = self._bases[key]()
+        except (KeyError, TypeError):
+            # TypeError means something unhashable was passed to implements.
+            return None
+
+        if base is not None:
+            self.hits += 1
+        return base
+
+    def add(self, key, base, new=False):
+        """
+        Remember ``base`` as the base for ``key``.
+
+        ``new`` should be True if ``base`` was just generated.
+        """
+        bases = self._bases
+
+        def remove(dead):
+            # Don't remove an entry that replaced ours.
+            if bases.get(key) is dead:
+                del bases[key]
+
+        bases[key] = ref(base, remove)
+        if new:
+            self.misses += 1
+            self._recent[key] = base
+
+
+implements_memo = ImplementsMemo()
+
+
+def _make_implements(memo):
+    bases = memo._bases
 
-    def implements(*interfaces):
+    def implements(*interfaces, **kwargs):
         """
         Make a base for a class that implements one or more interfaces.
 
@@ -499,6 +1311,13 @@ def _make_implements():
         ----------
         *interfaces : tuple
             One or more subclasses of :class:`~interface.Interface`.
+        verify : {'eager', 'lazy'}, optional
+            When to verify subclasses of the result. ``'eager'`` verifies
+            classes when they're created. ``'lazy'`` defers verification until
+            a class is first instantiated, or until :func:`verify_pending` is
+            called. Defaults to the value the ``INTERFACE_VERIFY`` environment
+            variable had when :mod:`interface` was imported, or ``'eager'`` if
+            it wasn't set. Passing ``verify`` overrides the environment.
 
         Returns
         -------
@@ -506,6 +1325,11 @@ def _make_implements():
             A type validating that subclasses must implement all interface
             methods of types in ``interfaces``.
 
+        Notes
+        -----
+        Calls with the same interfaces and verification mode return the same
+        base for as long as it's alive. See :class:`ImplementsMemo`.
+
         Examples
         --------
         **Implementing an Interface:**
@@ -545,51 +1369,88 @@ def _make_implements():
                 def method2(self, y):
                     return y * 2
         """
-        if not interfaces:
-            raise TypeError("implements() requires at least one interface")
+        if kwargs:
+            verify = kwargs.pop("verify", None)
+            if kwargs:
+                raise TypeError(
+                    "implements() got unexpected keyword arguments: {}".format(
+                        ", ".join(sorted(kwargs))
+                    )
+                )
+            if verify is None:
+                verify = _default_verify
+        else:
+            verify = _default_verify
 
-        interfaces = frozenset(interfaces)
+        # This is the hot path for class factories, so it doesn't go through
+        # ``memo.get``.
+        key = (verify, interfaces)
         try:
-            return _memo[interfaces]
-        except KeyError:
-            pass
+            result = bases[key]()
+        except (KeyError, TypeError):
+            # TypeError means something unhashable was passed to implements.
+            result = None
+        if result is not None:
+            memo.hits += 1
+            return result
+
+        if not interfaces:
+            raise TypeError("implements() requires at least one interface")
+        if verify not in _VERIFY_MODES:
+            raise ValueError(
+                "implements() expected verify to be one of {}, but got {!r}.".format(
+                    sorted(_VERIFY_MODES), verify
+                )
+            )
 
         for I in interfaces:
             if not issubclass(I, Interface):
                 raise TypeError("implements() expected an Interface, but got %s." % I)
 
-        ordered_ifaces = tuple(sorted(interfaces, key=getname))
-        iface_names = list(map(getname, ordered_ifaces))
+        interfaces = frozenset(interfaces)
+        canonical_key = (verify, interfaces)
+        result = memo.get(canonical_key)
+        if result is None:
+            result = _make_implements_base(interfaces, verify)
+            memo.add(canonical_key, result, new=True)
+        memo.add(key, result)
+        return result
 
-        name = "Implements{}".format("_".join(iface_names))
-        doc = dedent(
-            """\
-            Implementation of {interfaces}.
+    return implements
 
-            Methods
-            -------
-            {methods}"""
-        ).format(
-            interfaces=", ".join(iface_names),
-            methods="\n".join(map(format_iface_method_docs, ordered_ifaces)),
-        )
 
-        result = ImplementsMeta(
-            name,
-            (object,),
-            {"__doc__": doc},
-            interfaces=interfaces,
-        )
+def _make_implements_base(interfaces, verify):
+    """
+    Generate the base returned by ``implements(*interfaces, verify=verify)``.
+    """
+    ordered_ifaces = tuple(sorted(interfaces, key=getname))
+    iface_names = list(map(getname, ordered_ifaces))
 
-        # NOTE: It's important for correct weak-memoization that this is set is
-        # stored somewhere on the resulting type.
-        assert result._interfaces is interfaces, "Interfaces not stored."
+    name = "Implements{}".format("_".join(iface_names))
+    doc = dedent(
+        """\
+        Implementation of {interfaces}.
 
-        _memo[interfaces] = result
-        return result
+        Methods
+        -------
+        {methods}"""
+    ).format(
+        interfaces=", ".join(iface_names),
+        methods="\n".join(map(format_iface_method_docs, ordered_ifaces)),
+    )
 
-    return implements
+    result = _VERIFY_MODES[verify](
+        name,
+        (object,),
+        {"__doc__": doc},
+        interfaces=interfaces,
+    )
+
+    # NOTE: It's important for correct weak-memoization that this set is stored
+    # somewhere on the resulting type.
+    assert result._interfaces is interfaces, "Interfaces not stored."
+    return result
 
 
-implements = _make_implements()
+implements = _make_implements(implements_memo)
 del _make_implements
@@ -0,0 +1,54 @@
+"""
+Predicates for choosing the members that :meth:`Interface.from_class
+<interface.Interface.from_class>` includes in an interface.
+
+Predicates are called with the name of a member, its value as found in the
+``__dict__`` of the class that defines it (so e.g. staticmethods aren't
+unwrapped), and a flag that's True if the member is inherited from a parent
+of the class being converted.
+"""
+import re
+
+
+def public(name, value, inherited):
+    """Select members whose names don't start with an underscore."""
+    return not name.startswith("_")
+
+
+def callables(name, value, inherited):
+    """Select methods, staticmethods, classmethods, properties and callables."""
+    return callable(value) or isinstance(value, (staticmethod, classmethod, property))
+
+
+def declared(name, value, inherited):
+    """Select members defined directly on the class being converted."""
+    return not inherited
+
+
+def matching(pattern):
+    """
+    Make a predicate that selects members whose names match ``pattern``.
+
+    Parameters
+    ----------
+    pattern : str or compiled regex
+        Pattern to search for in member names, with :func:`re.search`.
+    """
+    search = re.compile(pattern).search
+
+    def predicate(name, value, inherited):
+        return search(name) is not None
+
+    return predicate
+
+
+def all_of(*predicates):
+    """Make a predicate that selects members selected by all of ``predicates``."""
+
+    def predicate(name, value, inherited):
+        return all(p(name, value, inherited) for p in predicates)
+
+    return predicate
+
+
+public_callables = all_of(public, callables)
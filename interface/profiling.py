@@ -0,0 +1,204 @@
+"""
+Instrumentation for the time spent defining and verifying interfaces.
+
+Listeners are callables of the form ``listener(event, subject, value)`` that
+are notified as interfaces are defined and verified. When no listeners are
+registered, the instrumented code only pays for a truthiness check.
+
+Events
+------
+``"define_interface"``
+    ``subject`` is a new interface. ``value`` is the number of seconds spent
+    in ``InterfaceMeta.__new__``.
+``"check_defaults"``
+    ``subject`` is a new interface. ``value`` is the number of seconds spent
+    checking its defaults for uses of non-interface members.
+``"verify"``
+    ``subject`` is an ``(interface, implementation)`` pair. ``value`` is the
+    number of seconds spent in ``interface.verify(implementation)``.
+``"signature_parsed"``
+    Counter of calls to ``inspect.signature``.
+``"signature_cache_hit"``
+    Counter of signatures found in the signature cache.
+``"verification_cache_hit"``
+    Counter of verifications found in an interface's verification cache.
+``"compatible"``
+    Counter of signature compatibility checks.
+``"persistent_verdict_hit"``
+    Counter of verifications skipped because of a verdict saved by
+    :mod:`interface.verdicts`.
+
+For counters, ``subject`` is None and ``value`` is 1.
+
+Example
+-------
+.. code-block:: python
+
+    from interface import profiling
+
+    with profiling.record() as profile:
+        import my_application
+
+    print(profile.report())
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+import json
+import time
+
+DEFINE_INTERFACE = "define_interface"
+CHECK_DEFAULTS = "check_defaults"
+VERIFY = "verify"
+SIGNATURE_PARSED = "signature_parsed"
+SIGNATURE_CACHE_HIT = "signature_cache_hit"
+VERIFICATION_CACHE_HIT = "verification_cache_hit"
+COMPATIBLE = "compatible"
+
+timer = getattr(time, "perf_counter", time.time)
+
+# NOTE: This list is imported by instrumented modules, so it must only ever be
+# mutated in place.
+listeners = []
+
+
+def add_listener(listener):
+    """Register ``listener`` to be notified of instrumentation events."""
+    listeners.append(listener)
+
+
+def remove_listener(listener):
+    """Stop notifying ``listener`` of instrumentation events."""
+    listeners.remove(listener)
+
+
+def emit(event, subject, value):
+    """Notify all listeners of an event."""
+    for listener in list(listeners):
+        listener(event, subject, value)
+
+
+def qualified_name(t):
+    return "{}.{}".format(t.__module__, getattr(t, "__qualname__", t.__name__))
+
+
+class Profile(object):
+    """
+    Listener that aggregates instrumentation events.
+
+    Attributes
+    ----------
+    interfaces : dict[str -> float]
+        Seconds spent defining each interface.
+    default_checks : dict[str -> float]
+        Seconds spent checking the defaults of each interface.
+    verifications : dict[(str, str) -> float]
+        Seconds spent verifying each (interface, implementation) pair.
+    counts : dict[str -> int]
+        Number of times each counter event was emitted.
+    """
+
+    def __init__(self):
+        self.interfaces = defaultdict(float)
+        self.default_checks = defaultdict(float)
+        self.verifications = defaultdict(float)
+        self.counts = defaultdict(int)
+
+    def __call__(self, event, subject, value):
+        if event == DEFINE_INTERFACE:
+            self.interfaces[qualified_name(subject)] += value
+        elif event == CHECK_DEFAULTS:
+            self.default_checks[qualified_name(subject)] += value
+        elif event == VERIFY:
+            iface, impl = subject
+            self.verifications[qualified_name(iface), qualified_name(impl)] += value
+        else:
+            self.counts[event] += value
+
+    def _totals_by(self, index):
+        out = defaultdict(float)
+        for key, seconds in self.verifications.items():
+            out[key[index]] += seconds
+        return out
+
+    @property
+    def verifications_by_interface(self):
+        """Seconds spent verifying implementations of each interface."""
+        return self._totals_by(0)
+
+    @property
+    def verifications_by_implementation(self):
+        """Seconds spent verifying each implementation."""
+        return self._totals_by(1)
+
+    def as_dict(self):
+        return {
+            "interfaces": dict(self.interfaces),
+            "default_checks": dict(self.default_checks),
+            "verifications": [
+                {"interface": iface, "implementation": impl, "seconds": seconds}
+                for (iface, impl), seconds in sorted(self.verifications.items())
+            ],
+            "verifications_by_interface": dict(self.verifications_by_interface),
+            "verifications_by_implementation": dict(
+                self.verifications_by_implementation
+            ),
+            "counts": dict(self.counts),
+        }
+
+    def to_json(self, **kwargs):
+        """Dump our data as a JSON string.
+
+        ``kwargs`` are forwarded to ``json.dumps``.
+        """
+        kwargs.setdefault("sort_keys", True)
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def report(self, limit=None):
+        """Format our data as a human-readable report.
+
+        Timings are sorted from slowest to fastest.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of entries to show in each section.
+        """
+        sections = [
+            ("Interface definitions", self.interfaces),
+            ("Default checks", self.default_checks),
+            ("Verification time by interface", self.verifications_by_interface),
+            (
+                "Verification time by implementation",
+                self.verifications_by_implementation,
+            ),
+        ]
+        lines = []
+        for title, timings in sections:
+            lines.append(
+                "{} ({} total, {:.3f}ms):".format(
+                    title, len(timings), sum(timings.values()) * 1000
+                )
+            )
+            ranked = sorted(timings.items(), key=lambda item: (-item[1], item[0]))
+            for name, seconds in ranked[:limit]:
+                lines.append("  {:10.3f}ms  {}".format(seconds * 1000, name))
+            lines.append("")
+
+        lines.append("Counts:")
+        for name, count in sorted(self.counts.items()):
+            lines.append("  {:>10}  {}".format(count, name))
+        return "\n".join(lines)
+
+
+@contextmanager
+def record():
+    """
+    Context manager that records instrumentation events into a
+    :class:`Profile`.
+    """
+    profile = Profile()
+    add_listener(profile)
+    try:
+        yield profile
+    finally:
+        remove_listener(profile)
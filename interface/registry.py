@@ -0,0 +1,97 @@
+"""
+Process-wide index of interfaces and their implementations.
+
+All entries are held weakly, so registering a class never keeps it alive.
+"""
+from collections import defaultdict
+from weakref import WeakKeyDictionary, WeakSet
+
+
+class Registry(object):
+    """
+    Index of interfaces and implementations.
+
+    Attributes
+    ----------
+    version : int
+        Counter that's incremented whenever an implementation is registered.
+        Caches that depend on the set of known implementations can compare
+        this against a saved value to detect when they need to be cleared.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._interfaces_by_member = defaultdict(WeakSet)
+        self._implementations = WeakKeyDictionary()
+        self._interfaces = WeakKeyDictionary()
+
+    def add_interface(self, iface):
+        """Register a new interface."""
+        for name in iface._signatures:
+            self._interfaces_by_member[name].add(iface)
+
+    def add_implementation(self, impl, interfaces):
+        """
+        Register a new implementation.
+
+        Parameters
+        ----------
+        impl : type
+            The implementation to register.
+        interfaces : tuple[InterfaceMeta]
+            All interfaces provided by ``impl``, including parents of the
+            interfaces it declares.
+        """
+        self._interfaces[impl] = interfaces
+        for iface in interfaces:
+            try:
+                impls = self._implementations[iface]
+            except KeyError:
+                impls = self._implementations[iface] = WeakSet()
+            impls.add(impl)
+        self.version += 1
+
+    def interfaces_requiring(self, name):
+        """
+        Get the interfaces that require a member named ``name``.
+
+        Returns
+        -------
+        interfaces : frozenset[InterfaceMeta]
+        """
+        return frozenset(self._interfaces_by_member.get(name, ()))
+
+    def implementations_of(self, iface):
+        """
+        Get the implementations of ``iface``.
+
+        Implementations of interfaces that subclass ``iface`` are included.
+
+        Returns
+        -------
+        implementations : frozenset[type]
+        """
+        try:
+            return frozenset(self._implementations[iface])
+        except KeyError:
+            return frozenset()
+
+    def interfaces_of(self, impl):
+        """
+        Get the interfaces provided by ``impl``.
+
+        Parents of the interfaces declared by ``impl`` are included.
+
+        Returns
+        -------
+        interfaces : tuple[InterfaceMeta]
+            Interfaces provided by ``impl``, or an empty tuple if ``impl``
+            isn't a registered implementation.
+        """
+        try:
+            return self._interfaces[impl]
+        except (KeyError, TypeError):
+            return ()
+
+
+registry = Registry()
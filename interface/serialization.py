@@ -0,0 +1,493 @@
+"""
+Compact, serializable summaries of interface signatures, and an on-disk cache
+of them.
+
+Parsing signatures with ``inspect.signature`` is a significant part of the cost
+of defining an interface. Setting the ``INTERFACE_SIGNATURE_CACHE_DIR``
+environment variable to a directory (or setting ``signature_tables.directory``)
+makes interfaces save their signature tables there, keyed by a hash of the
+source of the module that defines them. Later processes that import the same
+source load the saved tables instead of inspecting the interface's members.
+Sources are hashed again whenever their size or modification time changes, so
+modules that are edited and reloaded get fresh tables.
+
+Summary Format
+--------------
+An interface's signature table is a JSON object mapping member names to
+``[line, summary]`` pairs, where ``line`` is the line on which the member's
+function is defined. Each summary is a list of the form::
+
+    [member_type, [[name, kind, has_default, annotation], ...], return_annotation]
+
+``member_type`` is the qualified name of the member's type (e.g.
+``"builtins.function"`` or ``"builtins.property"``). ``kind`` is the integer
+value of the parameter's ``inspect.Parameter`` kind. Annotations are encoded
+as:
+
+- ``null``, for parameters without an annotation.
+- ``["none"]``, for an annotation of None.
+- ``["str", value]``, for string annotations.
+- ``["ref", module, qualname]``, for annotations that can be imported by name.
+
+Members whose annotations can't be encoded aren't cached; they're inspected
+every time their interface is defined.
+
+Only members defined by functions in the body of an interface that's defined
+at module scope are cached, since the module's source fully determines their
+signatures. Entries whose lines, member types, parameters, or annotations no
+longer match their functions are ignored and recomputed.
+"""
+from hashlib import sha256
+import importlib
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+import json
+import os
+import sys
+import types
+
+from .compat import Parameter
+from .typecheck import compile_parameters
+from .typed_signature import _inner_extract_func, _member_type, TypedSignature
+
+FORMAT_VERSION = 1
+ENVIRONMENT_VARIABLE = "INTERFACE_SIGNATURE_CACHE_DIR"
+
+_KINDS = {
+    int(kind): kind
+    for kind in (
+        Parameter.POSITIONAL_ONLY,
+        Parameter.POSITIONAL_OR_KEYWORD,
+        Parameter.VAR_POSITIONAL,
+        Parameter.KEYWORD_ONLY,
+        Parameter.VAR_KEYWORD,
+    )
+}
+
+
+class Unserializable(Exception):
+    """Raised when a value can't be encoded in a signature summary."""
+
+
+def _type_name(t):
+    return "{}.{}".format(t.__module__, getattr(t, "__qualname__", t.__name__))
+
+
+def _import_name(module, qualname):
+    obj = importlib.import_module(module)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def dump_annotation(annotation):
+    """Encode an annotation as a JSON-serializable value."""
+    if annotation is Parameter.empty:
+        return None
+    if annotation is None:
+        return ["none"]
+    if isinstance(annotation, str):
+        return ["str", annotation]
+
+    module = getattr(annotation, "__module__", None)
+    qualname = getattr(annotation, "__qualname__", None)
+    if isinstance(module, str) and isinstance(qualname, str):
+        try:
+            resolved = _import_name(module, qualname)
+        except (ImportError, AttributeError):
+            pass
+        else:
+            if resolved is annotation:
+                return ["ref", module, qualname]
+
+    raise Unserializable(annotation)
+
+
+def load_annotation(data):
+    """
+    Decode an annotation encoded by :func:`dump_annotation`.
+
+    Raises
+    ------
+    Unserializable
+        If ``data`` is malformed or refers to a name that can't be imported.
+    """
+    if data is None:
+        return Parameter.empty
+    try:
+        tag = data[0]
+        if tag == "none":
+            return None
+        elif tag == "str":
+            return data[1]
+        elif tag == "ref":
+            return _import_name(data[1], data[2])
+    except (ImportError, AttributeError, IndexError, KeyError, TypeError):
+        pass
+    raise Unserializable(data)
+
+
+def summarize(typed_signature):
+    """
+    Build a JSON-serializable summary of a
+    :class:`~interface.typed_signature.TypedSignature`.
+
+    Raises
+    ------
+    Unserializable
+        If any of the signature's annotations can't be encoded.
+    """
+    sig = typed_signature.signature
+    return [
+        _type_name(typed_signature.type),
+        [
+            [
+                p.name,
+                int(p.kind),
+                p.default is not Parameter.empty,
+                dump_annotation(p.annotation),
+            ]
+            for p in sig.parameters.values()
+        ],
+        dump_annotation(sig.return_annotation),
+    ]
+
+
+def load_summary(obj, summary):
+    """
+    Build a :class:`~interface.typed_signature.TypedSignature` for ``obj``
+    from a summary produced by :func:`summarize`, without inspecting ``obj``.
+
+    Raises
+    ------
+    Unserializable
+        If ``summary`` is malformed, or doesn't describe a member of the same
+        type as ``obj``.
+    """
+    try:
+        type_name, params, return_annotation = summary
+        if type_name != _type_name(_member_type(obj)):
+            raise Unserializable(summary)
+        plan = compile_parameters(
+            (
+                (name, _KINDS[kind], bool(has_default), load_annotation(annotation))
+                for name, kind, has_default, annotation in params
+            ),
+            load_annotation(return_annotation),
+        )
+    except (KeyError, TypeError, ValueError):
+        raise Unserializable(summary)
+    return TypedSignature.from_plan(obj, plan)
+
+
+_POSITIONAL_ONLY = int(Parameter.POSITIONAL_ONLY)
+_POSITIONAL_OR_KEYWORD = int(Parameter.POSITIONAL_OR_KEYWORD)
+_VAR_POSITIONAL = int(Parameter.VAR_POSITIONAL)
+_KEYWORD_ONLY = int(Parameter.KEYWORD_ONLY)
+_VAR_KEYWORD = int(Parameter.VAR_KEYWORD)
+
+
+def _code_parameters(func):
+    """
+    Get the ``(name, kind, has_default, annotated)`` of each of ``func``'s
+    parameters, from its code object instead of ``inspect.signature``.
+    """
+    code = func.__code__
+    names = code.co_varnames
+    npositional = code.co_argcount
+    nposonly = getattr(code, "co_posonlyargcount", 0)
+    nkwonly = getattr(code, "co_kwonlyargcount", 0)
+    first_default = npositional - len(func.__defaults__ or ())
+    kwdefaults = getattr(func, "__kwdefaults__", None) or ()
+    annotations = getattr(func, "__annotations__", None) or ()
+
+    params = [
+        (
+            name,
+            _POSITIONAL_ONLY if i < nposonly else _POSITIONAL_OR_KEYWORD,
+            i >= first_default,
+            name in annotations,
+        )
+        for i, name in enumerate(names[:npositional])
+    ]
+    i = npositional + nkwonly
+    if code.co_flags & CO_VARARGS:
+        params.append((names[i], _VAR_POSITIONAL, False, names[i] in annotations))
+        i += 1
+    params.extend(
+        (name, _KEYWORD_ONLY, name in kwdefaults, name in annotations)
+        for name in names[npositional : npositional + nkwonly]
+    )
+    if code.co_flags & CO_VARKEYWORDS:
+        params.append((names[i], _VAR_KEYWORD, False, names[i] in annotations))
+    return params
+
+
+def _describes(summary, func):
+    """
+    Check whether a saved summary has the same parameters as ``func``.
+
+    Summaries are saved by line number, which doesn't change when a function's
+    signature is edited in place.
+    """
+    _, params, return_annotation = summary
+    actual = _code_parameters(func)
+    if len(params) != len(actual):
+        return False
+    for saved, param in zip(params, actual):
+        name, kind, has_default, annotation = saved
+        if (name, kind, bool(has_default), annotation is not None) != param:
+            return False
+    annotations = getattr(func, "__annotations__", None) or ()
+    return ("return" in annotations) == (return_annotation is not None)
+
+
+class SignatureTable(object):
+    """
+    Saved signatures for a single interface.
+
+    Parameters
+    ----------
+    cache : SignatureTableCache
+        The cache that owns this table.
+    path : str
+        Path to the file in which the table's module is stored.
+    filename : str
+        Path to the source file of the module that defines the interface.
+    qualname : str
+        Qualified name of the interface.
+    entries : dict[str -> list]
+        Saved ``[line, summary]`` pairs, keyed by member name.
+    """
+
+    def __init__(self, cache, path, filename, qualname, entries):
+        self._cache = cache
+        self._path = path
+        self._filename = filename
+        self._qualname = qualname
+        self._entries = entries
+        self._dirty = False
+
+    def _function(self, obj):
+        """
+        Get the function behind ``obj``, or None if ``obj`` isn't a function
+        defined in the body of our interface.
+        """
+        func = _inner_extract_func(obj)
+        if not isinstance(func, types.FunctionType):
+            return None
+        if hasattr(func, "__wrapped__") or hasattr(func, "__signature__"):
+            # The signature might come from another module.
+            return None
+        code = func.__code__
+        if code.co_filename != self._filename or not getattr(
+            func, "__qualname__", ""
+        ).startswith(self._qualname + "."):
+            return None
+        return func
+
+    def signature(self, name, obj):
+        """
+        Get a TypedSignature for member ``name`` of our interface.
+
+        The saved summary is used if there is one and it's still valid.
+        Otherwise, the signature is computed and, if possible, saved.
+        """
+        func = self._function(obj)
+        if func is None:
+            return TypedSignature(obj)
+
+        line = func.__code__.co_firstlineno
+        entry = self._entries.get(name)
+        if entry is not None:
+            try:
+                saved_line, summary = entry
+                if saved_line == line and _describes(summary, func):
+                    return load_summary(obj, summary)
+            except (TypeError, ValueError, Unserializable):
+                pass
+
+        result = TypedSignature(obj)
+        try:
+            self._entries[name] = [line, summarize(result)]
+        except Unserializable:
+            if self._entries.pop(name, None) is None:
+                return result
+        self._dirty = True
+        return result
+
+    def save(self):
+        """Write the table to disk if it's changed."""
+        if self._dirty:
+            self._cache._save(self._path)
+            self._dirty = False
+
+
+class SignatureTableCache(object):
+    """
+    On-disk cache of interface signature tables.
+
+    Each module that defines interfaces gets a single JSON file, named after
+    the module and a hash of its source. Errors reading or writing the cache
+    are ignored.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory in which to store signature tables. Default is to read the
+        ``INTERFACE_SIGNATURE_CACHE_DIR`` environment variable when tables are
+        opened. If neither is set, caching is disabled.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        # Path -> {interface qualname -> {member name -> summary}}.
+        self._documents = {}
+        # (directory, module name) -> (stat of source, (filename, path)).
+        self._locations = {}
+
+    def _directory(self):
+        return self.directory or os.environ.get(ENVIRONMENT_VARIABLE)
+
+    def _locate(self, directory, module_name):
+        """
+        Get the source filename of ``module_name``, and the path of the file
+        in which its tables are stored, or None if it can't be cached.
+
+        Modules can be edited and reloaded, so the source is hashed again
+        whenever its size or modification time changes.
+        """
+        module = sys.modules.get(module_name)
+        filename = getattr(module, "__file__", None)
+        if filename is None or not filename.endswith(".py"):
+            return None
+        try:
+            stat = os.stat(filename)
+        except (IOError, OSError):
+            return None
+        stamp = (
+            filename,
+            getattr(stat, "st_mtime_ns", stat.st_mtime),
+            stat.st_size,
+        )
+
+        key = (directory, module_name)
+        try:
+            saved_stamp, location = self._locations[key]
+        except KeyError:
+            pass
+        else:
+            if saved_stamp == stamp:
+                return location
+
+        try:
+            with open(filename, "rb") as f:
+                digest = sha256(f.read()).hexdigest()[:32]
+        except (IOError, OSError):
+            return None
+        path = os.path.join(directory, "{}-{}.json".format(module_name, digest))
+        location = (filename, path)
+        self._locations[key] = (stamp, location)
+        return location
+
+    def _load(self, path, module_name):
+        try:
+            return self._documents[path]
+        except KeyError:
+            pass
+
+        interfaces = {}
+        try:
+            with open(path) as f:
+                document = json.load(f)
+        except (IOError, OSError, ValueError):
+            pass
+        else:
+            if (
+                isinstance(document, dict)
+                and document.get("format_version") == FORMAT_VERSION
+                and document.get("module") == module_name
+                and isinstance(document.get("interfaces"), dict)
+            ):
+                interfaces = document["interfaces"]
+
+        self._documents[path] = (module_name, interfaces)
+        return self._documents[path]
+
+    def open(self, clsdict):
+        """
+        Open the signature table for an interface that's being defined.
+
+        Parameters
+        ----------
+        clsdict : dict
+            The class body of the new interface.
+
+        Returns
+        -------
+        table : SignatureTable or None
+            None if caching is disabled, or the interface isn't eligible for
+            caching.
+        """
+        directory = self._directory()
+        if not directory:
+            return None
+
+        module_name = clsdict.get("__module__")
+        qualname = clsdict.get("__qualname__")
+        if module_name is None or qualname is None or "<locals>" in qualname:
+            return None
+
+        location = self._locate(directory, module_name)
+        if location is None:
+            return None
+
+        filename, path = location
+        _, interfaces = self._load(path, module_name)
+        entries = interfaces.get(qualname)
+        if not isinstance(entries, dict):
+            entries = interfaces[qualname] = {}
+        return SignatureTable(self, path, filename, qualname, entries)
+
+    def _save(self, path):
+        module_name, interfaces = self._documents[path]
+        document = {
+            "format_version": FORMAT_VERSION,
+            "module": module_name,
+            "interfaces": interfaces,
+        }
+        directory = os.path.dirname(path)
+        tmp = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(tmp, "w") as f:
+                json.dump(document, f, sort_keys=True, separators=(",", ":"))
+            # Atomically replace any existing file, so that concurrent readers
+            # never see a partially-written table.
+            os.rename(tmp, path)
+        except (IOError, OSError):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+        # Remove tables saved for old versions of the module's source.
+        prefix = module_name + "-"
+        for entry in os.listdir(directory):
+            old = os.path.join(directory, entry)
+            if entry.startswith(prefix) and entry.endswith(".json") and old != path:
+                digest = entry[len(prefix) : -len(".json")]
+                if len(digest) == 32 and digest.isalnum():
+                    try:
+                        os.remove(old)
+                    except OSError:
+                        pass
+
+    def clear(self):
+        """Forget tables loaded into memory. Files on disk are left alone."""
+        self._documents.clear()
+        self._locations.clear()
+
+
+signature_tables = SignatureTableCache()
@@ -0,0 +1,261 @@
+"""
+Subtype checks between type annotations.
+
+:func:`is_subtype` understands classes, ``None``, ``typing.Any``, ``Union`` and
+``Optional`` (including ``X | Y`` on Python 3.10+), ``Callable``, and
+parameterized generics like ``List[int]`` and ``Mapping[str, int]``.
+Annotations it doesn't understand, such as strings, are only subtypes of
+annotations they compare equal to.
+
+Checks can be expensive, so results are memoized in a bounded LRU cache.
+"""
+import collections
+
+from .utils import LRUCache
+
+try:
+    from collections import abc
+except ImportError:  # pragma: nocover
+    abc = collections
+
+try:
+    import typing
+except ImportError:  # pragma: nocover
+    # Python 2 doesn't have annotations, so there's nothing to understand.
+    typing = None
+
+try:
+    from types import UnionType as _UnionType
+except ImportError:  # pragma: nocover
+    _UnionType = None
+
+_NoneType = type(None)
+
+_Any = getattr(typing, "Any", object)
+_Union = getattr(typing, "Union", None)
+
+# Generic classes whose type parameters are all covariant. Parameters of other
+# generics are treated as invariant, except as noted in _MAPPINGS.
+_COVARIANT = frozenset(
+    [
+        tuple,
+        frozenset,
+        type,
+        abc.Container,
+        abc.Collection if hasattr(abc, "Collection") else abc.Container,
+        abc.Iterable,
+        abc.Iterator,
+        abc.Reversible if hasattr(abc, "Reversible") else abc.Iterable,
+        abc.Sequence,
+        abc.Set,
+        abc.KeysView,
+        abc.ValuesView,
+        abc.ItemsView,
+    ]
+)
+
+# Generic classes with an invariant key type and a covariant value type.
+_MAPPINGS = frozenset([abc.Mapping])
+
+
+def _get_origin(tp):
+    get_origin = getattr(typing, "get_origin", None)
+    if get_origin is not None:
+        return get_origin(tp)
+    return getattr(tp, "__origin__", None)  # pragma: nocover
+
+
+def _get_args(tp):
+    get_args = getattr(typing, "get_args", None)
+    if get_args is not None:
+        return get_args(tp)
+    return getattr(tp, "__args__", None) or ()  # pragma: nocover
+
+
+def _is_union(origin):
+    return origin is not None and (origin is _Union or origin is _UnionType)
+
+
+def _normalize(tp):
+    if tp is None:
+        return _NoneType
+    return tp
+
+
+class SubtypeOracle(object):
+    """
+    Memoized subtype checks between annotations.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of results to remember.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether results are memoized.
+    hits : int
+        Number of checks answered from the cache.
+    misses : int
+        Number of checks that had to be computed.
+
+    Notes
+    -----
+    Results are keyed on the identities of the annotations being compared, and
+    each entry keeps its annotations alive until it's evicted.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def maxsize(self):
+        return self._cache.maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        self._cache.maxsize = value
+
+    def is_subtype(self, sub, sup):
+        """
+        Check whether every value of type ``sub`` is also a value of type
+        ``sup``.
+        """
+        if sub is sup:
+            return True
+        if not self.enabled:
+            return self._compute(sub, sup)
+
+        # Hashing and comparing typing constructs is slow, so results are keyed
+        # on identity. Entries hold references to both annotations, so their
+        # ids can't be reused while they're cached.
+        key = (id(sub), id(sup))
+        try:
+            _, _, result = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self._compute(sub, sup)
+        self._cache[key] = (sub, sup, result)
+        return result
+
+    def clear(self):
+        """Forget all cached results."""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def _compute(self, sub, sup):
+        try:
+            if sub == sup:
+                return True
+        except Exception:
+            # Some objects have unusual __eq__ methods.
+            pass
+
+        sub = _normalize(sub)
+        sup = _normalize(sup)
+        if sub is sup or sup is _Any or sup is object or sub is _Any:
+            return True
+
+        sub_origin = _get_origin(sub)
+        sup_origin = _get_origin(sup)
+
+        if _is_union(sub_origin):
+            return all(self.is_subtype(arg, sup) for arg in _get_args(sub))
+        if _is_union(sup_origin):
+            return any(self.is_subtype(sub, arg) for arg in _get_args(sup))
+
+        if sup_origin is None:
+            if not isinstance(sup, type):
+                # Strings, TypeVars, and other things we don't understand.
+                return False
+            # Parameterized generics are subtypes of their unparameterized
+            # classes.
+            sub_class = sub_origin if sub_origin is not None else sub
+            return _issubclass(sub_class, sup)
+
+        if sub_origin is None:
+            # An unparameterized class is treated as being parameterized with
+            # Any, which is compatible with everything.
+            return isinstance(sub, type) and _issubclass(sub, sup_origin)
+
+        if not _issubclass(sub_origin, sup_origin):
+            return False
+        return self._args_compatible(sup_origin, _get_args(sub), _get_args(sup))
+
+    def _args_compatible(self, origin, sub_args, sup_args):
+        if not sub_args or not sup_args:
+            return True
+
+        if origin is abc.Callable:
+            sub_params, sub_return = _callable_args(sub_args)
+            sup_params, sup_return = _callable_args(sup_args)
+            if not self.is_subtype(sub_return, sup_return):
+                return False
+            if sup_params is Ellipsis or sub_params is Ellipsis:
+                return True
+            # Parameters are contravariant.
+            return len(sub_params) == len(sup_params) and all(
+                self.is_subtype(sup_param, sub_param)
+                for sub_param, sup_param in zip(sub_params, sup_params)
+            )
+
+        if origin is tuple and (Ellipsis in sub_args or Ellipsis in sup_args):
+            if sup_args[-1:] == (Ellipsis,):
+                if sub_args[-1:] == (Ellipsis,):
+                    sub_args = sub_args[:-1]
+                return all(self.is_subtype(arg, sup_args[0]) for arg in sub_args)
+            return False
+
+        if len(sub_args) != len(sup_args):
+            return False
+
+        if origin in _COVARIANT:
+            return all(map(self.is_subtype, sub_args, sup_args))
+        if origin in _MAPPINGS:
+            return _equal(sub_args[0], sup_args[0]) and self.is_subtype(
+                sub_args[1], sup_args[1]
+            )
+        return all(map(_equal, sub_args, sup_args))
+
+
+def _callable_args(args):
+    """
+    Split the arguments of a ``Callable`` into its parameter types (or
+    ``Ellipsis``) and its return type.
+    """
+    if len(args) == 2 and (args[0] is Ellipsis or isinstance(args[0], list)):
+        return args
+    # Without typing.get_args, Callable[[A, B], R] has arguments (A, B, R).
+    return list(args[:-1]), args[-1]  # pragma: nocover
+
+
+def _equal(a, b):
+    return a is b or a == b
+
+
+def _issubclass(sub, sup):
+    try:
+        return issubclass(sub, sup)
+    except TypeError:
+        return False
+
+
+subtype_oracle = SubtypeOracle()
+
+
+def is_subtype(sub, sup):
+    """
+    Check whether every value of type ``sub`` is also a value of type ``sup``.
+
+    Results are memoized by ``subtype_oracle``.
+    """
+    return subtype_oracle.is_subtype(sub, sup)
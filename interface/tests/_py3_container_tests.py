@@ -0,0 +1,34 @@
+import pytest
+
+from ..container import Container, ResolutionError
+from .test_container import Clock, FixedClock, ListLogger, Logger
+
+
+def test_dependencies_from_annotations():
+    class AnnotatedLogger(ListLogger):
+        def __init__(self, clock: Clock, prefix: str = "> ", *, also: Clock):
+            super().__init__(clock)
+            self.prefix = prefix
+            self.also = also
+
+    container = Container()
+    container.register(Clock, FixedClock, singleton=True)
+    container.register(Logger, AnnotatedLogger)
+
+    logger = container.resolve(Logger)
+    assert logger.clock is logger.also is container.resolve(Clock)
+    assert logger.prefix == "> "
+
+
+def test_positional_only_dependencies():
+    namespace = {}
+    try:
+        exec("def make_logger(clock: Clock, /): pass", {"Clock": Clock}, namespace)
+    except SyntaxError:  # pragma: nocover
+        pytest.skip("Positional-only parameters require Python 3.8")
+
+    container = Container()
+    container.register(Clock, FixedClock)
+    container.register(Logger, namespace["make_logger"])
+    with pytest.raises(ResolutionError):
+        container.freeze()
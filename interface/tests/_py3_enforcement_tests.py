@@ -0,0 +1,302 @@
+import sys
+from inspect import signature
+
+import pytest
+
+from .. import enforcement
+from ..enforcement import ContractViolation, contract_stats, reset_contract_stats
+from ..interface import default, implements, Interface
+
+
+class Enforced(Interface):
+    _INTERFACE_ENFORCE_TYPES = True
+
+    def method(self, a: int, b: str = None, *args: float, c: (int, str), **kw: bool):
+        pass  # pragma: nocover
+
+    def returns(self) -> int:
+        pass  # pragma: nocover
+
+    def unannotated(self, a, b):
+        pass  # pragma: nocover
+
+    @staticmethod
+    def static(a: int) -> None:
+        pass  # pragma: nocover
+
+    @classmethod
+    def cm(cls, a: "int") -> list:
+        pass  # pragma: nocover
+
+    @property
+    def prop(self) -> int:
+        pass  # pragma: nocover
+
+    @default
+    def defaulted(self, a: int) -> int:
+        return a
+
+
+def make_impl(returns=1, prop=1):
+    class Impl(implements(Enforced)):
+        def method(
+            self, a: int, b: str = None, *args: float, c: (int, str), d=4, **kw: bool
+        ):
+            return (a, b, args, c, d, kw)
+
+        def returns(self):
+            return returns
+
+        def unannotated(self, a, b):
+            return a, b
+
+        @staticmethod
+        def static(a: int):
+            pass  # pragma: nocover
+
+        @classmethod
+        def cm(cls, a: "int"):
+            return [cls, a]
+
+        @property
+        def prop(self):
+            return prop
+
+    return Impl
+
+
+def test_enforced_arguments():
+    Impl = make_impl()
+    impl = Impl()
+
+    assert impl.method(1, "b", 1.0, 2.0, c="c", d="d", x=True) == (
+        1,
+        "b",
+        (1.0, 2.0),
+        "c",
+        "d",
+        {"x": True},
+    )
+    # Defaults don't have to match annotations.
+    assert impl.method(1, c=2) == (1, None, (), 2, 4, {})
+    assert impl.method(a=1, b="b", c=2) == (1, "b", (), 2, 4, {})
+    assert impl.defaulted(1) == 1
+
+    failures = [
+        (lambda: impl.method("1", c=2), "argument 'a' must be int, not str"),
+        (lambda: impl.method(1, 2, c=2), "argument 'b' must be str, not int"),
+        (lambda: impl.method(1, "b", 1, c=2), "argument 'args' must be float, not int"),
+        (lambda: impl.method(1, c=1.0), "argument 'c' must be int or str, not float"),
+        (lambda: impl.method(1, c=1, x=1), "argument 'kw' must be bool, not int"),
+        (lambda: Impl.static("a"), "argument 'a' must be int, not str"),
+        (lambda: impl.defaulted("a"), "argument 'a' must be int, not str"),
+    ]
+    for call, message in failures:
+        with pytest.raises(ContractViolation) as e:
+            call()
+        assert message in str(e.value)
+        assert isinstance(e.value, TypeError)
+
+    # Calls that don't match the signature still fail the usual way.
+    with pytest.raises(TypeError) as e:
+        impl.method(1)
+    assert not isinstance(e.value, ContractViolation)
+
+
+def test_enforced_return_values():
+    assert make_impl()().returns() == 1
+    assert make_impl()().prop == 1
+
+    with pytest.raises(ContractViolation) as e:
+        make_impl(returns="1")().returns()
+    assert str(e.value) == "Impl.returns() must return int, not str"
+
+    with pytest.raises(ContractViolation) as e:
+        make_impl(prop=None)().prop
+    assert str(e.value) == "Impl.prop() must return int, not NoneType"
+
+
+def test_enforcement_wraps_only_annotated_members():
+    Impl = make_impl()
+
+    # No checkable annotations.
+    assert not hasattr(Impl.__dict__["unannotated"], "__wrapped__")
+    assert Impl().unannotated("a", "b") == ("a", "b")
+
+    # String annotations aren't checked, but the return value is.
+    assert Impl.cm("a") == [Impl, "a"]
+
+    for name in ("method", "returns", "defaulted"):
+        wrapper = getattr(Impl, name)
+        assert wrapper.__name__ == name
+        assert signature(wrapper) == signature(wrapper.__wrapped__)
+
+
+def test_enforced_keyword_only_arguments():
+    class I(Interface):
+        _INTERFACE_ENFORCE_TYPES = True
+
+        def f(self, *, a: int, b=None):
+            pass  # pragma: nocover
+
+    class C(implements(I)):
+        def f(self, *, a: int, b=None):
+            return a, b
+
+    assert signature(C.f) == signature(C.f.__wrapped__)
+    assert C().f(a=1) == (1, None)
+    with pytest.raises(ContractViolation) as e:
+        C().f(a="1", b=2)
+    assert "argument 'a' must be int, not str" in str(e.value)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="/ requires Python 3.8")
+def test_enforced_positional_only_arguments():  # pragma: nocover
+    namespace = {}
+    exec("def f(self, a: int, /, b: int = 0):\n    return a, b\n", namespace)
+    f = namespace["f"]
+
+    I = type("I", (Interface,), {"_INTERFACE_ENFORCE_TYPES": True, "f": f})
+    C = type("C", (implements(I),), {"f": f})
+
+    assert signature(C.f) == signature(f)
+    assert C().f(1, b=2) == (1, 2)
+    with pytest.raises(TypeError):
+        C().f(a=1)
+    with pytest.raises(ContractViolation) as e:
+        C().f("1")
+    assert "argument 'a' must be int, not str" in str(e.value)
+
+
+def test_enforcement_isnt_repeated_for_subclasses():
+    Impl = make_impl()
+
+    class Sub(Impl):
+        def returns(self):
+            return "not an int"
+
+    # Inherited methods are already wrapped.
+    assert "method" not in Sub.__dict__
+    with pytest.raises(ContractViolation):
+        Sub().returns()
+    assert not hasattr(Sub.__dict__["returns"].__wrapped__, "__wrapped__")
+
+
+def test_enforcement_from_environment(monkeypatch):
+    class I(Interface):
+        def f(self, x: int):
+            pass  # pragma: nocover
+
+    def f(self, x: int):
+        return x
+
+    C = type("C", (implements(I),), {"f": f})
+    assert C.__dict__["f"] is f
+    assert C().f("x") == "x"
+
+    monkeypatch.setenv("INTERFACE_ENFORCE_TYPES", "1")
+    C = type("C", (implements(I),), {"f": f})
+    assert C.__dict__["f"] is not f
+    with pytest.raises(ContractViolation):
+        C().f("x")
+
+
+class Sampled(Interface):
+    _INTERFACE_SAMPLE_CONTRACTS = 3
+
+    def method(self, a: int) -> int:
+        pass  # pragma: nocover
+
+
+def make_sampled_impl(name):
+    def method(self, a: int):
+        return a
+
+    # Stats are keyed by name, so every test needs its own class name.
+    base = implements(Sampled)
+    return type(base)(name, (base,), {"method": method})
+
+
+def stats_for(impl, method="method"):
+    return contract_stats()["{}.{}.{}".format(impl.__module__, impl.__name__, method)]
+
+
+def test_sampled_contracts(monkeypatch):
+    monkeypatch.setattr(enforcement, "MAX_SAMPLES_PER_SECOND", float("inf"))
+    Impl = make_sampled_impl("Counted")
+    impl = Impl()
+
+    for _ in range(10):
+        # Violations are counted, not raised.
+        assert impl.method("a") == "a"
+
+    # The first call is always sampled, then every third.
+    assert stats_for(Impl) == {
+        "interval": 3,
+        "calls": 10,
+        "samples": 4,
+        "violations": {"a": 4, "return": 4},
+    }
+
+    impl.method(1)
+    impl.method(1)
+    impl.method(1)
+    assert stats_for(Impl)["violations"] == {"a": 4, "return": 4}
+    assert stats_for(Impl)["samples"] == 5
+
+    reset_contract_stats()
+    assert stats_for(Impl) == {
+        "interval": 3,
+        "calls": 0,
+        "samples": 0,
+        "violations": {},
+    }
+    impl.method(1)
+    assert stats_for(Impl)["calls"] == 1
+
+
+def test_sampling_adapts_to_load(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(enforcement, "timer", lambda: now[0])
+    monkeypatch.setattr(enforcement, "MAX_SAMPLES_PER_SECOND", 10)
+    Impl = make_sampled_impl("Adaptive")
+    impl = Impl()
+
+    # One call in a millisecond is 1000 calls per second, so we need to
+    # sample one in 100 to stay within budget.
+    now[0] = 0.001
+    impl.method(1)
+    assert stats_for(Impl)["interval"] == 100
+
+    # 100 calls in 100 seconds is slow enough to go back to the configured
+    # interval.
+    now[0] = 100.001
+    for _ in range(100):
+        impl.method(1)
+    assert stats_for(Impl)["interval"] == 3
+    assert stats_for(Impl)["samples"] == 2
+
+
+def test_sampling_from_environment(monkeypatch):
+    class I(Interface):
+        def f(self, x: int):
+            pass  # pragma: nocover
+
+    def f(self, x: int):
+        return x
+
+    monkeypatch.setenv("INTERFACE_SAMPLE_CONTRACTS", "not a number")
+    C = type("C", (implements(I),), {"f": f})
+    assert C.__dict__["f"] is f
+
+    monkeypatch.setenv("INTERFACE_SAMPLE_CONTRACTS", "2")
+    C = type("FromEnvironment", (implements(I),), {"f": f})
+    assert C.__dict__["f"] is not f
+    assert C().f("x") == "x"
+    assert stats_for(C, "f")["violations"] == {"x": 1}
+
+    # Full enforcement takes precedence over sampling.
+    monkeypatch.setenv("INTERFACE_ENFORCE_TYPES", "1")
+    C = type("C", (implements(I),), {"f": f})
+    with pytest.raises(ContractViolation):
+        C().f("x")
@@ -1,4 +1,15 @@
-from ..typecheck import compatible
+from itertools import product, starmap, takewhile
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+from ..compat import zip_longest
+from ..functional import complement, dzip, valfilter
+from ..typecheck import (
+    _annotation_accepts,
+    _POSITIONALS,
+    compatible,
+    has_default,
+    return_annotations_compatible,
+)
 from ..typed_signature import TypedSignature
 
 
@@ -52,3 +63,213 @@ def test_disallow_kwonly_to_positional():
 
     assert not compatible(foo, bar)
     assert not compatible(bar, foo)
+
+
+def is_positional(arg):
+    return arg.kind in _POSITIONALS
+
+
+def params_compatible(impl, iface):
+    if impl is None:
+        return False
+
+    if iface is None:
+        return has_default(impl)
+
+    return (
+        impl.name == iface.name
+        and impl.kind == iface.kind
+        and has_default(impl) == has_default(iface)
+        and _annotation_accepts(impl.annotation, iface.annotation)
+    )
+
+
+def reference_compatible(impl_sig, iface_sig):
+    """
+    Check compatibility by walking inspect.Parameter objects directly.
+
+    This is what ``compatible`` did before signatures were compiled into
+    acceptance plans. It's also used by ``benchmarks.bench_typecheck``.
+    """
+    impl_params = impl_sig.signature.parameters
+    iface_params = iface_sig.signature.parameters
+    impl_keywords = valfilter(complement(is_positional), impl_params)
+    iface_keywords = valfilter(complement(is_positional), iface_params)
+    return (
+        all(
+            starmap(
+                params_compatible,
+                zip_longest(
+                    takewhile(is_positional, impl_params.values()),
+                    takewhile(is_positional, iface_params.values()),
+                ),
+            )
+        )
+        and all(
+            starmap(params_compatible, dzip(impl_keywords, iface_keywords).values())
+        )
+        and return_annotations_compatible(
+            impl_sig.signature.return_annotation,
+            iface_sig.signature.return_annotation,
+        )
+    )
+
+
+def test_compiled_plans_match_reference():
+    def f0():  # pragma: nocover
+        pass
+
+    def f1(a):  # pragma: nocover
+        pass
+
+    def f2(a, b):  # pragma: nocover
+        pass
+
+    def f3(b, a):  # pragma: nocover
+        pass
+
+    def f4(a, b=1):  # pragma: nocover
+        pass
+
+    def f5(a, b=2, c=3):  # pragma: nocover
+        pass
+
+    def f6(a: int, b):  # pragma: nocover
+        pass
+
+    def f7(a: str, b):  # pragma: nocover
+        pass
+
+    def f8(a, *args):  # pragma: nocover
+        pass
+
+    def f9(a, *rest):  # pragma: nocover
+        pass
+
+    def f10(a, **kwargs):  # pragma: nocover
+        pass
+
+    def f11(a, *, b):  # pragma: nocover
+        pass
+
+    def f12(a, *, b=1):  # pragma: nocover
+        pass
+
+    def f13(a, *, b: int):  # pragma: nocover
+        pass
+
+    def f14(a, *, c, b):  # pragma: nocover
+        pass
+
+    def f15(a, b, *args, c=1, **kwargs):  # pragma: nocover
+        pass
+
+    def f16(*, a):  # pragma: nocover
+        pass
+
+    def f17(a: object, b):  # pragma: nocover
+        pass
+
+    def f18(a: bool, b):  # pragma: nocover
+        pass
+
+    def f19(a, *, b: object) -> bool:  # pragma: nocover
+        pass
+
+    def f20(a, *, b: bool) -> int:  # pragma: nocover
+        pass
+
+    def f21(a: Optional[int], b) -> int:  # pragma: nocover
+        pass
+
+    sigs = list(
+        map(
+            TypedSignature,
+            [
+                f0, f1, f2, f3, f4, f5, f6, f7, f8, f9, f10,  # noqa
+                f11, f12, f13, f14, f15, f16, f17, f18, f19, f20, f21,  # noqa
+            ],
+        )
+    )
+    for impl, iface in product(sigs, sigs):
+        assert compatible(impl, iface) == reference_compatible(impl, iface), (
+            impl,
+            iface,
+        )
+
+
+def test_arguments_are_contravariant():
+    @TypedSignature
+    def iface(a: int, *, b: Optional[bool]):  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def wider(a: object, *, b: Union[int, None]):  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def narrower(a: bool, *, b: bool):  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def unannotated(a, *, b):  # pragma: nocover
+        pass
+
+    assert compatible(wider, iface)
+    assert not compatible(iface, wider)
+    assert not compatible(narrower, iface)
+    assert compatible(iface, narrower)
+
+    # Annotations can't be dropped or added.
+    assert not compatible(unannotated, iface)
+    assert not compatible(iface, unannotated)
+
+
+def test_returns_are_covariant():
+    @TypedSignature
+    def iface(a) -> Sequence[int]:  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def narrower(a) -> List[bool]:  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def wider(a) -> Sequence[object]:  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def unannotated(a):  # pragma: nocover
+        pass
+
+    assert compatible(narrower, iface)
+    assert not compatible(iface, narrower)
+    assert not compatible(wider, iface)
+    assert compatible(iface, wider)
+
+    # Unannotated returns aren't checked.
+    assert compatible(unannotated, iface)
+    assert compatible(iface, unannotated)
+
+
+def test_callable_and_mapping_annotations():
+    @TypedSignature
+    def iface(
+        callback: Callable[[bool], object], mapping: Dict[str, int]
+    ) -> Mapping[str, object]:  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def impl(
+        callback: Callable[[bool], Any], mapping: Mapping[str, int]
+    ) -> Dict[str, bool]:  # pragma: nocover
+        pass
+
+    @TypedSignature
+    def bad_callback(
+        callback: Callable[[int], object], mapping: Dict[str, int]
+    ):  # pragma: nocover
+        pass
+
+    assert compatible(impl, iface)
+    assert not compatible(bad_callback, iface)
@@ -0,0 +1,54 @@
+from ..batch import verify_many
+from ..interface import default, Interface, InvalidImplementation
+
+
+def test_verify_many():
+    class I(Interface):  # pragma: nocover
+        def method(self, x):
+            pass
+
+        @default
+        def has_default(self):
+            pass
+
+    class J(Interface):  # pragma: nocover
+        @property
+        def prop(self):
+            pass
+
+    class Good(object):  # pragma: nocover
+        def method(self, x):
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+    class Bad(object):  # pragma: nocover
+        def method(self, x, y):
+            pass
+
+        prop = 5
+
+    pairs = [(I, Good), (I, Bad), (J, Good), (J, Bad)] * 10
+    results = verify_many(iter(pairs))
+
+    assert [(r.interface, r.implementation) for r in results] == pairs
+    assert [r.ok for r in results] == [True, False, True, False] * 10
+
+    good_i, bad_i, good_j, bad_j = results[:4]
+
+    assert good_i.defaults == {"has_default": I._defaults["has_default"].implementation}
+    assert good_i.error is None
+    assert "has_default" not in vars(Good)
+
+    assert bad_i.defaults is None
+    assert isinstance(bad_i.error, InvalidImplementation)
+    assert "method(self, x, y) != method(self, x)" in str(bad_i.error)
+
+    assert good_j.defaults == {}
+    assert isinstance(bad_j.error, TypeError)
+
+
+def test_verify_many_empty():
+    assert verify_many([]) == []
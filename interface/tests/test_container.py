@@ -0,0 +1,170 @@
+from functools import partial
+
+import pytest
+
+from ..compat import PY3
+from ..container import Container, CyclicDependency, ResolutionError
+from ..interface import implements, Interface
+
+
+class Clock(Interface):  # pragma: nocover
+    def now(self):
+        pass
+
+
+class Logger(Interface):  # pragma: nocover
+    def log(self, message):
+        pass
+
+
+class FileLogger(Logger):  # pragma: nocover
+    def path(self):
+        pass
+
+
+class FixedClock(implements(Clock)):
+    def now(self):
+        return 42
+
+
+class ListLogger(implements(FileLogger)):
+    def __init__(self, clock):
+        self.clock = clock
+        self.messages = []
+
+    def log(self, message):
+        self.messages.append((self.clock.now(), message))
+
+    def path(self):
+        return "/dev/null"
+
+
+def test_resolve():
+    container = Container()
+    clock = FixedClock()
+    container.register_instance(Clock, clock)
+    container.register(FileLogger, ListLogger, dependencies={"clock": Clock})
+    assert not container.frozen
+
+    logger = container.resolve(FileLogger)
+    assert container.frozen
+    assert isinstance(logger, ListLogger)
+    assert logger.clock is clock
+    assert logger.path() == "/dev/null"
+    logger.log("hello")
+    assert logger.messages == [(42, "hello")]
+
+    # Non-singletons are built on every resolution.
+    assert container.resolve(FileLogger) is not logger
+
+    # Parents of registered interfaces can be resolved too.
+    assert isinstance(container.resolve(Logger), ListLogger)
+    assert container.resolve(Clock) is clock
+
+    with pytest.raises(ResolutionError):
+        container.resolve(Interface)
+
+    with pytest.raises(RuntimeError):
+        container.register(Clock, FixedClock)
+
+
+def test_singletons_and_factories():
+    calls = []
+
+    def make_clock():
+        calls.append(1)
+        return FixedClock()
+
+    container = Container()
+    container.register(Clock, make_clock, singleton=True)
+    container.register(
+        Logger, lambda clock: ListLogger(clock), dependencies={"clock": Clock}
+    )
+    container.freeze()
+
+    assert calls == []
+    clock = container.resolve(Clock)
+    assert container.resolve(Clock) is clock
+    assert container.resolve(Logger).clock is clock
+    assert calls == [1]
+
+
+def test_uninspectable_providers():
+    class Holder(object):
+        clock = FixedClock()
+
+    container = Container()
+    # Builtins often don't have signatures, so they're called without
+    # arguments.
+    container.register(Clock, partial(getattr, Holder, "clock"))
+    container.freeze()
+    # Freezing again is a no-op.
+    container.freeze()
+    assert container.resolve(Clock) is Holder.clock
+
+
+def test_ambiguous_parents_are_not_resolvable():
+    class OtherLogger(Logger):  # pragma: nocover
+        pass
+
+    class OtherLoggerImpl(implements(OtherLogger)):  # pragma: nocover
+        def log(self, message):
+            pass
+
+    container = Container()
+    container.register(FileLogger, ListLogger, dependencies={"clock": Clock})
+    container.register(OtherLogger, OtherLoggerImpl)
+    container.register(Clock, FixedClock)
+
+    assert isinstance(container.resolve(OtherLogger), OtherLoggerImpl)
+    with pytest.raises(ResolutionError):
+        container.resolve(Logger)
+
+
+def test_register_rejects_invalid_providers():
+    container = Container()
+    with pytest.raises(TypeError):
+        container.register(FixedClock, FixedClock)
+    with pytest.raises(TypeError):
+        container.register(Logger, FixedClock)
+    with pytest.raises(TypeError):
+        container.register(Clock, 5)
+    with pytest.raises(TypeError):
+        container.register(Clock, FixedClock, dependencies={"x": object})
+    with pytest.raises(TypeError):
+        container.register_instance(Clock, object())
+
+
+def test_missing_dependency():
+    container = Container()
+    container.register(Logger, ListLogger, dependencies={"clock": Clock})
+    with pytest.raises(ResolutionError) as e:
+        container.freeze()
+    assert str(e.value) == (
+        "ListLogger requires Clock for parameter 'clock', but no provider is "
+        "registered for it."
+    )
+    assert not container.frozen
+
+
+def test_cyclic_dependencies():
+    class A(Interface):  # pragma: nocover
+        pass
+
+    class B(Interface):  # pragma: nocover
+        pass
+
+    class C(Interface):  # pragma: nocover
+        pass
+
+    container = Container()
+    container.register(A, lambda b: None, dependencies={"b": B})
+    container.register(B, lambda c: None, dependencies={"c": C})
+    container.register(C, lambda a: None, dependencies={"a": A})
+    with pytest.raises(CyclicDependency) as e:
+        container.freeze()
+    assert str(e.value) == "Cyclic dependency: A -> B -> C -> A"
+
+
+if PY3:  # pragma: nocover-py2
+    from ._py3_container_tests import *  # noqa
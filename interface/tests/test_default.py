@@ -0,0 +1,197 @@
+import dis
+
+import pytest
+
+from ..compat import PY3
+from ..functional import sliding_window
+
+if PY3:  # pragma: nocover-py2
+    from ..default import (
+        _scan_accessed_attributes,
+        _unpack_bytecode,
+        _variable_names,
+        accessed_attributes_of_local,
+    )
+
+py3_only = pytest.mark.skipif(not PY3, reason="Python 3 Only")
+
+LOAD_LOCAL = {"LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_FAST_BORROW"}
+LOAD_LOCAL_PAIR = {"LOAD_FAST_LOAD_FAST", "LOAD_FAST_BORROW_LOAD_FAST_BORROW"}
+ATTRIBUTE_OPS = {"LOAD_ATTR", "LOAD_METHOD", "STORE_ATTR"}
+
+
+def reference_accessed_attributes(f, local_name):
+    """
+    Reference implementation of ``_scan_accessed_attributes`` built on
+    ``dis.get_instructions``.
+    """
+    instrs = (i for i in dis.get_instructions(f) if i.opname != "EXTENDED_ARG")
+    used = set()
+    for first, second in sliding_window(instrs, 2):
+        if second.opname not in ATTRIBUTE_OPS:
+            continue
+        if (first.opname in LOAD_LOCAL and first.argval == local_name) or (
+            first.opname in LOAD_LOCAL_PAIR and first.argval[1] == local_name
+        ):
+            used.add(second.argval)
+    return used
+
+
+def make_function(source, name="f"):
+    namespace = {}
+    exec(source, namespace)
+    return namespace[name]
+
+
+def examples():
+    def simple(self, x):  # pragma: nocover
+        foo = self.foo(1, 2)
+        self.bar = self.baz
+        return foo + x.not_self
+
+    def other_locals(self, other):  # pragma: nocover
+        other.attr = self.attr
+        return other.method(self.method())
+
+    def with_flow(self, items):  # pragma: nocover
+        for item in items:
+            if self.check(item):
+                self.count += 1
+            else:
+                try:
+                    self.fail(item)
+                except Exception:
+                    self.handle()
+        while self.running:
+            self.step()
+        return self.result
+
+    yield simple, "self"
+    yield simple, "x"
+    yield other_locals, "self"
+    yield other_locals, "other"
+    yield with_flow, "self"
+
+    # Attribute indices that need EXTENDED_ARG.
+    many_names = make_function(
+        "def f(self):\n    "
+        + "\n    ".join("self.attr{0} = self.other{0}".format(i) for i in range(300))
+    )
+    yield many_names, "self"
+
+    # Local indices that need EXTENDED_ARG.
+    many_locals = make_function(
+        "def f({}, last):\n    return last.x, last.y".format(
+            ", ".join("a{}".format(i) for i in range(300))
+        )
+    )
+    yield many_locals, "last"
+    yield many_locals, "a0"
+
+    yield simple, "not_a_local"
+
+
+@py3_only
+@pytest.mark.parametrize("f, local_name", list(examples()) if PY3 else [])
+def test_scan_matches_reference(f, local_name):  # pragma: nocover-py2
+    expected = reference_accessed_attributes(f, local_name)
+    assert _scan_accessed_attributes(f.__code__, frozenset([local_name])) == expected
+    assert accessed_attributes_of_local(f, local_name) == expected
+
+
+@py3_only
+def test_accessed_attributes_of_non_functions():  # pragma: nocover-py2
+    class Method(object):
+        def method(self):
+            return self.x
+
+        @classmethod
+        def cm(cls):
+            return cls.y
+
+    assert accessed_attributes_of_local(Method().method, "self") == {"x"}
+    assert accessed_attributes_of_local(Method.__dict__["cm"], "cls") == {"y"}
+    assert accessed_attributes_of_local(len, "self") == set()
+    assert accessed_attributes_of_local(object(), "self") == set()
+
+
+@py3_only
+def test_aliases_closures_and_comprehensions():  # pragma: nocover-py2
+    def aliased(self):  # pragma: nocover
+        other = self
+        other.via_alias()
+        another = other
+        another.stored = 1
+        other = None
+        return other.not_an_alias
+
+    def rebound(self):  # pragma: nocover
+        self.before()
+        self = self.wrapped
+        return self.after()
+
+    def closure(self):  # pragma: nocover
+        alias = self
+
+        def inner():
+            return self.captured, alias.captured_alias
+
+        return self.direct, inner, lambda: self.in_lambda
+
+    def comprehensions(self, items):  # pragma: nocover
+        return (
+            [self.in_list(i) for i in items],
+            {i: self.in_dict for i in items},
+            list(self.in_generator for _ in items),
+        )
+
+    def nested_class(self):  # pragma: nocover
+        class Nested(object):
+            def method(self):
+                return self.nested_self
+
+        return Nested, self.outer
+
+    assert accessed_attributes_of_local(aliased, "self") == {"via_alias", "stored"}
+    assert accessed_attributes_of_local(rebound, "self") == {"before", "wrapped"}
+    assert accessed_attributes_of_local(closure, "self") == {
+        "captured",
+        "captured_alias",
+        "direct",
+        "in_lambda",
+    }
+    assert accessed_attributes_of_local(comprehensions, "self") == {
+        "in_list",
+        "in_dict",
+        "in_generator",
+    }
+    assert accessed_attributes_of_local(nested_class, "self") == {"outer"}
+
+
+@py3_only
+def test_unpack_bytecode():  # pragma: nocover-py2
+    # Python 3.5's bytecode isn't used on newer versions, so check it directly.
+    load_fast, pop_top = dis.opmap["LOAD_FAST"], dis.opmap["POP_TOP"]
+    co_code = bytes([load_fast, 1, 2, pop_top, load_fast, 0, 0])
+    assert list(_unpack_bytecode(co_code)) == [
+        (load_fast, 0x201),
+        (pop_top, 0),
+        (load_fast, 0),
+    ]
+
+
+@py3_only
+def test_variable_names():  # pragma: nocover-py2
+    class OldCode(object):
+        co_varnames = ("self", "x")
+        co_cellvars = ("cell",)
+        co_freevars = ("free",)
+
+    class NewCode(object):
+        # Since Python 3.11, fast locals and cells share one array.
+        def _varname_from_oparg(self, i):
+            return ("self", "x", "cell", "free")[i]
+
+    assert _variable_names(OldCode()) == (("self", "x"), ("cell", "free"))
+    names = ["self", "x", "cell", "free"]
+    assert _variable_names(NewCode()) == (names, names)
@@ -0,0 +1,159 @@
+import gc
+import weakref
+
+import pytest
+
+from ..dispatch import AmbiguousDispatch, dispatch
+from ..interface import implements, Interface
+from ..registry import registry
+
+
+class Shape(Interface):  # pragma: nocover
+    def area(self):
+        pass
+
+
+class Polygon(Shape):  # pragma: nocover
+    def sides(self):
+        pass
+
+
+class Named(Interface):  # pragma: nocover
+    def name(self):
+        pass
+
+
+class Circle(implements(Shape)):
+    def area(self):
+        return 3
+
+
+class Square(implements(Polygon)):
+    def area(self):
+        return 4
+
+    def sides(self):
+        return 4
+
+
+class NamedSquare(Square, implements(Named)):
+    def name(self):
+        return "square"
+
+
+def make_describe():
+    @dispatch
+    def describe(obj, suffix=""):
+        return "object" + suffix
+
+    @describe.register(Shape)
+    def describe_shape(shape, suffix=""):
+        return "shape with area {}{}".format(shape.area(), suffix)
+
+    @describe.register(Polygon)
+    def describe_polygon(polygon, suffix=""):
+        return "polygon with {} sides{}".format(polygon.sides(), suffix)
+
+    return describe
+
+
+def test_dispatch():
+    describe = make_describe()
+
+    assert describe.__name__ == "describe"
+    assert describe(object()) == "object"
+    assert describe(5, suffix="!") == "object!"
+    assert describe(Circle()) == "shape with area 3"
+    assert describe(Square(), "!") == "polygon with 4 sides!"
+    assert describe.handlers[Shape](Square()) == "shape with area 4"
+
+    # Subclasses of implementations, and implementations of subclasses of
+    # registered interfaces, are dispatched too.
+    class BigCircle(Circle):
+        pass
+
+    assert describe(BigCircle()) == "shape with area 3"
+    assert describe.dispatch(BigCircle) is describe.handlers[Shape]
+
+    # Adapted objects dispatch on the interfaces they're adapted to.
+    class Blob(object):
+        def area(self):
+            return 10
+
+    assert describe(Shape.adapt(Blob())) == "shape with area 10"
+    assert describe(Blob()) == "object"
+
+    # Implementations of interfaces without handlers use the default.
+    class Person(implements(Named)):
+        def name(self):  # pragma: nocover
+            pass
+
+    assert describe(Person()) == "object"
+
+    with pytest.raises(TypeError):
+        describe()
+
+
+def test_ambiguous_dispatch():
+    describe = make_describe()
+    assert describe(NamedSquare()) == "polygon with 4 sides"
+
+    describe.register(Named, lambda obj: "named " + obj.name())
+    with pytest.raises(AmbiguousDispatch) as e:
+        describe(NamedSquare())
+    assert describe.handlers[Named](NamedSquare()) == "named square"
+    assert str(e.value) == (
+        "Ambiguous dispatch for NamedSquare: it implements Named, Polygon, which "
+        "all have handlers."
+    )
+
+    # Handlers for more specific interfaces break ties.
+    class NamedPolygon(Named, Polygon):  # pragma: nocover
+        pass
+
+    describe.register(NamedPolygon, lambda obj: "named polygon")
+
+    class NamedPolygonImpl(NamedSquare, implements(NamedPolygon)):
+        pass
+
+    assert describe(NamedPolygonImpl()) == "named polygon"
+
+
+def test_register_rejects_non_interfaces():
+    describe = make_describe()
+    for bad in (object, Interface, Circle, 5):
+        with pytest.raises(TypeError):
+            describe.register(bad, lambda obj: None)
+
+
+def test_dispatch_cache_invalidation():
+    describe = make_describe()
+    assert describe(Circle()) == "shape with area 3"
+    assert id(Circle) in describe._cache
+
+    # Registering handlers clears the cache.
+    describe.register(Shape, lambda shape: "new handler")
+    assert id(Circle) not in describe._cache
+    assert describe(Circle()) == "new handler"
+
+    # So does registering implementations.
+    assert id(Circle) in describe._cache
+
+    class Triangle(implements(Polygon)):
+        def area(self):  # pragma: nocover
+            return 0.5
+
+        def sides(self):
+            return 3
+
+    # The cache is cleared the next time it's used.
+    assert describe._version != registry.version
+    assert describe(Triangle()) == "polygon with 3 sides"
+    assert describe._cache == {id(Triangle): describe.handlers[Polygon]}
+
+    # Entries are removed when their classes die.
+    triangle_ref = weakref.ref(Triangle)
+    del Triangle
+    gc.collect()
+    assert triangle_ref() is None
+    assert describe._cache == {}
@@ -0,0 +1,18 @@
+from ..compat import PY3
+from ..interface import implements, Interface
+
+
+def test_enforcement_disabled_leaves_implementations_untouched():
+    class I(Interface):  # pragma: nocover
+        def f(self, x):
+            pass
+
+    def f(self, x):  # pragma: nocover
+        pass
+
+    C = type("C", (implements(I),), {"f": f})
+    assert C.__dict__["f"] is f
+
+
+if PY3:  # pragma: nocover-py2
+    from ._py3_enforcement_tests import *  # noqa
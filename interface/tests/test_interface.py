@@ -1,10 +1,23 @@
+import gc
+import sys
 from textwrap import dedent
+import weakref
 
 import pytest
 
-from ..compat import PY3, wraps
+from .. import interface as interface_module, predicates
+from ..compat import PY3, signature, wraps
 from ..default import UnsafeDefault
-from ..interface import default, implements, Interface, InvalidImplementation
+from ..interface import (
+    default,
+    implements,
+    Interface,
+    InterfaceMeta,
+    InvalidImplementation,
+    provides,
+    verify_pending,
+)
+from ..registry import registry
 
 py3_only = pytest.mark.skipif(not PY3, reason="Python 3 Only")
 
@@ -36,6 +49,155 @@ def test_valid_implementation():
             pass
 
 
+def test_verification_reused_by_subclasses(monkeypatch):
+    class I(Interface):  # pragma: nocover
+        def m0(self):
+            pass
+
+        @default
+        def m1(self, x):
+            return x
+
+    class C(implements(I)):  # pragma: nocover
+        def m0(self):
+            pass
+
+    checked = []
+    original_compatible = interface_module.compatible
+
+    def compatible(impl_sig, iface_sig):
+        checked.append(impl_sig)
+        return original_compatible(impl_sig, iface_sig)
+
+    monkeypatch.setattr(interface_module, "compatible", compatible)
+
+    # The first subclass sees the default injected onto C, so it has a new
+    # member to check. Every subclass after that should hit the cache.
+    class D(C):
+        pass
+
+    del checked[:]
+    for i in range(10):
+
+        class D(D):
+            pass
+
+    assert checked == []
+    assert D().m1(3) == 3
+
+    # Overriding an interface member should trigger a new check.
+    class E(D):  # pragma: nocover
+        def m0(self):
+            pass
+
+    assert len(checked) == 2
+
+    with pytest.raises(InvalidImplementation):
+
+        class F(D):  # pragma: nocover
+            def m0(self, x):
+                pass
+
+
+def test_verification_cache_doesnt_keep_classes_alive():
+    class I(Interface):  # pragma: nocover
+        def m0(self):
+            pass
+
+        @staticmethod
+        def s():
+            pass
+
+        @property
+        def p(self):
+            pass
+
+    def make_implementation():
+        # Refer to the class from its methods, like zero-argument super()
+        # does.
+        class C(implements(I)):  # pragma: nocover
+            def m0(self):
+                return C
+
+            @staticmethod
+            def s():
+                return C
+
+            @property
+            def p(self):
+                return C
+
+        return C
+
+    implementations = [make_implementation() for _ in range(10)]
+    assert len(I._verification_cache) == 10
+
+    refs = [weakref.ref(C) for C in implementations]
+    del implementations[:]
+    gc.collect()
+    assert [r() for r in refs] == [None] * 10
+    assert len(I._verification_cache) == 0
+
+    # Entries are also dropped when a member that can't be weakly referenced
+    # is replaced.
+    C = make_implementation()
+    assert len(I._verification_cache) == 1
+    C.s = staticmethod(lambda: None)
+    gc.collect()
+    assert len(I._verification_cache) == 0
+
+    # Members wrapping functions that can't be weakly referenced aren't
+    # recorded, since we can't tell when their ids are reused.
+    cache = interface_module._VerificationCache()
+    key, members = cache.members_of(C, ["m0"])
+    cache.add(key, members, {})
+    assert cache.get(key) == {}
+    cache.clear()
+    assert cache.get(key) is None
+
+    members = [staticmethod(str.upper)]
+    cache.add(cache.members_of(C, ["s"])[0], members, {})
+    assert len(cache) == 0
+
+    # Nor are other members that can't be weakly referenced.
+    cache.add((id(str.upper),), [str.upper], {})
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("wrap", [staticmethod, property])
+def test_verification_cache_ignores_reused_ids(wrap):
+    class I(Interface):  # pragma: nocover
+        @wrap
+        def member(x):
+            pass
+
+    def good(x):  # pragma: nocover
+        pass
+
+    def bad(x, y):  # pragma: nocover
+        pass
+
+    class C(implements(I)):
+        member = wrap(good)
+
+    # Replace C.member with an object that reuses the old one's id.
+    # Allocate in C, and set up everything first, so that nothing else takes
+    # the old object's memory.
+    allocate = map(wrap, [bad] * 10000)
+    old_id = id(vars(C)["member"])
+    del C.member
+    replacements = list(allocate)
+    matches = [r for r in replacements if id(r) == old_id]
+    if not matches:  # pragma: nocover
+        pytest.skip("Couldn't reuse the id of C.member.")
+    C.member = matches[0]
+
+    with pytest.raises(InvalidImplementation):
+
+        class D(C):
+            pass
+
+
 def test_implement_multiple_interfaces_correctly():
     class I1(Interface):  # pragma: nocover
         def i1_method(self, arg1):
@@ -64,6 +226,52 @@ def test_implement_multiple_interfaces_correctly():
     assert set(C.interfaces()) == set([I1, I2])
 
 
+def test_interfaces_and_provides():
+    class I1(Interface):  # pragma: nocover
+        def i1_method(self):
+            pass
+
+    class I1Child(I1):  # pragma: nocover
+        def i1_child_method(self):
+            pass
+
+    class I2(Interface):  # pragma: nocover
+        def i2_method(self):
+            pass
+
+    class Unrelated(Interface):
+        pass
+
+    class C(implements(I1Child)):  # pragma: nocover
+        def i1_method(self):
+            pass
+
+        def i1_child_method(self):
+            pass
+
+    class D(C, implements(I2)):  # pragma: nocover
+        def i2_method(self):
+            pass
+
+    assert list(C.interfaces()) == [I1Child]
+    assert set(D.interfaces()) == {I1Child, I2}
+    assert tuple(D.interfaces()) == D._interface_tuple
+
+    c, d = C(), D()
+    for obj in c, d:
+        assert provides(obj, I1Child)
+        assert provides(obj, I1)
+        assert not provides(obj, Unrelated)
+        assert not provides(obj, Interface)
+
+    assert not provides(c, I2)
+    assert provides(d, I2)
+
+    assert not provides(object(), I1)
+    # Classes don't provide the interfaces implemented by their instances.
+    assert not provides(C, I1)
+
+
 def generative_fixture(g):
     """
     Decorator for turning a generator into a "parameterized" fixture that emits
@@ -250,6 +458,53 @@ def test_implements_memoization():
 
     assert implements(I) is implements(I)
     assert implements(I) is not implements(OtherI)
+    assert implements(I, OtherI) is implements(OtherI, I)
+    assert implements(I, I) is implements(I)
+
+
+def test_implements_memo(monkeypatch):
+    memo = interface_module.implements_memo
+    monkeypatch.setattr(memo, "hits", 0)
+    monkeypatch.setattr(memo, "misses", 0)
+    monkeypatch.setattr(memo, "maxsize", 2)
+
+    class I(Interface):
+        pass
+
+    class J(Interface):
+        pass
+
+    base = implements(I)
+    assert implements(I, verify="eager") is base
+    assert implements(J, I) is implements(I, J)
+    assert (memo.hits, memo.misses) == (2, 2)
+    both_ref = weakref.ref(implements(I, J))
+
+    # Bases stay alive while they're recent, or while something else uses them.
+    class C(implements(J)):
+        pass
+
+    lazy_ref = weakref.ref(implements(I, verify="lazy"))
+    gc.collect()
+    assert lazy_ref() is not None
+    assert both_ref() is None
+    assert implements(J) is C.__mro__[1]
+
+    class K(Interface):
+        pass
+
+    live = len(memo)
+    memo.maxsize = 0
+    implements(K)  # Evicts all the recent bases.
+    gc.collect()
+    assert lazy_ref() is None
+    assert len(memo) == live - 2  # Both keys for implements(I, verify="lazy").
+
+    # Dead bases are regenerated.
+    misses = memo.misses
+    regenerated = implements(I, verify="lazy")
+    assert memo.misses == misses + 1
+    assert implements(I, verify="lazy") is regenerated
 
 
 def test_reject_invalid_interface():
@@ -694,6 +949,48 @@ Consider changing HasDefault.default_method or making these attributes part of H
     assert second == expected_second
 
 
+@py3_only
+def test_inherited_defaults_are_only_checked_once(
+    monkeypatch,
+):  # pragma: nocover-py2
+    # interface.default is shadowed by the class of the same name.
+    default_module = sys.modules[UnsafeDefault.__module__]
+
+    scanned = []
+    real_scan = default_module._scan_accessed_attributes
+
+    def scan(f, local_name):
+        scanned.append(f.co_name)
+        return real_scan(f, local_name)
+
+    monkeypatch.setattr(default_module, "_scan_accessed_attributes", scan)
+
+    with pytest.warns(UnsafeDefault) as warns:
+
+        class Base(Interface):
+            @default
+            def uses_extra(self):
+                return self.extra
+
+    assert len(warns.list) == 1
+    assert scanned == ["uses_extra"]
+
+    class Child(Base):  # pragma: nocover
+        def extra(self):
+            pass
+
+        @default
+        def uses_base(self):
+            return self.uses_extra()
+
+    # Base's default isn't checked again, and its result is remembered.
+    assert scanned == ["uses_extra", "uses_base"]
+    assert default_module.accessed_attributes_of_local(
+        Base._defaults["uses_extra"].implementation, "self"
+    ) == {"extra"}
+    assert scanned == ["uses_extra", "uses_base"]
+
+
 def test_wrapped_implementation():
     class I(Interface):  # pragma: nocover
         def f(self, a, b, c):
@@ -789,6 +1086,10 @@ def test_interface_from_class_method_subset():
 
     iface = Interface.from_class(C, subset=["method1"])
 
+    with pytest.raises(AttributeError) as e:
+        Interface.from_class(C, subset=["method1", "method3"])
+    assert str(e.value) == "method3"
+
     class Impl(implements(iface)):  # pragma: nocover
         def method1(self, x):
             pass
@@ -892,6 +1193,70 @@ def test_interface_from_class_magic_methods():
     assert actual_message == expected_message
 
 
+def test_interface_from_class_predicates():
+    class Base(object):  # pragma: nocover
+        column = "not callable"
+
+        def get_base(self):
+            pass
+
+        def _private_base(self):
+            pass
+
+    class Model(Base):  # pragma: nocover
+        other_column = 3
+
+        def get_model(self, x):
+            pass
+
+        def set_model(self, x):
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+        @staticmethod
+        def static():
+            pass
+
+        def _private(self):
+            pass
+
+    def members(**kwargs):
+        return set(Interface.from_class(Model, **kwargs)._signatures)
+
+    # Non-callable attributes can't be converted to interface members.
+    with pytest.raises(TypeError):
+        Interface.from_class(Model)
+
+    assert members(predicate=predicates.callables) == {
+        "get_base",
+        "_private_base",
+        "get_model",
+        "set_model",
+        "prop",
+        "static",
+        "_private",
+    }
+    assert members(predicate=predicates.public_callables) == {
+        "get_base",
+        "get_model",
+        "set_model",
+        "prop",
+        "static",
+    }
+    assert members(
+        predicate=predicates.all_of(predicates.callables, predicates.declared)
+    ) == {"get_model", "set_model", "prop", "static", "_private"}
+    assert members(predicate=predicates.matching("^get_")) == {"get_base", "get_model"}
+
+    # Predicates apply to explicit subsets too.
+    assert members(
+        subset=["get_base", "get_model", "column"], predicate=predicates.declared
+    ) == {"get_model"}
+
+
 def test_interface_subclass():
     class A(Interface):  # pragma: nocover
         def method_a(self):
@@ -1012,3 +1377,552 @@ def test_subclass_allow_compatible_extension():
     class C2(B):  # pragma: nocover
         def method_b(self, y, z=None):
             pass
+
+
+@pytest.fixture
+def pending(monkeypatch):
+    """Isolate the registry of classes with deferred verification."""
+    registry = interface_module.OrderedDict()
+    monkeypatch.setattr(interface_module, "_pending", registry)
+    return registry
+
+
+def test_lazy_verification(pending):
+    class I(Interface):  # pragma: nocover
+        def method(self, x):
+            pass
+
+        @default
+        def has_default(self):
+            return "default"
+
+    class Good(implements(I, verify="lazy")):
+        def method(self, x):
+            return x
+
+    # Nothing is checked, and no defaults are injected, until instantiation.
+    class Bad(implements(I, verify="lazy")):  # pragma: nocover
+        def method(self, x, y):
+            pass
+
+    assert "has_default" not in vars(Good)
+    assert len(pending) == 2
+
+    assert Good().has_default() == "default"
+    assert Good().method(1) == 1
+    assert len(pending) == 1
+
+    expected = dedent(
+        """
+        class Bad failed to implement interface I:
+
+        The following methods of I were implemented with invalid signatures:
+          - method(self, x, y) != method(self, x)"""
+    )
+    for i in range(2):
+        with pytest.raises(InvalidImplementation) as e:
+            Bad()
+        assert str(e.value) == expected
+
+    with pytest.raises(InvalidImplementation) as e:
+        verify_pending()
+    assert str(e.value) == expected
+
+
+def test_verify_pending_skips_collected_classes(pending):
+    class Dead(object):
+        pass
+
+    # Classes collected while verify_pending is running are still in its
+    # snapshot of the registry.
+    pending[id(Dead)] = weakref.ref(Dead)
+    del Dead
+    gc.collect()
+    verify_pending()
+    assert len(pending) == 1
+
+
+def test_lazy_verification_of_subclasses(pending):
+    class I(Interface):  # pragma: nocover
+        def method(self):
+            pass
+
+        @default
+        def has_default(self):
+            return "default"
+
+    class J(Interface):  # pragma: nocover
+        def other_method(self):
+            pass
+
+    class Base(implements(I, verify="lazy")):  # pragma: nocover
+        def method(self):
+            pass
+
+    class Child(Base, implements(J)):
+        def other_method(self):  # pragma: nocover
+            pass
+
+    class BadChild(Base):  # pragma: nocover
+        def method(self, x):
+            pass
+
+    class BadGrandChild(BadChild):
+        pass
+
+    with pytest.raises(InvalidImplementation) as e:
+        verify_pending()
+
+    expected = dedent(
+        """
+        class BadChild failed to implement interface I:
+
+        The following methods of I were implemented with invalid signatures:
+          - method(self, x) != method(self)
+
+        class BadGrandChild failed to implement interface I:
+
+        The following methods of I were implemented with invalid signatures:
+          - method(self, x) != method(self)"""
+    )
+    assert str(e.value) == expected
+
+    # Parents are verified before their children, so the default should be
+    # injected onto Base rather than Child.
+    assert "has_default" in vars(Base)
+    assert "has_default" not in vars(Child)
+    assert Child().has_default() == "default"
+    assert list(pending) == [id(BadChild), id(BadGrandChild)]
+
+
+def test_lazy_verification_from_environment(monkeypatch, pending):
+    monkeypatch.delenv("INTERFACE_VERIFY", raising=False)
+    assert interface_module._verify_mode_from_environment() == "eager"
+    monkeypatch.setenv("INTERFACE_VERIFY", "lazy")
+    assert interface_module._verify_mode_from_environment() == "lazy"
+
+    # The environment is only read at import.
+    monkeypatch.setattr(interface_module, "_default_verify", "lazy")
+
+    class I(Interface):  # pragma: nocover
+        def method(self):
+            pass
+
+    class C(implements(I)):
+        pass
+
+    assert list(pending) == [id(C)]
+    assert implements(I) is implements(I, verify="lazy")
+    assert implements(I) is not implements(I, verify="eager")
+
+    with pytest.raises(InvalidImplementation):
+        C()
+
+
+def test_implements_bad_verify_argument(monkeypatch):
+    class I(Interface):
+        pass
+
+    with pytest.raises(ValueError):
+        implements(I, verify="sometimes")
+
+    monkeypatch.setattr(interface_module, "_default_verify", "sometimes")
+    with pytest.raises(ValueError):
+        implements(I)
+    with pytest.raises(ValueError):
+        implements(I, verify=None)
+    implements(I, verify="eager")
+
+    with pytest.raises(TypeError):
+        implements(I, not_an_option=True)
+
+
+def test_isinstance_and_issubclass():
+    class I(Interface):  # pragma: nocover
+        def method(self):
+            pass
+
+    class IChild(I):  # pragma: nocover
+        def child_method(self):
+            pass
+
+    class Other(Interface):
+        pass
+
+    class C(implements(IChild)):  # pragma: nocover
+        def method(self):
+            pass
+
+        def child_method(self):
+            pass
+
+    class D(C):
+        pass
+
+    class NotDeclared(object):  # pragma: nocover
+        def method(self):
+            pass
+
+    assert issubclass(IChild, I)
+    assert not issubclass(I, IChild)
+    assert issubclass(I, Interface)
+
+    for cls in C, D:
+        assert issubclass(cls, IChild)
+        assert issubclass(cls, I)
+        assert not issubclass(cls, Other)
+        assert not issubclass(cls, Interface)
+
+        assert isinstance(cls(), IChild)
+        assert isinstance(cls(), I)
+        assert not isinstance(cls(), Other)
+
+    # Structural checks are opt-in.
+    assert not issubclass(NotDeclared, I)
+    assert not isinstance(NotDeclared(), I)
+
+    class Proxy(object):
+        @property
+        def __class__(self):
+            return C
+
+    assert isinstance(Proxy(), I)
+
+    with pytest.raises(TypeError):
+        issubclass(C(), I)
+
+
+def test_structural_isinstance_and_issubclass():
+    class I(Interface):  # pragma: nocover
+        _INTERFACE_STRUCTURAL_CHECKS = True
+
+        def method(self, x):
+            pass
+
+        @default
+        def has_default(self):
+            pass
+
+    assert set(I._signatures) == {"method", "has_default"}
+
+    class Conforms(object):  # pragma: nocover
+        def method(self, x):
+            pass
+
+    class WrongSignature(object):  # pragma: nocover
+        def method(self, x, y):
+            pass
+
+    class WrongType(object):  # pragma: nocover
+        @property
+        def method(self, x):
+            pass
+
+    class Missing(object):
+        pass
+
+    assert issubclass(Conforms, I)
+    assert isinstance(Conforms(), I)
+    for cls in WrongSignature, WrongType, Missing:
+        assert not issubclass(cls, I)
+        assert not isinstance(cls(), I)
+
+    # Results are cached...
+    Missing.method = Conforms.__dict__["method"]
+    assert not issubclass(Missing, I)
+
+    # ...even when new implementations are registered, because those are
+    # recognized before the cache is consulted.
+    class Impl(implements(I)):  # pragma: nocover
+        def method(self, x):
+            pass
+
+    assert issubclass(Impl, I)
+    assert not issubclass(Missing, I)
+
+    I._conformance_cache.clear()
+    assert issubclass(Missing, I)
+
+
+def test_conforms(monkeypatch):
+    class I(Interface):  # pragma: nocover
+        def method(self, x):
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+        @default
+        def has_default(self):
+            pass
+
+    class Conforms(object):  # pragma: nocover
+        def method(self, x):
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+    class ConformsWithOverride(Conforms):  # pragma: nocover
+        def has_default(self):
+            pass
+
+    class Missing(object):  # pragma: nocover
+        def method(self, x):
+            pass
+
+    class WrongType(Conforms):  # pragma: nocover
+        def prop(self):
+            pass
+
+    class WrongSignature(Conforms):  # pragma: nocover
+        def method(self, y):
+            pass
+
+    class NotCallable(Conforms):
+        method = 5
+
+    def fail(*args, **kwargs):  # pragma: nocover
+        raise AssertionError("Shouldn't build error messages.")
+
+    monkeypatch.setattr(InterfaceMeta, "_invalid_implementation", fail)
+
+    assert I.conforms(Conforms)
+    assert I.conforms(ConformsWithOverride)
+    for cls in Missing, WrongType, WrongSignature, NotCallable:
+        assert not I.conforms(cls)
+
+    assert I._first_nonconforming_member(Conforms) is None
+    assert I._first_nonconforming_member(Missing) == "prop"
+    assert I._first_nonconforming_member(WrongType) == "prop"
+    assert I._first_nonconforming_member(WrongSignature) == "method"
+    assert I._first_nonconforming_member(NotCallable) == "method"
+
+    # Verdicts are cached per type.
+    Missing.prop = Conforms.__dict__["prop"]
+    assert not I.conforms(Missing)
+    I._conformance_cache.clear()
+    assert I.conforms(Missing)
+
+
+def test_successful_verification_skips_diagnostics(monkeypatch):
+    class I(Interface):  # pragma: nocover
+        def method(self, x):
+            pass
+
+        @default
+        def has_default(self):
+            return "default"
+
+    def fail(*args, **kwargs):  # pragma: nocover
+        raise AssertionError("Shouldn't diagnose a valid implementation.")
+
+    with monkeypatch.context() as m:
+        m.setattr(InterfaceMeta, "_diff_signatures", fail)
+        m.setattr(InterfaceMeta, "_invalid_implementation", fail)
+
+        class C(implements(I)):  # pragma: nocover
+            def method(self, x):
+                pass
+
+    assert C().has_default() == "default"
+
+    # Failures should still report every problem, not just the first one.
+    with pytest.raises(InvalidImplementation) as e:
+
+        class D(implements(I)):  # pragma: nocover
+            def method(self, x, y):
+                pass
+
+            def has_default(self, z):
+                pass
+
+    expected = dedent(
+        """
+        class D failed to implement interface I:
+
+        The following methods of I were implemented with invalid signatures:
+          - has_default(self, z) != has_default(self)
+          - method(self, x, y) != method(self, x)"""
+    )
+    assert str(e.value) == expected
+
+
+def test_adapt(monkeypatch):
+    class I(Interface):  # pragma: nocover
+        def get(self, key):
+            pass
+
+        @property
+        def size(self):
+            pass
+
+        @staticmethod
+        def static(x):
+            pass
+
+        @classmethod
+        def cls_method(cls):
+            pass
+
+        @default
+        def get_all(self, *keys):
+            return [self.get(key) for key in keys]
+
+    class Store(object):
+        def __init__(self, data):
+            self.data = data
+
+        def get(self, key):
+            return self.data[key]
+
+        @property
+        def size(self):
+            return len(self.data)
+
+        @staticmethod
+        def static(x):
+            return x * 2
+
+        @classmethod
+        def cls_method(cls):
+            return cls
+
+    calls = []
+    real_verify = InterfaceMeta.verify
+
+    def verify(self, type_):
+        calls.append(type_)
+        return real_verify(self, type_)
+
+    monkeypatch.setattr(InterfaceMeta, "verify", verify)
+
+    store = Store({"a": 1, "b": 2})
+    adapted = I.adapt(store)
+
+    assert isinstance(adapted, I)
+    assert provides(adapted, I)
+    assert not hasattr(adapted, "__dict__")
+    assert not hasattr(adapted, "data")
+    assert adapted._adaptee is store
+    assert repr(adapted) == "<IAdapter_Store of {!r}>".format(store)
+
+    assert adapted.get("a") == 1
+    assert adapted.size == 2
+    assert adapted.static(3) == 6
+    assert adapted.cls_method() is Store
+    assert adapted.get_all("a", "b") == [1, 2]
+
+    # Adapters are registered like other implementations.
+    assert type(adapted) in registry.implementations_of(I)
+    assert registry.interfaces_of(type(adapted)) == (I,)
+
+    # Adapter classes are only generated and verified once per type.
+    other = I.adapt(Store({}))
+    assert type(other) is type(adapted)
+    assert other.size == 0
+    assert calls == [Store]
+
+    # Adapters and implementations don't need adapting.
+    class Impl(implements(I)):  # pragma: nocover
+        def get(self, key):
+            pass
+
+        @property
+        def size(self):
+            pass
+
+        @staticmethod
+        def static(x):
+            pass
+
+        @classmethod
+        def cls_method(cls):
+            pass
+
+    impl = Impl()
+    assert I.adapt(impl) is impl
+    assert I.adapt(adapted) is adapted
+
+    class Missing(object):  # pragma: nocover
+        def get(self, key):
+            pass
+
+    with pytest.raises(InvalidImplementation):
+        I.adapt(Missing())
+    assert Missing not in I._adapter_cache
+
+    # Adapters don't keep adapted types alive.
+    store_ref = weakref.ref(Store)
+    del Store, store, adapted, other, calls[:]
+    gc.collect()
+    assert store_ref() is None
+    assert len(I._adapter_cache) == 2  # Impl and the adapter class.
+
+
+def test_adapt_forwards_signatures():
+    class I(Interface):  # pragma: nocover
+        def f(self, a, b=None, *args, **kwargs):
+            pass
+
+        def g(*args):
+            pass
+
+    class C(object):
+        def f(self, a, b=2, *args, **kwargs):
+            return self, a, b, args, kwargs
+
+        def g(*args):
+            return args
+
+    c = C()
+    adapted = I.adapt(c)
+
+    # Methods are forwarded with the adapted type's signature and defaults.
+    assert signature(type(adapted).f) == signature(C.f)
+    assert adapted.f(1) == (c, 1, 2, (), {})
+    assert adapted.f(1, 3, 4, x=5) == (c, 1, 3, (4,), {"x": 5})
+    assert adapted.f(a=1, b=3) == (c, 1, 3, (), {})
+
+    # Methods without a ``self`` parameter are looked up on the adapted object.
+    assert isinstance(type(adapted).__dict__["g"], property)
+    assert adapted.g() == (c,)
+
+
+def test_adapt_rejects_reserved_members():
+    class I(Interface):  # pragma: nocover
+        def __init__(self, x):
+            pass
+
+        def __getattr__(self, name):
+            pass
+
+        def __repr__(self):
+            pass
+
+    class C(object):  # pragma: nocover
+        def __init__(self, x):
+            pass
+
+        def __getattr__(self, name):
+            pass
+
+        def __repr__(self):
+            return "C"
+
+    with pytest.raises(TypeError) as e:
+        I.adapt(C(1))
+    assert str(e.value) == (
+        "Can't adapt objects to I, because adapters can't forward "
+        "__getattr__, __init__."
+    )
+    assert C not in I._adapter_cache
+
+    # Other special methods are forwarded.
+    class J(Interface):  # pragma: nocover
+        def __repr__(self):
+            pass
+
+    assert repr(J.adapt(C(1))) == "C"
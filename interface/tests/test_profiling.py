@@ -0,0 +1,128 @@
+import json
+
+from ..interface import implements, Interface
+from ..profiling import (
+    add_listener,
+    listeners,
+    Profile,
+    qualified_name,
+    record,
+    remove_listener,
+)
+
+
+def test_record():
+    with record() as profile:
+
+        class I(Interface):  # pragma: nocover
+            def method1(self):
+                pass
+
+            def method2(self, x):
+                pass
+
+        class C(implements(I)):  # pragma: nocover
+            def method1(self):
+                pass
+
+            def method2(self, x):
+                pass
+
+        class D(C):
+            pass
+
+    assert not listeners
+
+    iface_name = qualified_name(I)
+    assert iface_name.endswith("test_record.<locals>.I")
+    assert list(profile.interfaces) == [iface_name]
+    assert list(profile.default_checks) == [iface_name]
+    assert sorted(profile.verifications) == [
+        (iface_name, qualified_name(C)),
+        (iface_name, qualified_name(D)),
+    ]
+    assert list(profile.verifications_by_interface) == [iface_name]
+    assert sorted(profile.verifications_by_implementation) == sorted(
+        [qualified_name(C), qualified_name(D)]
+    )
+    assert profile.counts == {
+        "signature_parsed": 4,
+        "compatible": 2,
+        "verification_cache_hit": 1,
+    }
+
+    report = profile.report().splitlines()
+    assert report[0] == "Interface definitions (1 total, {:.3f}ms):".format(
+        profile.interfaces[iface_name] * 1000
+    )
+    assert report[1].endswith(iface_name)
+    assert report[-4:] == [
+        "Counts:",
+        "           2  compatible",
+        "           4  signature_parsed",
+        "           1  verification_cache_hit",
+    ]
+
+    data = json.loads(profile.to_json())
+    assert data["interfaces"] == {iface_name: profile.interfaces[iface_name]}
+    assert [v["implementation"] for v in data["verifications"]] == sorted(
+        [qualified_name(C), qualified_name(D)]
+    )
+    assert data["counts"]["compatible"] == 2
+
+    assert len(profile.report(limit=1).splitlines()) < len(report)
+
+
+def test_listeners():
+    events = []
+
+    def listener(event, subject, value):
+        events.append((event, subject))
+
+    add_listener(listener)
+    try:
+
+        class I(Interface):  # pragma: nocover
+            def method(self):
+                pass
+
+    finally:
+        remove_listener(listener)
+
+    class J(Interface):
+        pass
+
+    assert events == [
+        ("signature_parsed", None),
+        ("check_defaults", I),
+        ("define_interface", I),
+    ]
+
+
+def test_report_sorts_slowest_first():
+    class I(Interface):
+        pass
+
+    class J(Interface):
+        pass
+
+    class Impl(object):
+        pass
+
+    profile = Profile()
+    profile("verify", (I, Impl), 0.001)
+    profile("verify", (J, Impl), 0.003)
+    profile("verify", (I, Impl), 0.001)
+
+    report = profile.report()
+    expected = "\n".join(
+        [
+            "Verification time by interface (2 total, 5.000ms):",
+            "       3.000ms  {}".format(qualified_name(J)),
+            "       2.000ms  {}".format(qualified_name(I)),
+            "",
+            "Verification time by implementation (1 total, 5.000ms):",
+            "       5.000ms  {}".format(qualified_name(Impl)),
+        ]
+    )
+    assert expected in report
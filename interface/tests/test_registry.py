@@ -0,0 +1,78 @@
+import gc
+
+from ..interface import implements, Interface
+from ..registry import registry, Registry
+
+
+def test_registry():
+    class Base(Interface):  # pragma: nocover
+        def shared(self):
+            pass
+
+    class Derived(Base):  # pragma: nocover
+        def derived(self):
+            pass
+
+    class Other(Interface):  # pragma: nocover
+        def shared(self):
+            pass
+
+    class BaseImpl(implements(Base)):  # pragma: nocover
+        def shared(self):
+            pass
+
+    class DerivedImpl(implements(Derived, Other)):  # pragma: nocover
+        def shared(self):
+            pass
+
+        def derived(self):
+            pass
+
+    class DerivedImplChild(DerivedImpl):
+        pass
+
+    assert {Base, Derived, Other} <= registry.interfaces_requiring("shared")
+    assert {Derived} <= registry.interfaces_requiring("derived")
+    assert registry.interfaces_requiring("not_a_member_name") == frozenset()
+
+    assert registry.implementations_of(Base) == {
+        BaseImpl,
+        DerivedImpl,
+        DerivedImplChild,
+    }
+    assert registry.implementations_of(Derived) == {DerivedImpl, DerivedImplChild}
+    assert registry.implementations_of(Other) == {DerivedImpl, DerivedImplChild}
+
+    assert registry.interfaces_of(BaseImpl) == (Base,)
+    assert set(registry.interfaces_of(DerivedImpl)) == {Base, Derived, Other}
+    assert registry.interfaces_of(DerivedImplChild) == registry.interfaces_of(
+        DerivedImpl
+    )
+    assert registry.interfaces_of(object) == ()
+    assert registry.interfaces_of(object()) == ()
+
+
+def test_registry_holds_weak_references():
+    registry = Registry()
+
+    class I(Interface):  # pragma: nocover
+        def method(self):
+            pass
+
+    class Impl(object):
+        pass
+
+    registry.add_interface(I)
+    registry.add_implementation(Impl, (I,))
+    assert registry.version == 1
+    assert registry.implementations_of(I) == {Impl}
+
+    del Impl
+    gc.collect()
+    assert registry.implementations_of(I) == frozenset()
+    assert registry.interfaces_requiring("method") == {I}
+
+    del I
+    gc.collect()
+    assert registry.interfaces_requiring("method") == frozenset()
+    assert registry.implementations_of(Interface) == frozenset()
@@ -0,0 +1,368 @@
+import importlib
+import json
+import os
+import sys
+from textwrap import dedent
+
+import pytest
+
+from ..compat import Parameter, PY3
+from ..interface import Interface
+from ..profiling import record, SIGNATURE_PARSED
+from ..serialization import (
+    dump_annotation,
+    load_annotation,
+    load_summary,
+    signature_tables,
+    summarize,
+    Unserializable,
+)
+from ..typecheck import compatible
+from ..typed_signature import signature_cache, TypedSignature
+
+py3_only = pytest.mark.skipif(not PY3, reason="Python 3 Only")
+
+
+def test_annotation_round_trip():
+    for annotation in (Parameter.empty, None, "SomeType", int, TypedSignature):
+        data = dump_annotation(annotation)
+        assert json.loads(json.dumps(data)) == data
+        assert load_annotation(data) == annotation
+
+    def local():  # pragma: nocover
+        pass
+
+    with pytest.raises(Unserializable):
+        dump_annotation(local)
+
+    with pytest.raises(Unserializable):
+        dump_annotation(object())
+
+    with pytest.raises(Unserializable):
+        load_annotation(["ref", "interface.tests", "NoSuchName"])
+
+
+def test_summary_round_trip():
+    class I(Interface):  # pragma: nocover
+        def method(self, a, b=1, *args, **kwargs):
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+        @classmethod
+        def cm(cls, x):
+            pass
+
+    for name, iface_sig in I._signatures.items():
+        member = I.__dict__[name]
+        summary = json.loads(json.dumps(summarize(iface_sig)))
+        loaded = load_summary(member, summary)
+
+        assert loaded.type is iface_sig.type
+        assert loaded.plan == iface_sig.plan
+        assert compatible(loaded, iface_sig) and compatible(iface_sig, loaded)
+        assert str(loaded) == str(iface_sig)
+
+    # Summaries for the wrong kind of member are rejected.
+    with pytest.raises(Unserializable):
+        load_summary(I.__dict__["method"], summarize(I._signatures["prop"]))
+
+    # So are malformed summaries.
+    summary = summarize(I._signatures["method"])
+    for bad in (summary[:2], summary[:1] + [[["a", 99, False, None]]] + summary[2:]):
+        with pytest.raises(Unserializable):
+            load_summary(I.__dict__["method"], bad)
+
+
+MODULE_SOURCE = dedent(
+    """
+    from interface import Interface, default
+
+
+    class Cached(Interface):
+        def method(self, a: int, b: "Forward" = None, *, c) -> int:
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+        @default
+        def defaulted(self, x):
+            return self.method(x, c=x)
+
+
+    class Child(Cached):
+        def child(self, a, b):
+            pass
+    """
+)
+
+
+@pytest.fixture
+def cache_module(tmpdir, monkeypatch):
+    source_dir = tmpdir.mkdir("src")
+    cache_dir = tmpdir.join("cache")
+    source_dir.join("_cached_interfaces.py").write(MODULE_SOURCE)
+
+    monkeypatch.syspath_prepend(str(source_dir))
+    monkeypatch.setenv("INTERFACE_SIGNATURE_CACHE_DIR", str(cache_dir))
+
+    def load():
+        sys.modules.pop("_cached_interfaces", None)
+        signature_cache.clear()
+        signature_tables.clear()
+        return importlib.import_module("_cached_interfaces")
+
+    yield source_dir, cache_dir, load
+
+    sys.modules.pop("_cached_interfaces", None)
+    signature_tables.clear()
+
+
+@py3_only
+def test_signature_table_cache(cache_module):
+    source_dir, cache_dir, load = cache_module
+
+    with record() as profile:
+        cold = load()
+    assert profile.counts[SIGNATURE_PARSED] > 0
+
+    files = os.listdir(str(cache_dir))
+    assert len(files) == 1 and files[0].startswith("_cached_interfaces-")
+    original_file = files[0]
+    with open(os.path.join(str(cache_dir), files[0])) as f:
+        document = json.load(f)
+    assert set(document["interfaces"]) == {"Cached", "Child"}
+    assert set(document["interfaces"]["Cached"]) == {"method", "prop", "defaulted"}
+
+    with record() as profile:
+        warm = load()
+    # The default's implementation is still inspected to check which
+    # attributes it uses, but interface members aren't.
+    assert profile.counts[SIGNATURE_PARSED] == 1
+
+    pairs = [(cold.Cached, warm.Cached), (cold.Child, warm.Child)]
+    for cold_iface, warm_iface in pairs:
+        assert set(cold_iface._signatures) == set(warm_iface._signatures)
+        for name, sig in cold_iface._signatures.items():
+            assert warm_iface._signatures[name].plan == sig.plan
+            assert str(warm_iface._signatures[name]) == str(sig)
+
+    # Changing the module's source invalidates its table.
+    source_dir.join("_cached_interfaces.py").write(
+        MODULE_SOURCE.replace("def child(self, a, b)", "def child(self, a)")
+    )
+
+    changed = load()
+    assert list(changed.Child._signatures["child"].plan.positional_names) == [
+        "self",
+        "a",
+    ]
+    files = os.listdir(str(cache_dir))
+    assert len(files) == 1 and files[0] != original_file
+
+
+def test_signature_table_disabled(monkeypatch):
+    monkeypatch.delenv("INTERFACE_SIGNATURE_CACHE_DIR", raising=False)
+    assert signature_tables.open({"__module__": __name__, "__qualname__": "I"}) is None
+
+
+def table_path(cache_dir):
+    (name,) = os.listdir(str(cache_dir))
+    return os.path.join(str(cache_dir), name)
+
+
+@py3_only
+def test_signature_table_reload(cache_module, monkeypatch):
+    source_dir, cache_dir, load = cache_module
+    # Reloading a module whose size and modification time haven't changed would
+    # otherwise load stale bytecode.
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    source = source_dir.join("_cached_interfaces.py")
+
+    module = load()
+    assert list(module.Child._signatures["child"].plan.positional_names) == [
+        "self",
+        "a",
+        "b",
+    ]
+
+    # Edit the module in place, and reload it without clearing any caches.
+    source.write(MODULE_SOURCE.replace("def child(self, a, b)", "def child(self, a)"))
+    module = importlib.reload(module)
+    assert list(module.Child._signatures["child"].plan.positional_names) == [
+        "self",
+        "a",
+    ]
+
+    # Edits that keep the size and modification time of the source are caught
+    # by checking saved entries against their functions.
+    stat = os.stat(str(source))
+    source.write(MODULE_SOURCE.replace("def child(self, a, b)", "def child(self, b)"))
+    os.utime(str(source), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(str(source)).st_size == stat.st_size
+    module = importlib.reload(module)
+    assert list(module.Child._signatures["child"].plan.positional_names) == [
+        "self",
+        "b",
+    ]
+
+
+@py3_only
+def test_signature_table_corrupt_entries(cache_module):
+    source_dir, cache_dir, load = cache_module
+    cold = load()
+
+    path = table_path(cache_dir)
+    with open(path) as f:
+        document = json.load(f)
+    entries = document["interfaces"]["Cached"]
+    entries["method"] = 5
+    entries["prop"][1][0] = "builtins.staticmethod"
+    entries["defaulted"][0] = 0
+    del document["interfaces"]["Child"]["child"][1][1][-1]
+    with open(path, "w") as f:
+        json.dump(document, f)
+
+    # Bad entries are recomputed, and the table is repaired. The default's
+    # implementation is inspected anyway, so it's only parsed once.
+    with record() as profile:
+        warm = load()
+    assert profile.counts[SIGNATURE_PARSED] == 4
+    for name, sig in cold.Child._signatures.items():
+        assert warm.Child._signatures[name].plan == sig.plan
+    with open(path) as f:
+        assert json.load(f)["interfaces"]["Cached"]["method"] != 5
+
+
+@py3_only
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "{not json",
+        json.dumps([]),
+        json.dumps({"format_version": -1, "module": "_cached_interfaces"}),
+        json.dumps({"format_version": 1, "module": "other", "interfaces": {}}),
+        json.dumps({"format_version": 1, "module": "_cached_interfaces"}),
+    ],
+)
+def test_signature_table_bad_documents(cache_module, contents):
+    source_dir, cache_dir, load = cache_module
+    cold = load()
+
+    path = table_path(cache_dir)
+    with open(path, "w") as f:
+        f.write(contents)
+
+    # Unusable documents are ignored, and replaced.
+    warm = load()
+    for name, sig in cold.Cached._signatures.items():
+        assert warm.Cached._signatures[name].plan == sig.plan
+    with open(path) as f:
+        assert set(json.load(f)["interfaces"]) == {"Cached", "Child"}
+
+
+INELIGIBLE_SOURCE = dedent(
+    """
+    import functools
+
+    from interface import Interface
+
+    SENTINEL = object()
+
+
+    def decorate(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            return f(*args, **kwargs)
+
+        return wrapper
+
+
+    def helper(self, a):
+        pass
+
+
+    class Ineligible(Interface):
+        builtin = staticmethod(len)
+        borrowed = helper
+
+        @decorate
+        def wrapped(self, a):
+            pass
+
+        def opaque(self, a: SENTINEL):
+            pass
+
+        def varargs(self, a, *args, b=1, c, **kwargs):
+            pass
+    """
+)
+
+
+@py3_only
+def test_signature_table_ineligible_members(cache_module):
+    source_dir, cache_dir, load = cache_module
+    source_dir.join("_cached_interfaces.py").write(INELIGIBLE_SOURCE)
+
+    with record() as profile:
+        load()
+    assert profile.counts[SIGNATURE_PARSED] == 5
+
+    with open(table_path(cache_dir)) as f:
+        entries = json.load(f)["interfaces"]["Ineligible"]
+    assert set(entries) == {"varargs"}
+
+    # Only the eligible member is loaded from the table.
+    with record() as profile:
+        warm = load()
+    assert profile.counts[SIGNATURE_PARSED] == 4
+    assert str(warm.Ineligible._signatures["varargs"]) == (
+        "(self, a, *args, b=1, c, **kwargs)"
+    )
+
+
+@py3_only
+def test_signature_table_unlocatable_modules(tmpdir, monkeypatch):
+    monkeypatch.setenv("INTERFACE_SIGNATURE_CACHE_DIR", str(tmpdir.join("cache")))
+    directory = tmpdir.mkdir("src")
+    directory.mkdir("package.py")
+
+    class FakeModule(object):
+        pass
+
+    missing = FakeModule()
+    missing.__file__ = str(directory.join("missing.py"))
+    unreadable = FakeModule()
+    unreadable.__file__ = str(directory.join("package.py"))
+    monkeypatch.setitem(sys.modules, "_missing_source", missing)
+    monkeypatch.setitem(sys.modules, "_unreadable_source", unreadable)
+
+    for clsdict in (
+        {"__qualname__": "I"},
+        {"__module__": __name__, "__qualname__": "f.<locals>.I"},
+        {"__module__": "_no_such_module", "__qualname__": "I"},
+        {"__module__": "_missing_source", "__qualname__": "I"},
+        {"__module__": "_unreadable_source", "__qualname__": "I"},
+    ):
+        assert signature_tables.open(clsdict) is None
+
+
+@py3_only
+def test_signature_table_write_failures(cache_module):
+    source_dir, cache_dir, load = cache_module
+
+    # The cache directory can't be created.
+    cache_dir.write("not a directory")
+    load()
+    assert cache_dir.read() == "not a directory"
+
+    # Old tables that can't be removed are left alone.
+    cache_dir.remove()
+    stale = cache_dir.mkdir().mkdir("_cached_interfaces-" + "0" * 32 + ".json")
+    load()
+    assert stale.check(dir=True)
+    assert len(os.listdir(str(cache_dir))) == 2
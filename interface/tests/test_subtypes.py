@@ -0,0 +1,118 @@
+import sys
+
+import pytest
+
+from ..compat import PY3
+from ..subtypes import is_subtype, SubtypeOracle
+
+typing = pytest.importorskip("typing")
+
+py3_only = pytest.mark.skipif(not PY3, reason="Python 3 Only")
+
+
+class Base(object):
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class Incomparable(object):
+    def __eq__(self, other):
+        raise ValueError("Can't compare.")
+
+    __hash__ = object.__hash__
+
+
+@py3_only
+@pytest.mark.parametrize(
+    "sub, sup, expected",
+    [
+        (int, int, True),
+        (bool, int, True),
+        (int, bool, False),
+        (int, object, True),
+        (int, typing.Any, True),
+        (typing.Any, int, True),
+        (None, type(None), True),
+        (None, typing.Optional[int], True),
+        (int, typing.Optional[int], True),
+        (typing.Optional[int], int, False),
+        (typing.Union[bool, int], int, True),
+        (typing.Union[int, str], typing.Union[str, int, None], True),
+        (typing.Union[int, str], typing.Union[int, bytes], False),
+        (typing.List[Derived], typing.List[Derived], True),
+        (typing.List[Derived], typing.List[Base], False),
+        (typing.List[Derived], typing.Sequence[Base], True),
+        (typing.List[Derived], list, True),
+        (typing.List[int], typing.List, True),
+        (list, typing.List[int], True),
+        (typing.Sequence[int], typing.List[int], False),
+        (typing.Tuple[bool, int], typing.Tuple[int, int], True),
+        (typing.Tuple[bool, int], typing.Tuple[int, ...], True),
+        (typing.Tuple[int, ...], typing.Tuple[int, int], False),
+        (typing.Tuple[bool, ...], typing.Tuple[int, ...], True),
+        (typing.Tuple[int], typing.Tuple[int, int], False),
+        (typing.Dict[str, bool], typing.Mapping[str, int], True),
+        (typing.Dict[str, bool], typing.Mapping[object, int], False),
+        (typing.Dict[str, bool], typing.Dict[str, int], False),
+        (typing.Callable[[Base], Derived], typing.Callable[[Derived], Base], True),
+        (typing.Callable[[Derived], Base], typing.Callable[[Base], Base], False),
+        (typing.Callable[[int], int], typing.Callable[..., object], True),
+        (typing.Callable[[int], int], typing.Callable[[int, int], int], False),
+        (typing.Callable[[int], str], typing.Callable[[int], int], False),
+        ("Base", "Base", True),
+        ("Derived", "Base", False),
+        (typing.TypeVar("T"), int, False),
+        (Incomparable(), int, False),
+    ],
+)
+def test_is_subtype(sub, sup, expected):
+    assert is_subtype(sub, sup) == expected
+    assert SubtypeOracle(maxsize=0).is_subtype(sub, sup) == expected
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y requires Python 3.10")
+def test_union_syntax():  # pragma: nocover
+    assert is_subtype(bool, int | str)
+    assert is_subtype(int | None, typing.Optional[int])
+    assert not is_subtype(int | str, int)
+
+
+@py3_only
+def test_oracle_memoizes_with_bounded_size():
+    oracle = SubtypeOracle(maxsize=2)
+    assert oracle.maxsize == 2
+
+    assert oracle.is_subtype(bool, int)
+    assert (oracle.hits, oracle.misses) == (0, 1)
+    assert oracle.is_subtype(bool, int)
+    assert (oracle.hits, oracle.misses) == (1, 1)
+
+    # Unions consult the cache for their members too.
+    assert oracle.is_subtype(bool, typing.Optional[int])
+    assert len(oracle._cache) == 2
+    assert (id(bool), id(int)) in oracle._cache
+
+    oracle.is_subtype(str, object)
+    assert len(oracle._cache) == 2
+    assert (id(bool), id(int)) not in oracle._cache
+
+    # Unhashable annotations are fine.
+    assert oracle.is_subtype([int], [int])
+    assert not oracle.is_subtype([int], int)
+    assert oracle.misses == 5
+
+    oracle.enabled = False
+    assert oracle.is_subtype(bool, int)
+    assert oracle.misses == 5
+    oracle.enabled = True
+
+    oracle.maxsize = 1
+    oracle.is_subtype(bytes, object)
+    assert len(oracle._cache) == 1
+
+    oracle.clear()
+    assert len(oracle._cache) == 0
+    assert (oracle.hits, oracle.misses) == (0, 0)
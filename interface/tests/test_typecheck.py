@@ -1,6 +1,6 @@
 from ..compat import PY3
 from ..typecheck import compatible
-from ..typed_signature import TypedSignature
+from ..typed_signature import SignatureCache, TypedSignature
 
 
 def test_compatible_when_equal():
@@ -106,5 +106,49 @@ def test_typed_signature_repr():
     assert repr(fizz) == expected
 
 
+def test_signature_cache():
+    cache = SignatureCache(maxsize=2)
+    cache.maxsize = 1
+    assert cache.maxsize == 1
+
+    def f(a, b):  # pragma: nocover
+        pass
+
+    assert cache.signature(f) is cache.signature(f)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    class NotWeakrefable(object):
+        __slots__ = ()
+
+        def __call__(self, a):  # pragma: nocover
+            pass
+
+    g, h = NotWeakrefable(), NotWeakrefable()
+    assert cache.signature(g) is cache.signature(g)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Only one non-weakrefable callable is remembered at a time.
+    cache.signature(h)
+    cache.signature(g)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    class Unhashable(object):
+        __hash__ = None
+
+        def __call__(self, a):  # pragma: nocover
+            pass
+
+    u = Unhashable()
+    assert cache.signature(u) == cache.signature(u)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+    cache.enabled = False
+    assert cache.signature(f) is not cache.signature(f)
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
 if PY3:  # pragma: nocover-py2
     from ._py3_typecheck_tests import *  # noqa
@@ -1,6 +1,6 @@
 from ..compat import unwrap, wraps
 from ..functional import merge
-from ..utils import is_a, unique
+from ..utils import is_a, LRUCache, unique
 
 
 def test_unique():
@@ -33,3 +33,18 @@ def test_merge():
 
     result = merge([{"a": 1}, {"b": 2}, {"a": 3, "c": 4}])
     assert result == {"a": 3, "b": 2, "c": 4}
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # Mark "a" as recently used.
+
+    cache["c"] = 3
+    assert len(cache) == 2
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+    cache.clear()
+    assert len(cache) == 0
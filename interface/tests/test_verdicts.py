@@ -0,0 +1,382 @@
+import importlib
+import sqlite3
+import sys
+from textwrap import dedent
+
+import pytest
+
+from .. import typecheck
+from ..compat import PY3
+from ..interface import (
+    default,
+    implements,
+    Interface,
+    InterfaceMeta,
+    InvalidImplementation,
+)
+from ..profiling import record
+from ..verdicts import (
+    _rules_digest,
+    PERSISTENT_VERDICT_HIT,
+    verdict_cache,
+    VerdictCache,
+)
+
+py3_only = pytest.mark.skipif(not PY3, reason="Python 3 Only")
+
+MODULE_SOURCE = dedent(
+    """
+    from interface import Interface, default, implements
+
+
+    class I(Interface):
+        def method(self, a, b: int):
+            pass
+
+        @default
+        def defaulted(self):
+            return self.method(1, 2)
+
+
+    class Impl(implements(I)):
+        def method(self, a, b: int):
+            return a + b
+    """
+)
+
+
+@pytest.fixture
+def verdicts(tmpdir, monkeypatch):
+    source = tmpdir.join("_verdict_module.py")
+    source.write(MODULE_SOURCE)
+    db = tmpdir.join("verdicts.sqlite")
+
+    monkeypatch.syspath_prepend(str(tmpdir))
+    monkeypatch.setenv("INTERFACE_VERDICT_CACHE", str(db))
+
+    calls = []
+    real_verify = InterfaceMeta._verify_uncached
+
+    def verify(self, type_):
+        calls.append(type_.__name__)
+        return real_verify(self, type_)
+
+    monkeypatch.setattr(InterfaceMeta, "_verify_uncached", verify)
+
+    def load(source_text=None):
+        if source_text is not None:
+            source.write(source_text)
+        sys.modules.pop("_verdict_module", None)
+        verdict_cache.close()
+        del calls[:]
+        return importlib.import_module("_verdict_module")
+
+    def rows():
+        verdict_cache.flush()
+        with sqlite3.connect(str(db)) as connection:
+            return connection.execute(
+                "SELECT interface, implementation, defaults FROM verdicts"
+            ).fetchall()
+
+    yield load, calls, rows
+
+    sys.modules.pop("_verdict_module", None)
+    verdict_cache.close()
+
+
+@py3_only
+def test_persistent_verdicts(verdicts):
+    load, calls, rows = verdicts
+
+    load()
+    assert calls == ["Impl"]
+    assert rows() == [
+        ("_verdict_module.I", "_verdict_module.Impl", '["defaulted"]'),
+    ]
+
+    warm = load()
+    assert calls == []
+    assert warm.Impl().defaulted() == 3
+
+    # Changing the implementation invalidates its verdict.
+    load(
+        MODULE_SOURCE.replace(
+            "b: int):\n        return", "b: int, c=3):\n        return"
+        )
+    )
+    assert calls == ["Impl"]
+    load(MODULE_SOURCE)
+    assert calls == ["Impl"]
+    load()
+    assert calls == []
+
+    # Changing the interface does too.
+    load(MODULE_SOURCE.replace("def defaulted(self):", "def defaulted(self, x=1):"))
+    assert calls == ["Impl"]
+
+    # Verdicts are evicted when verification fails.
+    with pytest.raises(InvalidImplementation):
+        load(MODULE_SOURCE.replace("b: int):\n        return", "b):\n        return"))
+    assert calls == ["Impl"]
+    assert rows() == []
+
+
+VARIANCE_SOURCE = dedent(
+    """
+    from abc import ABC
+
+    from interface import Interface, implements
+
+
+    class Base(object):
+        pass
+
+
+    class Derived(Base):
+        pass
+
+
+    class Abstract(ABC):
+        pass
+
+
+    class I(Interface):
+        def method(self, x: Derived) -> Base:
+            pass
+
+        def abstract(self, x: Abstract):
+            pass
+
+
+    class Impl(implements(I)):
+        def method(self, x: Base) -> Derived:
+            pass
+
+        def abstract(self, x: Abstract):
+            pass
+    """
+)
+
+
+@py3_only
+def test_persistent_verdicts_depend_on_class_hierarchies(verdicts):
+    load, calls, rows = verdicts
+
+    variance_source = VARIANCE_SOURCE.replace("x: Abstract", "x")
+    load(variance_source)
+    assert calls == ["Impl"]
+    load()
+    assert calls == []
+
+    # Changing how the annotations' classes inherit from one another
+    # invalidates the verdict.
+    with pytest.raises(InvalidImplementation):
+        load(variance_source.replace("Derived(Base)", "Derived(object)"))
+    assert calls == ["Impl"]
+
+    # Verdicts that depend on ABCs aren't saved, since registering classes with
+    # them changes their subclasses.
+    load(VARIANCE_SOURCE)
+    assert calls == ["Impl"]
+    assert rows() == []
+    load()
+    assert calls == ["Impl"]
+
+
+def test_verdict_cache_disabled(monkeypatch):
+    monkeypatch.delenv("INTERFACE_VERDICT_CACHE", raising=False)
+    verdict_cache.close()
+    assert not verdict_cache.active
+
+
+def named_pair(annotation=None, impl_name="NamedImpl"):
+    """
+    Make an interface and an implementation with names that can be cached.
+    """
+
+    class I(Interface):  # pragma: nocover
+        __qualname__ = "NamedInterface"
+
+        def method(self, a):
+            pass
+
+        if annotation is not None:
+            method.__annotations__ = {"a": annotation}
+
+        @default
+        def defaulted(self):
+            return 1
+
+    class Impl(implements(I)):  # pragma: nocover
+        __qualname__ = impl_name
+
+        def method(self, a):
+            return a
+
+        if annotation is not None:
+            method.__annotations__ = {"a": annotation}
+
+    members = tuple(
+        vars(Impl)["method"] if name == "method" else None for name in I._signatures
+    )
+    return I, Impl, members
+
+
+def saved_rows(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT * FROM verdicts").fetchall()
+    finally:
+        connection.close()
+
+
+def test_verdict_cache_api(tmpdir):
+    path = str(tmpdir.join("verdicts.sqlite"))
+    cache = VerdictCache(path)
+    I, Impl, members = named_pair()
+    defaults = {"defaulted": I._defaults["defaulted"].implementation}
+
+    assert cache.lookup(I, Impl, members) is None
+
+    # Verdicts are visible as soon as they're stored, but are only written to
+    # the database when they're flushed.
+    cache.store(I, Impl, members, defaults)
+    assert cache.lookup(I, Impl, members) == defaults
+    assert saved_rows(path) == []
+    cache.flush()
+    assert len(saved_rows(path)) == 1
+
+    other = VerdictCache(path)
+    with record() as profile:
+        assert other.lookup(I, Impl, members) == defaults
+    assert profile.counts[PERSISTENT_VERDICT_HIT] == 1
+
+    # Different members don't match.
+    assert other.lookup(I, Impl, (None,) * len(members)) is None
+
+    other.evict(I, Impl)
+    assert other.lookup(I, Impl, members) is None
+    other.close()
+    assert saved_rows(path) == []
+
+    # Verdicts that refer to defaults the interface doesn't have are ignored.
+    cache.store(I, Impl, members, {"no_such_default": None})
+    assert cache.lookup(I, Impl, members) is None
+    cache.close()
+
+
+def test_verdict_cache_ignores_unnamed_classes(tmpdir):
+    cache = VerdictCache(str(tmpdir.join("verdicts.sqlite")))
+
+    class I(Interface):  # pragma: nocover
+        def method(self, a):
+            pass
+
+    class Impl(implements(I)):  # pragma: nocover
+        def method(self, a):
+            return a
+
+    members = (vars(Impl)["method"],)
+    cache.store(I, Impl, members, {})
+    cache.evict(I, Impl)
+    assert cache.lookup(I, Impl, members) is None
+    assert cache._pending == {}
+    cache.close()
+
+
+def test_verdict_cache_unserializable(tmpdir):
+    cache = VerdictCache(str(tmpdir.join("verdicts.sqlite")))
+
+    # Interfaces with annotations that can't be encoded.
+    I, Impl, members = named_pair(annotation=object())
+    cache.store(I, Impl, members, {})
+    assert cache.lookup(I, Impl, members) is None
+
+    # Implementations whose members aren't plain functions.
+    I, Impl, members = named_pair()
+    members = (len,) + members[1:]
+    cache.store(I, Impl, members, {})
+    assert cache.lookup(I, Impl, members) is None
+    assert cache._pending == {}
+    cache.close()
+
+
+def test_verdict_cache_unwritable_directory(tmpdir):
+    cache = VerdictCache(str(tmpdir.join("missing", "verdicts.sqlite")))
+    I, Impl, members = named_pair()
+
+    assert not cache.active
+    cache.store(I, Impl, members, {})
+    cache.evict(I, Impl)
+    assert cache.lookup(I, Impl, members) is None
+    assert cache._pending == {}
+
+    # Closing the cache lets it try again.
+    cache.close()
+    tmpdir.mkdir("missing")
+    assert cache.active
+    cache.close()
+
+
+def test_verdict_cache_corrupt_database(tmpdir):
+    path = tmpdir.join("verdicts.sqlite")
+    path.write_binary(b"this is not a database" * 100)
+
+    cache = VerdictCache(str(path))
+    assert not cache.active
+    cache.close()
+
+
+def test_verdict_cache_schema_mismatch(tmpdir):
+    path = str(tmpdir.join("verdicts.sqlite"))
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE verdicts (interface TEXT, implementation TEXT)")
+    connection.commit()
+    connection.close()
+    I, Impl, members = named_pair()
+
+    # Failed reads disable the cache, and drop pending writes.
+    cache = VerdictCache(path)
+    cache.store(I, Impl, members, {})
+    _, Other, other_members = named_pair(impl_name="OtherImpl")
+    assert cache.lookup(I, Other, other_members) is None
+    assert not cache.active
+    cache.flush()
+    assert cache._pending == {}
+    cache.close()
+
+    # So do failed writes.
+    cache = VerdictCache(path)
+    cache.store(I, Impl, members, {})
+    cache.flush()
+    assert not cache.active
+    assert saved_rows(path) == []
+    cache.close()
+
+
+def test_verdict_cache_concurrent_writers(tmpdir):
+    path = str(tmpdir.join("verdicts.sqlite"))
+    first, second = VerdictCache(path), VerdictCache(path)
+    assert first.active and second.active
+
+    I, Impl, members = named_pair()
+    defaults = {"defaulted": I._defaults["defaulted"].implementation}
+    first.store(I, Impl, members, defaults)
+    second.store(I, Impl, members, defaults)
+    second.evict(I, Impl)
+    first.flush()
+    second.flush()
+    assert saved_rows(path) == []
+
+    second.store(I, Impl, members, defaults)
+    second.flush()
+    first.flush()
+    assert first.lookup(I, Impl, members) == defaults
+    first.close()
+    second.close()
+
+
+def test_rules_digest_unreadable_source(monkeypatch):
+    digest = _rules_digest()
+    monkeypatch.setattr(typecheck, "__file__", "/no/such/file.py")
+    assert _rules_digest() != digest
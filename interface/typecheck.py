@@ -1,10 +1,12 @@
 """
 Utilities for typed interfaces.
 """
-from itertools import starmap, takewhile
+from collections import namedtuple
+from itertools import takewhile
 
-from .compat import Parameter, zip_longest
-from .functional import complement, dzip, valfilter
+from .compat import Parameter
+from .profiling import COMPATIBLE, emit, listeners
+from .subtypes import is_subtype
 
 
 def compatible(impl_sig, iface_sig):
@@ -36,67 +38,162 @@ def compatible(impl_sig, iface_sig):
           a **superclass** of the type specified by the interface.
        b. The return type of an implementation may be annotated with a
           **subclass** of the type specified by the interface.
+
+       Sub- and superclass relationships are checked by
+       :func:`interface.subtypes.is_subtype`, which also understands
+       ``Optional``, ``Union``, ``Callable``, and parameterized generics.
+       Return types are only compared when both signatures have one.
     """
-    # Unwrap to get the underlying inspect.Signature objects.
-    impl_sig = impl_sig.signature
-    iface_sig = iface_sig.signature
-    return all(
+    if listeners:
+        emit(COMPATIBLE, None, 1)
+    return plans_compatible(impl_sig.plan, iface_sig.plan)
+
+
+class AcceptancePlan(
+    namedtuple(
+        "AcceptancePlan",
         [
-            positionals_compatible(
-                takewhile(is_positional, impl_sig.parameters.values()),
-                takewhile(is_positional, iface_sig.parameters.values()),
-            ),
-            keywords_compatible(
-                valfilter(complement(is_positional), impl_sig.parameters),
-                valfilter(complement(is_positional), iface_sig.parameters),
-            ),
-        ]
+            "positional_names",
+            "positional_kinds",
+            "positional_defaults",
+            "positional_annotations",
+            "keyword_names",
+            "keywords",
+            "return_annotation",
+        ],
     )
+):
+    """
+    Precompiled summary of the parts of a signature checked by ``compatible``.
 
+    Attributes
+    ----------
+    positional_names : tuple[str]
+        Names of the leading positional parameters.
+    positional_kinds : tuple[inspect._ParameterKind]
+        Kinds of the leading positional parameters.
+    positional_defaults : tuple[bool]
+        Whether each leading positional parameter has a default.
+    positional_annotations : tuple[object]
+        Annotations of the leading positional parameters.
+    keyword_names : frozenset[str]
+        Names of all the other parameters (keyword-only and variadic).
+    keywords : dict[str -> (inspect._ParameterKind, bool, object)]
+        Map from each name in ``keyword_names`` to its kind, default flag and
+        annotation.
+    return_annotation : object
+        The return annotation.
+    """
 
-_POSITIONALS = frozenset([Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD])
+    __slots__ = ()
 
 
-def is_positional(arg):
-    return arg.kind in _POSITIONALS
+def compile_signature(sig):
+    """
+    Compile an inspect.Signature into an :class:`AcceptancePlan`.
+    """
+    return compile_parameters(
+        (
+            (p.name, p.kind, has_default(p), p.annotation)
+            for p in sig.parameters.values()
+        ),
+        sig.return_annotation,
+    )
 
 
-def has_default(arg):
+def compile_parameters(params, return_annotation=Parameter.empty):
     """
-    Does ``arg`` provide a default?
+    Compile a sequence of parameter descriptions into an
+    :class:`AcceptancePlan`.
+
+    Parameters
+    ----------
+    params : iterable[(str, inspect._ParameterKind, bool, object)]
+        The name, kind, default flag, and annotation of each parameter, in the
+        order they appear in the signature.
+    return_annotation : object, optional
+        The return annotation of the signature.
     """
-    return arg.default is not Parameter.empty
+    params = list(params)
+    positionals = list(takewhile(lambda p: p[1] in _POSITIONALS, params))
+    keywords = params[len(positionals) :]
+    return AcceptancePlan(
+        positional_names=tuple(p[0] for p in positionals),
+        positional_kinds=tuple(p[1] for p in positionals),
+        positional_defaults=tuple(p[2] for p in positionals),
+        positional_annotations=tuple(p[3] for p in positionals),
+        keyword_names=frozenset(p[0] for p in keywords),
+        keywords={name: (kind, default, ann) for name, kind, default, ann in keywords},
+        return_annotation=return_annotation,
+    )
 
 
-def params_compatible(impl, iface):
+def plans_compatible(impl, iface):
+    """
+    Check whether the ``impl`` plan is compatible with the ``iface`` plan.
 
-    if impl is None:
+    This gives the same answers as comparing the underlying
+    ``inspect.Parameter`` objects pairwise (see ``_py3_typecheck_tests``).
+    """
+    n = len(iface.positional_names)
+    if (
+        impl.positional_names[:n] != iface.positional_names
+        or impl.positional_kinds[:n] != iface.positional_kinds
+        or impl.positional_defaults[:n] != iface.positional_defaults
+        or not all(impl.positional_defaults[n:])
+    ):
         return False
 
-    if iface is None:
-        return has_default(impl)
+    # Identical annotations are by far the most common case, so only consult
+    # the subtype oracle when they differ.
+    impl_annotations = impl.positional_annotations[:n]
+    if impl_annotations != iface.positional_annotations and not all(
+        map(_annotation_accepts, impl_annotations, iface.positional_annotations)
+    ):
+        return False
 
-    return (
-        impl.name == iface.name
-        and impl.kind == iface.kind
-        and has_default(impl) == has_default(iface)
-        and annotations_compatible(impl, iface)
+    impl_keywords = impl.keywords
+    iface_keywords = iface.keywords
+    for name in impl.keyword_names & iface.keyword_names:
+        impl_keyword = impl_keywords[name]
+        iface_keyword = iface_keywords[name]
+        if impl_keyword != iface_keyword and (
+            impl_keyword[:2] != iface_keyword[:2]
+            or not _annotation_accepts(impl_keyword[2], iface_keyword[2])
+        ):
+            return False
+
+    return return_annotations_compatible(
+        impl.return_annotation, iface.return_annotation
     )
 
 
-def positionals_compatible(impl_positionals, iface_positionals):
-    return all(
-        starmap(params_compatible, zip_longest(impl_positionals, iface_positionals))
-    )
+_POSITIONALS = frozenset([Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD])
 
 
-def keywords_compatible(impl_keywords, iface_keywords):
-    return all(starmap(params_compatible, dzip(impl_keywords, iface_keywords).values()))
+def has_default(arg):
+    """
+    Does ``arg`` provide a default?
+    """
+    return arg.default is not Parameter.empty
 
 
-def annotations_compatible(impl, iface):
+def _annotation_accepts(impl_annotation, iface_annotation):
+    # An annotation can't be added to or removed from an argument.
+    if impl_annotation is Parameter.empty or iface_annotation is Parameter.empty:
+        return impl_annotation is iface_annotation
+    return is_subtype(iface_annotation, impl_annotation)
+
+
+def return_annotations_compatible(impl_annotation, iface_annotation):
     """
-    Check whether the type annotations of an implementation are compatible with
-    the annotations of the interface it implements.
+    Check whether the return annotation of an implementation is compatible
+    with the return annotation of the interface it implements.
+
+    Returns are covariant: an implementation may return a subtype of the type
+    returned by its interface. Unannotated returns are compatible with
+    anything.
     """
-    return impl.annotation == iface.annotation
+    if impl_annotation is Parameter.empty or iface_annotation is Parameter.empty:
+        return True
+    return is_subtype(impl_annotation, iface_annotation)
@@ -5,9 +5,13 @@ This is useful for when we care about the distinction between different kinds
 of callables, e.g., between methods, classmethods, and staticmethods.
 """
 import types
+from weakref import WeakKeyDictionary
 
 from .compat import signature, unwrap
 from .default import default
+from .profiling import emit, listeners, SIGNATURE_CACHE_HIT, SIGNATURE_PARSED
+from .typecheck import compile_signature
+from .utils import LRUCache
 
 
 class TypedSignature(object):
@@ -21,16 +25,38 @@ class TypedSignature(object):
     """
 
     def __init__(self, obj):
-        self._type = type(obj)
-        if self._type is default:
-            self._type = type(obj.implementation)
-
-        self._signature = signature(extract_func(obj))
+        self._type = _member_type(obj)
+        self._func = extract_func(obj)
+        self._signature, self._plan = signature_cache.lookup(self._func)
+
+    @classmethod
+    def from_plan(cls, obj, plan):
+        """
+        Construct a TypedSignature for ``obj`` from a precompiled plan.
+
+        The underlying ``inspect.Signature`` is only computed if it's
+        requested, e.g. to format an error message.
+        """
+        self = cls.__new__(cls)
+        self._type = _member_type(obj)
+        self._func = extract_func(obj)
+        self._signature = None
+        self._plan = plan
+        return self
 
     @property
     def signature(self):
+        if self._signature is None:
+            self._signature = signature_cache.signature(self._func)
         return self._signature
 
+    @property
+    def plan(self):
+        """
+        The :class:`~interface.typecheck.AcceptancePlan` for our signature.
+        """
+        return self._plan
+
     @property
     def first_argument_name(self):
         try:
@@ -43,18 +69,116 @@ class TypedSignature(object):
         return self._type
 
     def __str__(self):
-        return str(self._signature)
+        return str(self.signature)
 
     def __repr__(self):
         return "<TypedSignature type={}, signature={}>".format(
             self._type.__name__,
-            self._signature,
+            self.signature,
         )
 
 
+class SignatureCache(object):
+    """
+    Process-wide cache of ``inspect.Signature`` objects, keyed on callables.
+
+    Each signature is stored along with its compiled
+    :class:`~interface.typecheck.AcceptancePlan`.
+
+    Callables that support weak references (e.g., plain functions) are
+    remembered for as long as they're alive. Other hashable callables are
+    remembered in a bounded LRU cache. Unhashable callables aren't cached.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of non-weakrefable callables to remember.
+
+    Notes
+    -----
+    Signatures are computed once per callable, so changes made to a function's
+    signature-related attributes (e.g. ``__defaults__`` or ``__signature__``)
+    after it's been inspected won't be observed. Set ``enabled`` to False to
+    opt out of caching.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._weak = WeakKeyDictionary()
+        self._strong = LRUCache(maxsize)
+
+    @property
+    def maxsize(self):
+        return self._strong.maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        self._strong.maxsize = value
+
+    def signature(self, func):
+        """Get the signature of ``func``, computing it at most once."""
+        return self.lookup(func)[0]
+
+    def lookup(self, func):
+        """
+        Get the signature of ``func`` and its compiled acceptance plan.
+
+        Returns
+        -------
+        signature, plan : inspect.Signature, interface.typecheck.AcceptancePlan
+        """
+        if not self.enabled:
+            return _compute(func)
+
+        for cache in (self._weak, self._strong):
+            try:
+                result = cache[func]
+            except KeyError:
+                break
+            except TypeError:
+                # Not weakrefable, or not hashable.
+                continue
+            else:
+                self.hits += 1
+                if listeners:
+                    emit(SIGNATURE_CACHE_HIT, None, 1)
+                return result
+        else:
+            return _compute(func)
+
+        self.misses += 1
+        result = cache[func] = _compute(func)
+        return result
+
+    def clear(self):
+        """Forget all cached signatures."""
+        self._weak.clear()
+        self._strong.clear()
+        self.hits = self.misses = 0
+
+
+def _compute(func):
+    if listeners:
+        emit(SIGNATURE_PARSED, None, 1)
+    sig = signature(func)
+    return sig, compile_signature(sig)
+
+
+signature_cache = SignatureCache()
+
+
 BUILTIN_FUNCTION_TYPES = (types.FunctionType, types.BuiltinFunctionType)
 
 
+def _member_type(obj):
+    type_ = type(obj)
+    if type_ is default:
+        return type(obj.implementation)
+    return type_
+
+
 def _inner_extract_func(obj):
     if isinstance(obj, BUILTIN_FUNCTION_TYPES):
         # Fast path, since this is the most likely case.
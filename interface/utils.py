@@ -1,6 +1,7 @@
 """
 Miscellaneous utilities.
 """
+from collections import OrderedDict
 
 
 def unique(g):
@@ -29,3 +30,40 @@ def is_a(t):
     False
     """
     return lambda v: isinstance(v, t)
+
+
+class LRUCache(object):
+    """
+    A mapping of bounded size that evicts its least-recently-used entries.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries to keep.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __getitem__(self, key):
+        # Re-insert the value to mark it as most-recently-used.
+        value = self._data.pop(key)
+        self._data[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        data = self._data
+        data.pop(key, None)
+        data[key] = value
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
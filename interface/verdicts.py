@@ -0,0 +1,382 @@
+"""
+Persistent cache of verification verdicts, shared across processes.
+
+Setting the ``INTERFACE_VERDICT_CACHE`` environment variable to a file path (or
+setting ``verdict_cache.path``) makes successful verifications get recorded in
+a sqlite database at that path. Later processes that define the same
+implementation of the same interface skip signature checking, and just
+re-inject the defaults that were used the first time.
+
+Each verdict is keyed on the qualified names of the interface and the
+implementation, and stores a digest of everything that verification depends
+on:
+
+- The type and acceptance plan of each of the interface's members.
+- The type of each member provided by the implementation, along with the
+  parts of its code object that determine its signature (argument counts and
+  names, flags, which arguments have defaults, and annotations).
+- The MROs of the classes used as annotations by either side, since
+  annotations are compared by subtyping.
+- The source of the modules that implement the compatibility rules, and the
+  version of Python.
+
+A verdict whose digest doesn't match is stale. It's ignored, and replaced or
+deleted once the pair has been re-verified. Implementations whose members
+aren't plain Python functions, or whose annotations can't be encoded by
+:func:`~interface.serialization.dump_annotation`, aren't cached. Neither are
+pairs that use ABCs or interfaces as annotations, since their subclasses
+aren't determined by their MROs.
+
+Verdicts are only looked up for implementations that miss the in-memory cache
+on each interface. New verdicts are written in a single transaction when the
+process exits, or when :meth:`VerdictCache.flush` is called.
+
+Errors opening or using the database are ignored, and disable the cache for
+the rest of the process.
+"""
+import atexit
+from hashlib import sha256
+import json
+import os
+import sys
+import types
+from weakref import WeakKeyDictionary
+
+from . import subtypes, typecheck
+from .profiling import emit, listeners, qualified_name
+from .serialization import dump_annotation, Unserializable
+from .typed_signature import _inner_extract_func
+
+try:
+    import sqlite3
+except ImportError:  # pragma: nocover
+    sqlite3 = None
+
+ENVIRONMENT_VARIABLE = "INTERFACE_VERDICT_CACHE"
+PERSISTENT_VERDICT_HIT = "persistent_verdict_hit"
+
+_VARARGS_FLAGS = 0x04 | 0x08  # CO_VARARGS | CO_VARKEYWORDS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    interface TEXT NOT NULL,
+    implementation TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    defaults TEXT NOT NULL,
+    PRIMARY KEY (interface, implementation)
+)
+"""
+
+
+def _rules_digest():
+    digest = sha256(sys.version.encode("utf-8"))
+    for module in (typecheck, subtypes):
+        try:
+            with open(module.__file__, "rb") as f:
+                digest.update(f.read())
+        except (IOError, OSError):
+            pass
+    return digest.hexdigest()
+
+
+def _annotation_key(annotation):
+    """
+    Encode an annotation for a digest.
+
+    Whether annotations are compatible depends on how their classes inherit
+    from one another, so classes are encoded along with their MROs.
+
+    Raises
+    ------
+    Unserializable
+        If ``annotation`` can't be encoded, or is a class whose subclasses
+        aren't determined by MROs (e.g. an ABC, or an interface).
+    """
+    encoded = dump_annotation(annotation)
+    if encoded is not None and encoded[0] == "ref" and isinstance(annotation, type):
+        if type(annotation).__subclasscheck__ is not type.__subclasscheck__:
+            raise Unserializable(annotation)
+        encoded = encoded + [[qualified_name(t) for t in annotation.__mro__]]
+    return encoded
+
+
+def _plan_key(plan):
+    return [
+        list(plan.positional_names),
+        [int(k) for k in plan.positional_kinds],
+        list(plan.positional_defaults),
+        [_annotation_key(a) for a in plan.positional_annotations],
+        sorted(
+            [name, int(kind), has_default, _annotation_key(annotation)]
+            for name, (kind, has_default, annotation) in plan.keywords.items()
+        ),
+        _annotation_key(plan.return_annotation),
+    ]
+
+
+def _member_key(member):
+    """
+    Get a JSON-serializable description of the signature of ``member``.
+
+    Raises
+    ------
+    Unserializable
+        If ``member`` isn't backed by a plain Python function, or has
+        annotations that can't be encoded.
+    """
+    if member is None:
+        return None
+
+    func = _inner_extract_func(member)
+    if (
+        not isinstance(func, types.FunctionType)
+        or hasattr(func, "__wrapped__")
+        or hasattr(func, "__signature__")
+    ):
+        raise Unserializable(member)
+
+    code = func.__code__
+    kwonly = getattr(code, "co_kwonlyargcount", 0)
+    flags = code.co_flags & _VARARGS_FLAGS
+    nargs = code.co_argcount + kwonly + bin(flags).count("1")
+    return [
+        qualified_name(type(member)),
+        code.co_argcount,
+        getattr(code, "co_posonlyargcount", 0),
+        kwonly,
+        flags,
+        list(code.co_varnames[:nargs]),
+        len(func.__defaults__ or ()),
+        sorted(getattr(func, "__kwdefaults__", None) or ()),
+        sorted(
+            [name, _annotation_key(annotation)]
+            for name, annotation in getattr(func, "__annotations__", {}).items()
+        ),
+    ]
+
+
+def _is_named(t):
+    return "<locals>" not in getattr(t, "__qualname__", "<locals>")
+
+
+class VerdictCache(object):
+    """
+    sqlite-backed cache of successful verifications.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path to the database. Default is to read the ``INTERFACE_VERDICT_CACHE``
+        environment variable when the cache is first used. If neither is set,
+        the cache is disabled.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._connection = None
+        self._connection_key = None
+        self._broken = False
+        self._rules = None
+        self._interface_keys = WeakKeyDictionary()
+        # (interface name, implementation name) -> row to write, or None to
+        # delete the saved verdict.
+        self._pending = {}
+        self._flush_at_exit = False
+
+    def _connect(self):
+        if self._broken or sqlite3 is None:
+            return None
+
+        path = self.path or os.environ.get(ENVIRONMENT_VARIABLE)
+        if not path:
+            return None
+
+        # Connections can't be shared with forked children.
+        key = (path, os.getpid())
+        if self._connection_key == key:
+            return self._connection
+
+        try:
+            connection = sqlite3.connect(path, timeout=1.0)
+            connection.execute(_SCHEMA)
+            connection.commit()
+        except sqlite3.Error:
+            self._broken = True
+            return None
+
+        self._connection = connection
+        self._connection_key = key
+        if not self._flush_at_exit:
+            atexit.register(self.flush)
+            self._flush_at_exit = True
+        return connection
+
+    @property
+    def active(self):
+        """Whether the cache is configured and usable."""
+        return self._connect() is not None
+
+    def _interface_key(self, iface):
+        """
+        Get the part of our digests that only depends on ``iface``.
+        """
+        try:
+            return self._interface_keys[iface]
+        except KeyError:
+            pass
+
+        if self._rules is None:
+            self._rules = _rules_digest()
+        try:
+            description = [
+                self._rules,
+                [
+                    [name, qualified_name(sig.type), _plan_key(sig.plan)]
+                    for name, sig in iface._signatures.items()
+                ],
+                sorted(iface._defaults),
+            ]
+        except Unserializable:
+            key = None
+        else:
+            encoded = json.dumps(description, sort_keys=True, separators=(",", ":"))
+            key = sha256(encoded.encode("utf-8")).hexdigest()
+        self._interface_keys[iface] = key
+        return key
+
+    def _digest(self, iface, members):
+        interface_key = self._interface_key(iface)
+        if interface_key is None:
+            return None
+        try:
+            description = [interface_key, [_member_key(m) for m in members]]
+        except Unserializable:
+            return None
+        encoded = json.dumps(description, sort_keys=True, separators=(",", ":"))
+        return sha256(encoded.encode("utf-8")).hexdigest()
+
+    def lookup(self, iface, impl, members):
+        """
+        Look up a saved verdict for ``impl`` implementing ``iface``.
+
+        Parameters
+        ----------
+        iface : InterfaceMeta
+        impl : type
+        members : tuple
+            The (unbound) objects ``impl`` provides for each of ``iface``'s
+            members, or None for members ``impl`` doesn't provide.
+
+        Returns
+        -------
+        defaults : dict[str -> callable] or None
+            The defaults ``impl`` needs from ``iface``, or None if there's no
+            valid verdict.
+        """
+        if not (_is_named(iface) and _is_named(impl)):
+            return None
+        connection = self._connect()
+        if connection is None:
+            return None
+
+        key = (qualified_name(iface), qualified_name(impl))
+        try:
+            row = self._pending[key]
+        except KeyError:
+            try:
+                row = connection.execute(
+                    "SELECT interface, implementation, digest, defaults "
+                    "FROM verdicts WHERE interface = ? AND implementation = ?",
+                    key,
+                ).fetchone()
+            except sqlite3.Error:
+                self._broken = True
+                return None
+        if row is None:
+            return None
+
+        _, _, digest, defaults = row
+        if digest != self._digest(iface, members):
+            return None
+        try:
+            result = {
+                name: iface._defaults[name].implementation
+                for name in json.loads(defaults)
+            }
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if listeners:
+            emit(PERSISTENT_VERDICT_HIT, None, 1)
+        return result
+
+    def store(self, iface, impl, members, defaults):
+        """
+        Record that ``impl`` implements ``iface`` using ``defaults``.
+
+        ``members`` is as described in :meth:`lookup`. The verdict is written
+        by the next call to :meth:`flush`.
+        """
+        if not (_is_named(iface) and _is_named(impl)):
+            return
+        if self._connect() is None:
+            return
+
+        digest = self._digest(iface, members)
+        if digest is None:
+            return
+
+        key = (qualified_name(iface), qualified_name(impl))
+        self._pending[key] = key + (digest, json.dumps(sorted(defaults)))
+
+    def evict(self, iface, impl):
+        """
+        Delete any saved verdict for ``impl`` implementing ``iface``.
+
+        The verdict is deleted by the next call to :meth:`flush`.
+        """
+        if not (_is_named(iface) and _is_named(impl)):
+            return
+        if self._connect() is None:
+            return
+
+        self._pending[qualified_name(iface), qualified_name(impl)] = None
+
+    def flush(self):
+        """
+        Write stored and evicted verdicts to the database, in one transaction.
+
+        This is called automatically when the process exits.
+        """
+        if not self._pending:
+            return
+        connection = self._connect()
+        pending, self._pending = self._pending, {}
+        if connection is None:
+            return
+
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+                    [row for row in pending.values() if row is not None],
+                )
+                connection.executemany(
+                    "DELETE FROM verdicts WHERE interface = ? AND implementation = ?",
+                    [key for key, row in pending.items() if row is None],
+                )
+        except sqlite3.Error:
+            self._broken = True
+
+    def close(self):
+        """
+        Write any pending verdicts, and close our connection to the database.
+        """
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = self._connection_key = None
+        self._broken = False
+
+
+verdict_cache = VerdictCache()
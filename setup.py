@@ -32,7 +32,7 @@ setup(
     description="Pythonic Interface definitions",
     author="Scott Sanderson",
     author_email="scott.b.sanderson90@gmail.com",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     long_description=long_description,
     license="Apache 2.0",
     classifiers=[